@@ -0,0 +1,4 @@
+"""
+Planning agents used by the MCP server controller.
+Species availability, tier classification, route planning and content writing.
+"""
@@ -3,12 +3,97 @@ Agent to match bird species to regions and seasons.
 Provides comprehensive availability data for birding planning.
 """
 
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
 import random
 
+# Month names and their bit positions in month bitmasks
+MONTH_NAMES = ("January", "February", "March", "April", "May", "June", "July",
+               "August", "September", "October", "November", "December")
+MONTH_TO_IDX = {month: idx for idx, month in enumerate(MONTH_NAMES)}
+
+def months_to_mask(months: Sequence[str]) -> int:
+    """
+    Pack month names into a 12-bit mask (bit i set for MONTH_NAMES[i]).
+    """
+    return sum(1 << MONTH_TO_IDX[month] for month in set(months))
+
+def month_bit(month: str) -> int:
+    """
+    Get the mask bit for a month name, or 0 for an unknown month.
+    """
+    idx = MONTH_TO_IDX.get(month)
+    return 0 if idx is None else 1 << idx
+
+@dataclass(frozen=True)
+class SpeciesRecord:
+    """
+    Immutable availability record for a single species.
+    Slotted so large databases don't carry a per-record __dict__.
+    """
+    __slots__ = ("best_months", "regions", "best_months_mask", "regions_set",
+                 "habitat_preferences", "peak_activity", "migration_pattern",
+                 "breeding_range", "wintering_range", "abundance_rating",
+                 "ease_of_finding")
+    
+    best_months: Tuple[str, ...]
+    regions: Tuple[str, ...]
+    best_months_mask: int  # 12-bit month mask, see months_to_mask
+    regions_set: FrozenSet[str]
+    habitat_preferences: Tuple[str, ...]
+    peak_activity: str
+    migration_pattern: str
+    breeding_range: Tuple[str, ...]
+    wintering_range: Tuple[str, ...]
+    abundance_rating: int  # 1-5 scale
+    ease_of_finding: str
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SpeciesRecord":
+        """
+        Build a record from a raw species dictionary.
+        """
+        return cls(
+            best_months=tuple(data["best_months"]),
+            regions=tuple(data["regions"]),
+            best_months_mask=months_to_mask(data["best_months"]),
+            regions_set=frozenset(data["regions"]),
+            habitat_preferences=tuple(data["habitat_preferences"]),
+            peak_activity=data["peak_activity"],
+            migration_pattern=data["migration_pattern"],
+            breeding_range=tuple(data["breeding_range"]),
+            wintering_range=tuple(data["wintering_range"]),
+            abundance_rating=data["abundance_rating"],
+            ease_of_finding=data["ease_of_finding"]
+        )
+    
+    def __reduce__(self):
+        """
+        Pickle by field values; the default slot-state restore would go
+        through the frozen __setattr__ and fail.
+        """
+        return (self.__class__, tuple(getattr(self, f.name) for f in fields(self)))
+    
+    def to_dict(self) -> Dict:
+        """
+        Convert the record to the plain availability dictionary returned by
+        the public API.
+        """
+        return {
+            "best_months": list(self.best_months),
+            "regions": list(self.regions),
+            "habitat_preferences": list(self.habitat_preferences),
+            "peak_activity": self.peak_activity,
+            "migration_pattern": self.migration_pattern,
+            "breeding_range": list(self.breeding_range),
+            "wintering_range": list(self.wintering_range),
+            "abundance_rating": self.abundance_rating,
+            "ease_of_finding": self.ease_of_finding
+        }
+
 # Mock eBird-style database with seasonal and regional data
-SPECIES_DATABASE = {
+_RAW_SPECIES_DATA = {
     "American Robin": {
         "best_months": ["March", "April", "May", "September", "October"],
         "regions": ["Northeast", "Midwest", "West Coast", "Southeast"],
@@ -99,10 +184,78 @@ SPECIES_DATABASE = {
     }
 }
 
-def get_species_availability(species_name: str) -> Dict:
+SPECIES_DATABASE: Dict[str, SpeciesRecord] = {
+    name: SpeciesRecord.from_dict(data) for name, data in _RAW_SPECIES_DATA.items()
+}
+
+# Columnar month/region index over SPECIES_DATABASE: each column is an int
+# bitmask with bit i set when SPECIES_NAMES[i] matches that month/region
+SPECIES_NAMES = tuple(SPECIES_DATABASE)
+REGION_NAMES = tuple(sorted({region for record in SPECIES_DATABASE.values() for region in record.regions}))
+REGION_IDX = {region: idx for idx, region in enumerate(REGION_NAMES)}
+
+MONTH_MASK = [0] * len(MONTH_NAMES)
+REGION_MASK = [0] * len(REGION_NAMES)
+for _bit, _record in enumerate(SPECIES_DATABASE.values()):
+    for _month in _record.best_months:
+        MONTH_MASK[MONTH_TO_IDX[_month]] |= 1 << _bit
+    for _region in _record.regions_set:
+        REGION_MASK[REGION_IDX[_region]] |= 1 << _bit
+MONTH_MASK = tuple(MONTH_MASK)
+REGION_MASK = tuple(REGION_MASK)
+
+# Convert activity time to specific hours
+TIME_MAPPINGS = {
+    "dawn": "5:00 AM - 7:00 AM",
+    "morning": "6:00 AM - 10:00 AM",
+    "afternoon": "10:00 AM - 4:00 PM",
+    "dusk": "5:00 PM - 7:00 PM",
+    "night": "8:00 PM - 11:00 PM"
+}
+
+# Seasonal patterns, regions and habitats used to generate mock species data
+SEASONAL_PATTERNS = (
+    ("March", "April", "May", "June", "July", "August", "September"),  # Spring/Summer
+    ("January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December"),  # Year-round
+    ("September", "October", "November", "December", "January", "February"),  # Fall/Winter
+    ("April", "May", "June", "July", "August")  # Summer only
+)
+
+MOCK_REGIONS = ("Northeast", "Midwest", "Southeast", "West Coast", "Southwest")
+MOCK_HABITATS = ("forests", "meadows", "wetlands", "backyards", "parks", "coastal")
+MOCK_ACTIVITIES = ("dawn", "morning", "afternoon", "dusk", "night")
+MOCK_MIGRATIONS = ("resident", "short_distance", "long_distance", "partial_migrator")
+MOCK_EASE_LEVELS = ("very_easy", "easy", "moderate", "difficult", "very_difficult")
+
+# Module-level generator, independent of the shared random state;
+# re-seed it (_RNG.seed(...)) for deterministic output in tests
+_RNG = random.Random()
+
+# Mock hotspot database
+HOTSPOT_DATABASE = {
+    "Northeast": ("Central Park, NY", "Acadia National Park, ME", "Cape May, NJ"),
+    "Midwest": ("Point Pelee, ON", "Horicon Marsh, WI", "Crane Trust, NE"),
+    "Southeast": ("Everglades NP, FL", "Great Smoky Mountains, TN", "Okefenokee Swamp, GA"),
+    "West Coast": ("Point Reyes, CA", "Malheur NWR, OR", "Skagit Valley, WA"),
+    "Southwest": ("Bosque del Apache, NM", "Big Bend NP, TX", "Saguaro NP, AZ")
+}
+DEFAULT_HOTSPOTS = ("Local parks and natural areas",)
+
+# Recommendation text indexed by (is_good_time << 1) | is_good_region
+_RECOMMENDATION_TEMPLATES = (
+    "Challenging combination. {species} is not typically found in {region} during {month}. Consider alternative species or locations.",
+    "Good location but poor timing. {species} is found in {region} but rarely seen in {month}. Consider different months.",
+    "Good timing but challenging location. {species} is active in {month} but less common in {region}. Consider nearby regions.",
+    "Excellent timing! {species} is commonly found in {region} during {month}. Plan your trip with confidence."
+)
+
+@lru_cache(maxsize=1024)
+def _get_species_record(species_name: str) -> SpeciesRecord:
     """
-    Get comprehensive availability data for a species.
-    Returns best months, regions, and additional planning information.
+    Get the availability record for a species.
+
+    Results are cached per species name, so mock data for unknown
+    species stays stable for the whole session.
     """
     if species_name in SPECIES_DATABASE:
         return SPECIES_DATABASE[species_name]
@@ -110,53 +263,67 @@ def get_species_availability(species_name: str) -> Dict:
         # Generate mock data for unknown species
         return generate_mock_species_data(species_name)
 
-def generate_mock_species_data(species_name: str) -> Dict:
+def get_species_availability(species_name: str) -> Dict:
+    """
+    Get comprehensive availability data for a species.
+    Returns best months, regions, and additional planning information.
+    """
+    return _get_species_record(species_name).to_dict()
+
+def generate_mock_species_data(species_name: str) -> SpeciesRecord:
     """
     Generate realistic mock data for species not in the database.
     """
-    # Random seasonal patterns
-    seasonal_patterns = [
-        ["March", "April", "May", "June", "July", "August", "September"],  # Spring/Summer
-        ["January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December"],  # Year-round
-        ["September", "October", "November", "December", "January", "February"],  # Fall/Winter
-        ["April", "May", "June", "July", "August"]  # Summer only
-    ]
-    
-    regions = ["Northeast", "Midwest", "Southeast", "West Coast", "Southwest"]
-    habitats = ["forests", "meadows", "wetlands", "backyards", "parks", "coastal"]
+    rng = _RNG
+    best_months = rng.choice(SEASONAL_PATTERNS)
+    species_regions = rng.sample(MOCK_REGIONS, rng.randint(1, 3))
     
-    return {
-        "best_months": random.choice(seasonal_patterns),
-        "regions": random.sample(regions, random.randint(1, 3)),
-        "habitat_preferences": random.sample(habitats, random.randint(1, 3)),
-        "peak_activity": random.choice(["dawn", "morning", "afternoon", "dusk", "night"]),
-        "migration_pattern": random.choice(["resident", "short_distance", "long_distance", "partial_migrator"]),
-        "breeding_range": ["Mock Range"],
-        "wintering_range": ["Mock Range"],
-        "abundance_rating": random.randint(1, 5),
-        "ease_of_finding": random.choice(["very_easy", "easy", "moderate", "difficult", "very_difficult"])
-    }
+    return SpeciesRecord(
+        best_months=best_months,
+        regions=tuple(species_regions),
+        best_months_mask=months_to_mask(best_months),
+        regions_set=frozenset(species_regions),
+        habitat_preferences=tuple(rng.sample(MOCK_HABITATS, rng.randint(1, 3))),
+        peak_activity=rng.choice(MOCK_ACTIVITIES),
+        migration_pattern=rng.choice(MOCK_MIGRATIONS),
+        breeding_range=("Mock Range",),
+        wintering_range=("Mock Range",),
+        abundance_rating=rng.randint(1, 5),
+        ease_of_finding=rng.choice(MOCK_EASE_LEVELS)
+    )
+
+def query_species(month_idx: int, region_idx: int) -> List[str]:
+    """
+    Get the database species seen in a month (MONTH_TO_IDX) and region (REGION_IDX).
+    """
+    mask = MONTH_MASK[month_idx] & REGION_MASK[region_idx]
+    return [name for bit, name in enumerate(SPECIES_NAMES) if mask >> bit & 1]
 
-def get_optimal_viewing_times(species_name: str, month: str) -> Dict:
+def score_species(month_idx: int, region_idx: int) -> List[int]:
+    """
+    Get confidence scores (0/50/100) for every species in SPECIES_NAMES at once.
+    Mirrors the scoring in get_species_planning_summary using the columnar masks.
+    """
+    month_mask = MONTH_MASK[month_idx]
+    region_mask = REGION_MASK[region_idx]
+    return [
+        50 * ((month_mask >> bit & 1) + (region_mask >> bit & 1))
+        for bit in range(len(SPECIES_NAMES))
+    ]
+
+def get_optimal_viewing_times(species_name: str, month: str,
+                              availability: Optional[SpeciesRecord] = None) -> Dict:
     """
     Get optimal viewing times for a species in a specific month.
+    Pass a pre-fetched ``availability`` to skip the species lookup.
     """
-    species_data = get_species_availability(species_name)
+    species_data = availability or _get_species_record(species_name)
     
-    if month in species_data["best_months"]:
-        peak_activity = species_data["peak_activity"]
-        
-        # Convert activity time to specific hours
-        time_mappings = {
-            "dawn": "5:00 AM - 7:00 AM",
-            "morning": "6:00 AM - 10:00 AM", 
-            "afternoon": "10:00 AM - 4:00 PM",
-            "dusk": "5:00 PM - 7:00 PM",
-            "night": "8:00 PM - 11:00 PM"
-        }
+    if species_data.best_months_mask & month_bit(month):
+        peak_activity = species_data.peak_activity
         
         return {
-            "optimal_hours": time_mappings.get(peak_activity, "6:00 AM - 10:00 AM"),
+            "optimal_hours": TIME_MAPPINGS.get(peak_activity, "6:00 AM - 10:00 AM"),
             "peak_activity": peak_activity,
             "recommendation": f"Best viewed during {peak_activity} hours in {month}"
         }
@@ -167,37 +334,30 @@ def get_optimal_viewing_times(species_name: str, month: str) -> Dict:
             "recommendation": f"{species_name} is not typically active in {month}"
         }
 
-def get_regional_hotspots(species_name: str, region: str) -> List[str]:
+def get_regional_hotspots(species_name: str, region: str,
+                          availability: Optional[SpeciesRecord] = None) -> Sequence[str]:
     """
     Get recommended hotspots for a species in a specific region.
+    Pass a pre-fetched ``availability`` to skip the species lookup.
     """
-    species_data = get_species_availability(species_name)
+    species_data = availability or _get_species_record(species_name)
     
-    if region not in species_data["regions"]:
+    if region not in species_data.regions_set:
         return [f"No specific hotspots known for {species_name} in {region}"]
     
-    # Mock hotspot database
-    hotspot_database = {
-        "Northeast": ["Central Park, NY", "Acadia National Park, ME", "Cape May, NJ"],
-        "Midwest": ["Point Pelee, ON", "Horicon Marsh, WI", "Crane Trust, NE"],
-        "Southeast": ["Everglades NP, FL", "Great Smoky Mountains, TN", "Okefenokee Swamp, GA"],
-        "West Coast": ["Point Reyes, CA", "Malheur NWR, OR", "Skagit Valley, WA"],
-        "Southwest": ["Bosque del Apache, NM", "Big Bend NP, TX", "Saguaro NP, AZ"]
-    }
-    
-    return hotspot_database.get(region, ["Local parks and natural areas"])
+    return HOTSPOT_DATABASE.get(region, DEFAULT_HOTSPOTS)
 
 def get_species_planning_summary(species_name: str, target_month: str, target_region: str) -> Dict:
     """
     Get a comprehensive planning summary for a species.
     """
-    availability = get_species_availability(species_name)
-    viewing_times = get_optimal_viewing_times(species_name, target_month)
-    hotspots = get_regional_hotspots(species_name, target_region)
+    availability = _get_species_record(species_name)
+    viewing_times = get_optimal_viewing_times(species_name, target_month, availability)
+    hotspots = get_regional_hotspots(species_name, target_region, availability)
     
     # Determine if this is a good time/place for the species
-    is_good_time = target_month in availability["best_months"]
-    is_good_region = target_region in availability["regions"]
+    is_good_time = bool(availability.best_months_mask & month_bit(target_month))
+    is_good_region = target_region in availability.regions_set
     
     confidence_score = 0
     if is_good_time:
@@ -209,9 +369,9 @@ def get_species_planning_summary(species_name: str, target_month: str, target_re
         "species": species_name,
         "target_month": target_month,
         "target_region": target_region,
-        "availability": availability,
+        "availability": availability.to_dict(),
         "viewing_times": viewing_times,
-        "hotspots": hotspots,
+        "hotspots": list(hotspots),
         "confidence_score": confidence_score,
         "recommendation": generate_recommendation(is_good_time, is_good_region, species_name, target_month, target_region)
     }
@@ -220,14 +380,8 @@ def generate_recommendation(is_good_time: bool, is_good_region: bool, species: s
     """
     Generate a human-readable recommendation.
     """
-    if is_good_time and is_good_region:
-        return f"Excellent timing! {species} is commonly found in {region} during {month}. Plan your trip with confidence."
-    elif is_good_time and not is_good_region:
-        return f"Good timing but challenging location. {species} is active in {month} but less common in {region}. Consider nearby regions."
-    elif not is_good_time and is_good_region:
-        return f"Good location but poor timing. {species} is found in {region} but rarely seen in {month}. Consider different months."
-    else:
-        return f"Challenging combination. {species} is not typically found in {region} during {month}. Consider alternative species or locations."
+    idx = (int(is_good_time) << 1) | int(is_good_region)
+    return _RECOMMENDATION_TEMPLATES[idx].format(species=species, month=month, region=region)
 
 # Example usage and testing
 if __name__ == "__main__":
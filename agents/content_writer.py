@@ -3,10 +3,14 @@ Generates narrative logbooks and social content from birding results.
 Creates engaging stories, trip plans, and social media content.
 """
 
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from string import Template
 import random
 
+# Module-level generator, independent of the shared random state;
+# re-seed it (_RNG.seed(...)) for deterministic output in tests
+_RNG = random.Random()
+
 # Story templates and narrative elements
 STORY_TEMPLATES = {
     "discovery": [
@@ -26,6 +30,28 @@ STORY_TEMPLATES = {
     ]
 }
 
+# Story templates pre-parsed once into string.Template objects
+STORY_TEMPLATES_COMPILED = {
+    section: tuple(Template(template.replace("{", "${")) for template in templates)
+    for section, templates in STORY_TEMPLATES.items()
+}
+
+# Story sections in the order they appear in a story card
+STORY_SECTIONS = ("discovery", "encounter", "reflection")
+
+# Social media caption templates
+CAPTION_TEMPLATES = tuple(Template(template) for template in (
+    "🎯 Mission accomplished! Spotted this ${color} ${species} at ${location}. Every ${encounter_type} is a reminder of nature's beauty. #${hashtag} #Birding #Nature",
+    
+    "🌅 Early morning magic at ${location}! This ${species} was the highlight of today's birding adventure. The ${call} filled the air with pure joy. #BirdingLife #${hashtag}",
+    
+    "📸 Patience pays off! After hours of searching, this ${species} finally revealed itself at ${location}. Tier ${tier} species - ${encounter_type} of a lifetime! #BirdPhotography #Wildlife",
+    
+    "🦅 Nature's masterpiece at ${location}! This ${species} embodies everything I love about birding - beauty, grace, and the thrill of discovery. #${hashtag} #BirdingAdventures",
+    
+    "✨ Sometimes the best moments are the quiet ones. This ${species} at ${location} reminded me why I wake up before dawn. Pure magic! #Birding #NaturePhotography #${hashtag}"
+))
+
 # Color and habitat descriptions
 SPECIES_DESCRIPTIONS = {
     "American Robin": {
@@ -72,47 +98,51 @@ SPECIES_DESCRIPTIONS = {
     }
 }
 
-def generate_story_card(species: str, location: str) -> str:
+DEFAULT_STORY_DESC = {
+    "color": "beautiful",
+    "perch_type": "nearby branch",
+    "behavior": "going about its daily routine",
+    "call": "distinctive song",
+    "personality": "wild and free"
+}
+
+def generate_story_card(species: str, location: str, rng: Optional[random.Random] = None) -> str:
     """
     Generate a natural-style birding story for a species encounter.
+    Templates are drawn from ``rng`` if given, otherwise from the module generator.
     """
-    # Get species description or create default
-    species_desc = SPECIES_DESCRIPTIONS.get(species, {
-        "color": "beautiful",
-        "perch_type": "nearby branch",
-        "behavior": "going about its daily routine",
-        "call": "distinctive song",
-        "personality": "wild and free"
-    })
-    
-    # Select story elements
-    discovery = random.choice(STORY_TEMPLATES["discovery"]).format(
-        location=location, 
-        species=species
-    )
+    rng = rng or _RNG
     
-    encounter = random.choice(STORY_TEMPLATES["encounter"]).format(
-        color=species_desc["color"],
-        species=species,
-        location=location,
-        perch_type=species_desc["perch_type"]
-    )
+    # Get species description or fall back to the default
+    species_desc = SPECIES_DESCRIPTIONS.get(species, DEFAULT_STORY_DESC)
     
-    reflection = random.choice(STORY_TEMPLATES["reflection"]).format(
-        species=species,
-        location=location
+    # Fill one template per story section from a single mapping
+    mapping = {
+        "species": species,
+        "location": location,
+        "color": species_desc["color"],
+        "perch_type": species_desc["perch_type"]
+    }
+    return "\n\n".join(
+        rng.choice(STORY_TEMPLATES_COMPILED[section]).safe_substitute(mapping)
+        for section in STORY_SECTIONS
     )
-    
-    # Combine into a complete story
-    story = f"{discovery}\n\n{encounter}\n\n{reflection}"
-    
-    return story
 
-def generate_trip_plan_markdown(route_data: Dict, species_data: List[Dict]) -> str:
+def generate_trip_plan_markdown(route_data: Dict, species_data: List[Dict],
+                                stream: bool = False) -> Union[str, Iterator[str]]:
     """
     Generate a comprehensive Markdown trip plan.
+    With stream=True, return an iterator over the document's chunks instead
+    of one joined string, so it can be written out as it is generated.
     """
-    markdown = f"""# Birding Trip Plan: {route_data['target_species'][0]} & Friends
+    chunks = _iter_trip_plan_markdown(route_data, species_data)
+    return chunks if stream else "".join(chunks)
+
+def _iter_trip_plan_markdown(route_data: Dict, species_data: List[Dict]) -> Iterator[str]:
+    """
+    Yield the Markdown trip plan chunk by chunk.
+    """
+    yield f"""# Birding Trip Plan: {route_data['target_species'][0]} & Friends
 
 ## Trip Overview
 - **Date Range**: {route_data['date_range']}
@@ -129,7 +159,7 @@ def generate_trip_plan_markdown(route_data: Dict, species_data: List[Dict]) -> s
 """
     
     for stop in route_data['route_stops']:
-        markdown += f"""### Stop {stop['stop_number']}: {stop['location']}
+        yield f"""### Stop {stop['stop_number']}: {stop['location']}
 
 **Travel Details:**
 - Distance from previous: {stop['distance_from_previous']:.1f} km
@@ -138,10 +168,9 @@ def generate_trip_plan_markdown(route_data: Dict, species_data: List[Dict]) -> s
 
 **Recommended Hotspots:**
 """
-        for hotspot in stop['hotspots']:
-            markdown += f"- **{hotspot['name']}** ({hotspot['species_count']} species)\n"
+        yield from (f"- **{hotspot['name']}** ({hotspot['species_count']} species)\n" for hotspot in stop['hotspots'])
         
-        markdown += f"""
+        yield f"""
 **Viewing Schedule:**
 - Optimal time: {stop['viewing_schedule']['recommended_time']}
 - Activity: {stop['viewing_schedule']['activity_description']}
@@ -150,15 +179,14 @@ def generate_trip_plan_markdown(route_data: Dict, species_data: List[Dict]) -> s
 
 **Recommendations:**
 """
-        for rec in stop['recommendations']:
-            markdown += f"- {rec}\n"
+        yield from (f"- {rec}\n" for rec in stop['recommendations'])
         
-        markdown += "\n---\n\n"
+        yield "\n---\n\n"
     
     # Add species information
-    markdown += "## Target Species Information\n\n"
+    yield "## Target Species Information\n\n"
     for species_info in species_data:
-        markdown += f"""### {species_info['species']} - {species_info['tier']}
+        yield f"""### {species_info['species']} - {species_info['tier']}
 
 **Description:** {species_info['description']}
 
@@ -171,7 +199,7 @@ def generate_trip_plan_markdown(route_data: Dict, species_data: List[Dict]) -> s
 ---
 """
     
-    markdown += """
+    yield """
 ## Packing List
 - Binoculars (8x42 or 10x42 recommended)
 - Field guide or birding app
@@ -195,8 +223,6 @@ def generate_trip_plan_markdown(route_data: Dict, species_data: List[Dict]) -> s
 ---
 *Generated by BirdingPlanner - Your AI-powered birding companion*
 """
-    
-    return markdown
 
 def generate_social_caption(species: str, location: str, tier: str, encounter_type: str = "sighting") -> str:
     """
@@ -208,109 +234,147 @@ def generate_social_caption(species: str, location: str, tier: str, encounter_ty
         "call": "distinctive song"
     })
     
-    caption_templates = [
-        f"🎯 Mission accomplished! Spotted this {species_desc['color']} {species} at {location}. Every {encounter_type} is a reminder of nature's beauty. #{species.replace(' ', '')} #Birding #Nature",
-        
-        f"🌅 Early morning magic at {location}! This {species} was the highlight of today's birding adventure. The {species_desc['call']} filled the air with pure joy. #BirdingLife #{species.replace(' ', '')}",
-        
-        f"📸 Patience pays off! After hours of searching, this {species} finally revealed itself at {location}. Tier {tier} species - {encounter_type} of a lifetime! #BirdPhotography #Wildlife",
-        
-        f"🦅 Nature's masterpiece at {location}! This {species} embodies everything I love about birding - beauty, grace, and the thrill of discovery. #{species.replace(' ', '')} #BirdingAdventures",
-        
-        f"✨ Sometimes the best moments are the quiet ones. This {species} at {location} reminded me why I wake up before dawn. Pure magic! #Birding #NaturePhotography #{species.replace(' ', '')}"
-    ]
-    
-    return random.choice(caption_templates)
+    return _RNG.choice(CAPTION_TEMPLATES).substitute(
+        species=species,
+        location=location,
+        tier=tier,
+        encounter_type=encounter_type,
+        color=species_desc["color"],
+        call=species_desc["call"],
+        hashtag=species.replace(' ', '')
+    )
 
-def generate_observation_log(species: str, location: str, date: str, weather: str = "Clear") -> str:
+# Option pools for observation log fields
+OBSERVATION_TIMES = ('6:30 AM', '7:15 AM', '8:00 AM', '9:30 AM')
+OBSERVATION_SETTINGS = ('open area', 'forest edge', 'canopy', 'understory')
+CALL_FREQUENCIES = ('frequently', 'occasionally', 'continuously')
+OBSERVED_BEHAVIORS = ('foraging', 'singing', 'preening', 'flying between perches', 'feeding young')
+LIGHTING_CONDITIONS = ('excellent', 'good', 'fair', 'challenging')
+BINOCULARS = ('8x42', '10x42', '8x32')
+CAMERAS = ('iPhone', 'DSLR with 300mm lens', 'Point and shoot', 'None')
+FIELD_GUIDES = ('Sibley', 'Peterson', 'Merlin App', 'None needed')
+RETURN_ANSWERS = ('Yes', 'Definitely', 'Maybe', 'No - too crowded')
+
+DEFAULT_OBSERVATION_DESC = {
+    "behavior": "observed",
+    "call": "heard",
+    "personality": "wild"
+}
+
+def generate_observation_log(species: str, location: str, date: str, weather: str = "Clear",
+                             rng: Optional[random.Random] = None) -> str:
     """
     Generate a detailed observation log entry.
     """
-    species_desc = SPECIES_DESCRIPTIONS.get(species, {
-        "behavior": "observed",
-        "call": "heard",
-        "personality": "wild"
-    })
+    return generate_observation_logs_batch([(species, location, date, weather)], rng)[0]
+
+def generate_observation_logs_batch(records: List[Tuple[str, str, str, str]],
+                                    rng: Optional[random.Random] = None) -> List[str]:
+    """
+    Generate observation log entries for many (species, location, date, weather) records.
+    Each random field is drawn for the whole batch in a single call, from ``rng``
+    if given, otherwise from the module generator.
+    """
+    n = len(records)
+    if not n:
+        return []
     
-    log_entry = f"""## Observation Log - {date}
+    rng = rng or _RNG
+    times = rng.choices(OBSERVATION_TIMES, k=n)
+    durations = rng.choices(range(5, 46), k=n)
+    settings = rng.choices(OBSERVATION_SETTINGS, k=n)
+    frequencies = rng.choices(CALL_FREQUENCIES, k=n)
+    behaviors = rng.choices(OBSERVED_BEHAVIORS, k=n)
+    distances = rng.choices(range(10, 101), k=n)
+    lighting = rng.choices(LIGHTING_CONDITIONS, k=n)
+    binoculars = rng.choices(BINOCULARS, k=n)
+    cameras = rng.choices(CAMERAS, k=n)
+    guides = rng.choices(FIELD_GUIDES, k=n)
+    ratings = rng.choices(range(3, 6), k=n)
+    returns = rng.choices(RETURN_ANSWERS, k=n)
+    
+    logs = []
+    for i, (species, location, date, weather) in enumerate(records):
+        species_desc = SPECIES_DESCRIPTIONS.get(species, DEFAULT_OBSERVATION_DESC)
+        logs.append(f"""## Observation Log - {date}
 
 **Species:** {species}
 **Location:** {location}
 **Date:** {date}
 **Weather:** {weather}
-**Time:** {random.choice(['6:30 AM', '7:15 AM', '8:00 AM', '9:30 AM'])}
-**Duration:** {random.randint(5, 45)} minutes
+**Time:** {times[i]}
+**Duration:** {durations[i]} minutes
 
 **Observations:**
-- {species_desc['behavior']} in {random.choice(['open area', 'forest edge', 'canopy', 'understory'])}
-- {species_desc['call']} {random.choice(['frequently', 'occasionally', 'continuously'])}
-- Behavior: {random.choice(['foraging', 'singing', 'preening', 'flying between perches', 'feeding young'])}
-- Distance: {random.randint(10, 100)} meters
-- Lighting: {random.choice(['excellent', 'good', 'fair', 'challenging'])}
+- {species_desc['behavior']} in {settings[i]}
+- {species_desc['call']} {frequencies[i]}
+- Behavior: {behaviors[i]}
+- Distance: {distances[i]} meters
+- Lighting: {lighting[i]}
 
 **Notes:**
-{generate_story_card(species, location)}
+{generate_story_card(species, location, rng)}
 
 **Equipment Used:**
-- Binoculars: {random.choice(['8x42', '10x42', '8x32'])}
-- Camera: {random.choice(['iPhone', 'DSLR with 300mm lens', 'Point and shoot', 'None'])}
-- Field Guide: {random.choice(['Sibley', 'Peterson', 'Merlin App', 'None needed'])}
+- Binoculars: {binoculars[i]}
+- Camera: {cameras[i]}
+- Field Guide: {guides[i]}
 
-**Rating:** {random.randint(3, 5)}/5 stars
-**Would return:** {random.choice(['Yes', 'Definitely', 'Maybe', 'No - too crowded'])}
-"""
+**Rating:** {ratings[i]}/5 stars
+**Would return:** {returns[i]}
+""")
     
-    return log_entry
+    return logs
 
 def generate_birding_journal_entry(trip_data: Dict, highlights: List[str]) -> str:
     """
     Generate a comprehensive journal entry for a birding trip.
     """
-    journal_entry = f"""# Birding Journal Entry - {trip_data['date_range']}
+    parts = [f"""# Birding Journal Entry - {trip_data['date_range']}
 
 ## Trip Summary
 Today's adventure took me from {trip_data['base_location']} to {len(trip_data['route_stops'])} different locations in search of {len(trip_data['target_species'])} target species. The weather was cooperative, and the birds were active.
 
 ## Target Species Status
-"""
+"""]
     
     for species in trip_data['target_species']:
-        status = random.choice(['✅ Seen', '❌ Missed', '🔄 Partial view', '🎵 Heard only'])
-        journal_entry += f"- **{species}**: {status}\n"
+        status = _RNG.choice(['✅ Seen', '❌ Missed', '🔄 Partial view', '🎵 Heard only'])
+        parts.append(f"- **{species}**: {status}\n")
     
-    journal_entry += f"""
+    parts.append("""
 ## Route Highlights
-"""
+""")
     
     for stop in trip_data['route_stops']:
-        journal_entry += f"""
+        parts.append(f"""
 ### {stop['location']}
-{random.choice(highlights)}
+{_RNG.choice(highlights)}
 - Best hotspot: {stop['hotspots'][0]['name'] if stop['hotspots'] else 'Local area'}
 - Time spent: {stop['viewing_schedule']['estimated_duration']}
-- Weather conditions: {random.choice(['Perfect', 'Good', 'Challenging', 'Windy'])}
-"""
+- Weather conditions: {_RNG.choice(['Perfect', 'Good', 'Challenging', 'Windy'])}
+""")
     
-    journal_entry += f"""
+    parts.append(f"""
 ## Memorable Moments
-{random.choice(highlights)}
+{_RNG.choice(highlights)}
 
 ## Lessons Learned
-- {random.choice(['Patience is key', 'Early bird gets the worm', 'Always check the weather', 'Local knowledge is invaluable'])}
-- {random.choice(['Bring extra batteries', 'Pack light but be prepared', 'Listen more than look', 'Document everything'])}
-- {random.choice(['Join local birding groups', 'Use multiple field guides', 'Practice bird calls', 'Respect wildlife boundaries'])}
+- {_RNG.choice(['Patience is key', 'Early bird gets the worm', 'Always check the weather', 'Local knowledge is invaluable'])}
+- {_RNG.choice(['Bring extra batteries', 'Pack light but be prepared', 'Listen more than look', 'Document everything'])}
+- {_RNG.choice(['Join local birding groups', 'Use multiple field guides', 'Practice bird calls', 'Respect wildlife boundaries'])}
 
 ## Next Time
-- Return to {random.choice([stop['location'] for stop in trip_data['route_stops']])} for better light
-- Try different time of day for {random.choice(trip_data['target_species'])}
-- Bring {random.choice(['better camera', 'recording equipment', 'more patience', 'local guide'])}
-- Explore {random.choice(['nearby wetlands', 'forest trails', 'coastal areas', 'mountain habitats'])}
+- Return to {_RNG.choice([stop['location'] for stop in trip_data['route_stops']])} for better light
+- Try different time of day for {_RNG.choice(trip_data['target_species'])}
+- Bring {_RNG.choice(['better camera', 'recording equipment', 'more patience', 'local guide'])}
+- Explore {_RNG.choice(['nearby wetlands', 'forest trails', 'coastal areas', 'mountain habitats'])}
 
 ---
 *Birding is not just about the birds, but about the journey, the places, and the people we meet along the way.*
-"""
+""")
     
-    return journal_entry
+    return "".join(parts)
 
 # Example usage and testing
 if __name__ == "__main__":
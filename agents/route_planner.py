@@ -3,16 +3,25 @@ Plans optimal routes for birdwatching based on locations and time.
 Optimizes for species diversity, travel efficiency, and viewing conditions.
 """
 
-from typing import Dict, List, Tuple, Optional
-from datetime import datetime, timedelta
-import random
+from array import array
+from functools import lru_cache
+from itertools import accumulate, permutations
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+import copy
+import heapq
 import math
+import zlib
+
+try:
+    from statistics import fmean
+except ImportError:  # Python < 3.8
+    def fmean(data: Sequence[float]) -> float:
+        return sum(data) / len(data)
 
 # Mock location database with coordinates and birding hotspots
 LOCATION_DATABASE = {
     "New York": {
         "coordinates": (40.7128, -74.0060),
-        "region": "Northeast",
         "hotspots": [
             {"name": "Central Park", "coordinates": (40.7829, -73.9654), "species_count": 230},
             {"name": "Jamaica Bay Wildlife Refuge", "coordinates": (40.6157, -73.8257), "species_count": 325},
@@ -21,7 +30,6 @@ LOCATION_DATABASE = {
     },
     "Boston": {
         "coordinates": (42.3601, -71.0589),
-        "region": "Northeast", 
         "hotspots": [
             {"name": "Mount Auburn Cemetery", "coordinates": (42.3704, -71.1445), "species_count": 180},
             {"name": "Parker River NWR", "coordinates": (42.7483, -70.8167), "species_count": 300},
@@ -30,7 +38,6 @@ LOCATION_DATABASE = {
     },
     "Chicago": {
         "coordinates": (41.8781, -87.6298),
-        "region": "Midwest",
         "hotspots": [
             {"name": "Montrose Point", "coordinates": (41.9664, -87.6328), "species_count": 280},
             {"name": "Jackson Park", "coordinates": (41.7833, -87.5767), "species_count": 200},
@@ -39,7 +46,6 @@ LOCATION_DATABASE = {
     },
     "Miami": {
         "coordinates": (25.7617, -80.1918),
-        "region": "Southeast",
         "hotspots": [
             {"name": "Everglades National Park", "coordinates": (25.2867, -80.9000), "species_count": 350},
             {"name": "Bill Baggs Cape Florida", "coordinates": (25.6658, -80.1589), "species_count": 180},
@@ -48,7 +54,6 @@ LOCATION_DATABASE = {
     },
     "San Francisco": {
         "coordinates": (37.7749, -122.4194),
-        "region": "West Coast",
         "hotspots": [
             {"name": "Golden Gate Park", "coordinates": (37.7694, -122.4862), "species_count": 200},
             {"name": "Point Reyes", "coordinates": (38.0697, -122.8069), "species_count": 450},
@@ -79,21 +84,66 @@ SPECIES_LOCATION_MATRIX = {
     }
 }
 
+EARTH_RADIUS_KM = 6371
+
+# Column layout of LOCATION_DATABASE: names, index by name and coordinates in radians
+LOCATION_NAMES = tuple(LOCATION_DATABASE)
+LOCATION_IDX = {name: idx for idx, name in enumerate(LOCATION_NAMES)}
+LOCATION_COORDS_RAD = tuple(
+    (math.radians(LOCATION_DATABASE[name]["coordinates"][0]),
+     math.radians(LOCATION_DATABASE[name]["coordinates"][1]))
+    for name in LOCATION_NAMES
+)
+
+# Hotspot columns; the hotspots of LOCATION_NAMES[i] occupy
+# HOTSPOT_OFFSETS[i]:HOTSPOT_OFFSETS[i + 1]
+HOTSPOT_NAMES = tuple(
+    hotspot["name"] for name in LOCATION_NAMES for hotspot in LOCATION_DATABASE[name]["hotspots"]
+)
+HOTSPOT_COORDS = tuple(
+    hotspot["coordinates"] for name in LOCATION_NAMES for hotspot in LOCATION_DATABASE[name]["hotspots"]
+)
+# Species counts fit in 16 bits; kept in contiguous typed arrays
+HOTSPOT_SPECIES_COUNT = array("h", (
+    hotspot["species_count"] for name in LOCATION_NAMES for hotspot in LOCATION_DATABASE[name]["hotspots"]
+))
+# Scores normalized to 0-1 by species count
+HOTSPOT_SCORE = array("d", (count / 500 for count in HOTSPOT_SPECIES_COUNT))
+HOTSPOT_OFFSETS = (0,) + tuple(accumulate(len(LOCATION_DATABASE[name]["hotspots"]) for name in LOCATION_NAMES))
+
 def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Calculate distance between two coordinates using Haversine formula.
     Returns distance in kilometers.
     """
-    R = 6371  # Earth's radius in kilometers
-    
     lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    
-    a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-    c = 2 * math.asin(math.sqrt(a))
+    return _haversine_rad(lat1, lon1, lat2, lon2)
+
+def _haversine_rad(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Haversine distance in kilometers for coordinates already in radians.
+    """
+    a = math.sin((lat2 - lat1)/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1)/2)**2
+    return EARTH_RADIUS_KM * (2 * math.asin(math.sqrt(a)))
+
+def haversine_batch(lat1: float, lon1: float, coords: Sequence[Tuple[float, float]]) -> List[float]:
+    """
+    Calculate distances from one point to many points using Haversine formula.
+    All coordinates are (lat, lon) in radians; returns distances in kilometers.
+    """
+    sin, cos, asin, sqrt = math.sin, math.cos, math.asin, math.sqrt
+    cos_lat1 = cos(lat1)
     
-    return R * c
+    return [
+        EARTH_RADIUS_KM * (2 * asin(sqrt(sin((lat2 - lat1)/2)**2 + cos_lat1 * cos(lat2) * sin((lon2 - lon1)/2)**2)))
+        for lat2, lon2 in coords
+    ]
+
+# Pairwise distances between database locations, indexed by LOCATION_IDX
+DIST_KM = tuple(
+    tuple(haversine_batch(lat, lon, LOCATION_COORDS_RAD))
+    for lat, lon in LOCATION_COORDS_RAD
+)
 
 def get_species_compatibility_score(species: str, location: str) -> float:
     """
@@ -103,7 +153,50 @@ def get_species_compatibility_score(species: str, location: str) -> float:
         return SPECIES_LOCATION_MATRIX[species][location]
     else:
         # Default score for unknown combinations
-        return random.uniform(0.3, 0.7)
+        return _default_compatibility_score(species, location)
+
+def _default_compatibility_score(species: str, location: str) -> float:
+    """
+    Stable mock score in [0.3, 0.7] for an unknown species/location pair.
+    Uses crc32 rather than hash() so the value is the same across runs.
+    """
+    return 0.3 + 0.4 * zlib.crc32(f"{species}|{location}".encode("utf-8")) / 0xFFFFFFFF
+
+# Dense species x location compatibility table, rows indexed by SPECIES_IDX
+# and columns by LOCATION_IDX
+SPECIES_NAMES = tuple(SPECIES_LOCATION_MATRIX)
+SPECIES_IDX = {name: idx for idx, name in enumerate(SPECIES_NAMES)}
+COMPAT = tuple(
+    tuple(get_species_compatibility_score(species, location) for location in LOCATION_NAMES)
+    for species in SPECIES_NAMES
+)
+
+def average_compatibility(target_species: List[str]) -> List[float]:
+    """
+    Get the average compatibility of the target species for every location,
+    ordered like LOCATION_NAMES.
+    """
+    if not target_species:
+        return [0] * len(LOCATION_NAMES)
+    
+    rows = []
+    for species in target_species:
+        idx = SPECIES_IDX.get(species)
+        if idx is None:
+            rows.append([get_species_compatibility_score(species, location) for location in LOCATION_NAMES])
+        else:
+            rows.append(COMPAT[idx])
+    
+    return [fmean(column) for column in zip(*rows)]
+
+class LocationScore(NamedTuple):
+    """
+    Scoring of one candidate stop relative to the base location.
+    """
+    location: str
+    distance_km: float
+    species_compatibility: float
+    combined_score: float
 
 def optimize_route(base_location: str, target_species: List[str], date_range: str, max_stops: int = 3) -> Dict:
     """
@@ -117,56 +210,100 @@ def optimize_route(base_location: str, target_species: List[str], date_range: st
     
     Returns:
         Dictionary with optimized route information
+    
+    Results are cached per input; each call gets its own copy.
+    """
+    return copy.deepcopy(_optimize_route_cached(base_location, tuple(target_species), date_range, max_stops))
+
+@lru_cache(maxsize=512)
+def _optimize_route_cached(base_location: str, target_species: Tuple[str, ...], date_range: str, max_stops: int) -> Dict:
+    """
+    Cached core of optimize_route, keyed on hashable inputs.
     """
+    target_species = list(target_species)
     
     if base_location not in LOCATION_DATABASE:
         return {"error": f"Location '{base_location}' not found in database"}
     
-    base_coords = LOCATION_DATABASE[base_location]["coordinates"]
-    available_locations = list(LOCATION_DATABASE.keys())
-    
-    # Score each potential location based on species compatibility and distance
-    location_scores = []
-    
-    for location in available_locations:
-        if location == base_location:
-            continue
-            
-        location_coords = LOCATION_DATABASE[location]["coordinates"]
-        distance = calculate_distance(base_coords[0], base_coords[1], 
-                                   location_coords[0], location_coords[1])
-        
-        # Calculate species compatibility score
-        species_scores = []
-        for species in target_species:
-            compatibility = get_species_compatibility_score(species, location)
-            species_scores.append(compatibility)
-        
-        avg_species_score = sum(species_scores) / len(species_scores) if species_scores else 0
-        
-        # Combine distance and species compatibility
-        # Prefer closer locations with good species compatibility
-        distance_penalty = min(distance / 1000, 1.0)  # Normalize distance penalty
-        combined_score = avg_species_score * (1 - distance_penalty * 0.3)
-        
-        location_scores.append({
-            "location": location,
-            "distance_km": distance,
-            "species_compatibility": avg_species_score,
-            "combined_score": combined_score,
-            "hotspots": LOCATION_DATABASE[location]["hotspots"]
-        })
-    
-    # Sort by combined score and select top locations
-    location_scores.sort(key=lambda x: x["combined_score"], reverse=True)
-    selected_locations = location_scores[:max_stops]
+    selected_locations = _select_stops(base_location, target_species, max_stops)
     
     # Generate route with timing and recommendations
     route = generate_detailed_route(base_location, selected_locations, target_species, date_range)
     
     return route
 
-def generate_detailed_route(base_location: str, selected_locations: List[Dict], 
+def _select_stops(base_location: str, target_species: List[str], max_stops: int) -> List[LocationScore]:
+    """
+    Pick and order the stops for a route from a known base location.
+    """
+    base_idx = LOCATION_IDX[base_location]
+    distances = DIST_KM[base_idx]
+    avg_scores = average_compatibility(target_species)
+    
+    # Combine distance and species compatibility for every location at once
+    # Prefer closer locations with good species compatibility (distance penalty normalized to 0-1)
+    combined_scores = [
+        avg_species_score * (1 - min(distance / 1000, 1.0) * 0.3)
+        for distance, avg_species_score in zip(distances, avg_scores)
+    ]
+    
+    # Select top locations by combined score, excluding the base
+    candidate_ids = [idx for idx in range(len(LOCATION_NAMES)) if idx != base_idx]
+    top_ids = heapq.nlargest(max_stops, candidate_ids, key=combined_scores.__getitem__)
+    
+    # Visit the selected locations in the shortest order from the base
+    return [
+        LocationScore(LOCATION_NAMES[idx], distances[idx], avg_scores[idx], combined_scores[idx])
+        for idx in order_stops(base_idx, top_ids)
+    ]
+
+# Largest stop count whose visiting order is solved by brute force
+EXACT_ORDER_MAX_STOPS = 7
+
+def route_length(base_idx: int, order: Sequence[int]) -> float:
+    """
+    Total leg distance of an open route from the base through the stops in order.
+    """
+    total = 0.0
+    previous = base_idx
+    for idx in order:
+        total += DIST_KM[previous][idx]
+        previous = idx
+    return total
+
+def order_stops(base_idx: int, stop_ids: List[int]) -> List[int]:
+    """
+    Order stops (LOCATION_IDX ids) to minimize the route length from the base.
+    Exact for up to EXACT_ORDER_MAX_STOPS stops, otherwise nearest neighbor
+    followed by 2-opt improvement.
+    """
+    if len(stop_ids) <= EXACT_ORDER_MAX_STOPS:
+        return list(min(permutations(stop_ids), key=lambda order: route_length(base_idx, order)))
+    
+    # Nearest-neighbor construction
+    remaining = list(stop_ids)
+    order = []
+    current = base_idx
+    while remaining:
+        current = min(remaining, key=DIST_KM[current].__getitem__)
+        remaining.remove(current)
+        order.append(current)
+    
+    # 2-opt: reverse segments while that shortens the route
+    best_length = route_length(base_idx, order)
+    improved = True
+    while improved:
+        improved = False
+        for i in range(len(order) - 1):
+            for j in range(i + 1, len(order)):
+                candidate = order[:i] + order[i:j + 1][::-1] + order[j + 1:]
+                candidate_length = route_length(base_idx, candidate)
+                if candidate_length < best_length - 1e-9:
+                    order, best_length = candidate, candidate_length
+                    improved = True
+    return order
+
+def generate_detailed_route(base_location: str, selected_locations: List[LocationScore], 
                           target_species: List[str], date_range: str) -> Dict:
     """
     Generate detailed route with timing, hotspots, and recommendations.
@@ -174,13 +311,17 @@ def generate_detailed_route(base_location: str, selected_locations: List[Dict],
     
     route_stops = []
     total_distance = 0
-    previous_location = base_location
+    previous_idx = LOCATION_IDX[base_location]
     
     for i, location_data in enumerate(selected_locations):
-        location = location_data["location"]
+        location = location_data.location
+        
+        # Leg distance from the previous stop (the base for the first stop)
+        location_idx = LOCATION_IDX[location]
+        leg_distance = DIST_KM[previous_idx][location_idx]
         
         # Calculate travel time (assuming 60 km/h average speed)
-        travel_time_hours = location_data["distance_km"] / 60
+        travel_time_hours = leg_distance / 60
         travel_time_minutes = int(travel_time_hours * 60)
         
         # Select best hotspots for target species
@@ -192,17 +333,17 @@ def generate_detailed_route(base_location: str, selected_locations: List[Dict],
         stop_info = {
             "stop_number": i + 1,
             "location": location,
-            "distance_from_previous": location_data["distance_km"],
+            "distance_from_previous": leg_distance,
             "travel_time": f"{travel_time_minutes} minutes",
             "hotspots": best_hotspots,
             "viewing_schedule": viewing_schedule,
-            "species_compatibility": location_data["species_compatibility"],
+            "species_compatibility": location_data.species_compatibility,
             "recommendations": generate_stop_recommendations(location, target_species)
         }
         
         route_stops.append(stop_info)
-        total_distance += location_data["distance_km"]
-        previous_location = location
+        total_distance += leg_distance
+        previous_idx = location_idx
     
     return {
         "base_location": base_location,
@@ -219,60 +360,59 @@ def select_best_hotspots(location: str, target_species: List[str]) -> List[Dict]
     """
     Select the best hotspots for target species in a location.
     """
-    if location not in LOCATION_DATABASE:
+    idx = LOCATION_IDX.get(location)
+    if idx is None:
         return []
     
-    hotspots = LOCATION_DATABASE[location]["hotspots"]
-    
-    # Score hotspots based on species count and proximity
-    scored_hotspots = []
-    for hotspot in hotspots:
-        # Simple scoring: higher species count = better hotspot
-        score = hotspot["species_count"] / 500  # Normalize to 0-1
-        
-        scored_hotspots.append({
-            "name": hotspot["name"],
-            "species_count": hotspot["species_count"],
-            "score": score,
-            "coordinates": hotspot["coordinates"]
-        })
+    # Simple scoring: higher species count = better hotspot
+    hotspot_ids = range(HOTSPOT_OFFSETS[idx], HOTSPOT_OFFSETS[idx + 1])
+    best_ids = heapq.nlargest(2, hotspot_ids, key=HOTSPOT_SCORE.__getitem__)
     
-    # Return top 2 hotspots
-    scored_hotspots.sort(key=lambda x: x["score"], reverse=True)
-    return scored_hotspots[:2]
+    return [
+        {
+            "name": HOTSPOT_NAMES[i],
+            "species_count": HOTSPOT_SPECIES_COUNT[i],
+            "score": HOTSPOT_SCORE[i],
+            "coordinates": HOTSPOT_COORDS[i]
+        }
+        for i in best_ids
+    ]
+
+# Mock optimal viewing times as (time, activity), cycled by stop number
+# (simulating different times of day)
+VIEWING_TIME_SLOTS = (
+    ("6:00 AM - 9:00 AM", "Dawn chorus and early morning activity"),
+    ("9:00 AM - 12:00 PM", "Mid-morning feeding and territorial behavior"),
+    ("12:00 PM - 3:00 PM", "Midday rest period, focus on raptors"),
+    ("3:00 PM - 6:00 PM", "Afternoon feeding and pre-roosting activity")
+)
 
 def generate_viewing_schedule(location: str, target_species: List[str], stop_number: int) -> Dict:
     """
     Generate optimal viewing schedule for a location.
     """
-    # Mock optimal viewing times based on stop number (simulating different times of day)
-    time_slots = [
-        {"time": "6:00 AM - 9:00 AM", "activity": "Dawn chorus and early morning activity"},
-        {"time": "9:00 AM - 12:00 PM", "activity": "Mid-morning feeding and territorial behavior"},
-        {"time": "12:00 PM - 3:00 PM", "activity": "Midday rest period, focus on raptors"},
-        {"time": "3:00 PM - 6:00 PM", "activity": "Afternoon feeding and pre-roosting activity"}
-    ]
-    
     # Select time slot based on stop number
-    selected_slot = time_slots[(stop_number - 1) % len(time_slots)]
+    slot_time, slot_activity = VIEWING_TIME_SLOTS[(stop_number - 1) % len(VIEWING_TIME_SLOTS)]
     
     return {
-        "recommended_time": selected_slot["time"],
-        "activity_description": selected_slot["activity"],
-        "target_species_focus": target_species[:2] if len(target_species) >= 2 else target_species,
+        "recommended_time": slot_time,
+        "activity_description": slot_activity,
+        "target_species_focus": target_species[:2],
         "estimated_duration": "2-3 hours"
     }
 
+# Recommendations shared by every stop
+STOP_RECOMMENDATIONS = (
+    "Bring binoculars and field guide for species identification",
+    "Check local weather conditions before departure",
+    "Consider hiring a local guide for rare species"
+)
+
 def generate_stop_recommendations(location: str, target_species: List[str]) -> List[str]:
     """
     Generate specific recommendations for each stop.
     """
-    recommendations = [
-        f"Arrive early at {location} for best viewing conditions",
-        "Bring binoculars and field guide for species identification",
-        "Check local weather conditions before departure",
-        "Consider hiring a local guide for rare species"
-    ]
+    recommendations = [f"Arrive early at {location} for best viewing conditions", *STOP_RECOMMENDATIONS]
     
     # Add species-specific recommendations
     if len(target_species) > 0:
@@ -287,21 +427,21 @@ def generate_route_summary(route_stops: List[Dict], target_species: List[str]) -
     total_stops = len(route_stops)
     total_distance = sum(stop["distance_from_previous"] for stop in route_stops)
     
-    summary = f"This {total_stops}-stop route covers {total_distance:.1f} km and targets {len(target_species)} species: {', '.join(target_species)}. "
-    summary += "The route is optimized for species diversity and travel efficiency. "
-    summary += f"Estimated total time including travel and birding: {int(total_distance / 60 + total_stops * 2)} hours."
-    
-    return summary
+    return " ".join((
+        f"This {total_stops}-stop route covers {total_distance:.1f} km and targets {len(target_species)} species: {', '.join(target_species)}.",
+        "The route is optimized for species diversity and travel efficiency.",
+        f"Estimated total time including travel and birding: {int(total_distance / 60 + total_stops * 2)} hours."
+    ))
 
 def plan_route(base_location: str, targets: List[str]) -> List[str]:
     """
     Legacy function for backward compatibility.
+    Only selects the stops; the detailed route is not built.
     """
-    result = optimize_route(base_location, targets, "Spring 2024")
-    if "error" in result:
-        return ["Error: " + result["error"]]
+    if base_location not in LOCATION_DATABASE:
+        return [f"Error: Location '{base_location}' not found in database"]
     
-    return [stop["location"] for stop in result["route_stops"]]
+    return [stop.location for stop in _select_stops(base_location, targets, 3)]
 
 # Example usage and testing
 if __name__ == "__main__":
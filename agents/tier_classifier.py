@@ -8,8 +8,9 @@ T4: Elusive Explorer (Rare, requires specific conditions)
 T5: Legendary Quest (Very rare, special sightings)
 """
 
+from bisect import bisect_right
 import random
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
 
 # Mock bird database with occurrence data
 BIRD_DATABASE = {
@@ -85,20 +86,20 @@ BIRD_DATABASE = {
     }
 }
 
+# Visibility levels mapped to numerical scores
+VISIBILITY_SCORES = {
+    "very_low": 0.2,
+    "low": 0.4,
+    "medium": 0.7,
+    "high": 1.0
+}
+
 def calculate_tier_score(occurrence_rate: float, region_count: int, visibility: str) -> float:
     """
     Calculate a numerical score for tier classification.
     Higher scores = higher tiers (more common/easy to find)
     """
-    # Convert visibility to numerical value
-    visibility_scores = {
-        "very_low": 0.2,
-        "low": 0.4,
-        "medium": 0.7,
-        "high": 1.0
-    }
-    
-    visibility_score = visibility_scores.get(visibility, 0.5)
+    visibility_score = VISIBILITY_SCORES.get(visibility, 0.5)
     
     # Normalize region count (max 50 states)
     region_score = min(region_count / 50.0, 1.0)
@@ -107,27 +108,57 @@ def calculate_tier_score(occurrence_rate: float, region_count: int, visibility:
     final_score = (occurrence_rate * 0.5) + (region_score * 0.3) + (visibility_score * 0.2)
     return final_score
 
+# Tier thresholds in ascending order; bisect_right(TIER_THRESHOLDS, score)
+# indexes TIER_LABELS (T5 Legendary Quest ... T1 Common Companion)
+TIER_THRESHOLDS = (0.2, 0.4, 0.6, 0.8)
+TIER_LABELS = ("T5", "T4", "T3", "T2", "T1")
+
+def tier_for_score(score: float) -> str:
+    """
+    Map a tier score to its T1-T5 tier.
+    """
+    return TIER_LABELS[bisect_right(TIER_THRESHOLDS, score)]
+
+def classify_scores(scores: Iterable[float]) -> List[str]:
+    """
+    Map many tier scores to their T1-T5 tiers.
+    """
+    return list(map(tier_for_score, scores))
+
+def species_tier_score(species_data: Dict) -> float:
+    """
+    Calculate the tier score of a species record, filling in defaults for
+    missing fields.
+    """
+    return calculate_tier_score(
+        species_data.get("occurrence_rate", 0.5),
+        species_data.get("region_count", 25),
+        species_data.get("visibility", "medium")
+    )
+
 def classify_species(species_data: Dict) -> str:
     """
     Classify a species into T1-T5 tier based on its data.
     """
-    occurrence_rate = species_data.get("occurrence_rate", 0.5)
-    region_count = species_data.get("region_count", 25)
-    visibility = species_data.get("visibility", "medium")
-    
-    score = calculate_tier_score(occurrence_rate, region_count, visibility)
-    
-    # Tier thresholds
-    if score >= 0.8:
-        return "T1"  # Common Companion
-    elif score >= 0.6:
-        return "T2"  # Regional Companion
-    elif score >= 0.4:
-        return "T3"  # Seasonal Visitor
-    elif score >= 0.2:
-        return "T4"  # Elusive Explorer
-    else:
-        return "T5"  # Legendary Quest
+    return tier_for_score(species_tier_score(species_data))
+
+def classify_species_batch(species_data_list: List[Dict]) -> List[str]:
+    """
+    Classify many species records into T1-T5 tiers in one pass.
+    """
+    return classify_scores(map(species_tier_score, species_data_list))
+
+# Column layout of BIRD_DATABASE, indexed by BIRD_IDX
+BIRD_NAMES = tuple(BIRD_DATABASE)
+BIRD_IDX = {name: idx for idx, name in enumerate(BIRD_NAMES)}
+BIRD_OCCURRENCE = tuple(BIRD_DATABASE[name]["occurrence_rate"] for name in BIRD_NAMES)
+BIRD_REGION_COUNT = tuple(BIRD_DATABASE[name]["region_count"] for name in BIRD_NAMES)
+BIRD_VISIBILITY = tuple(BIRD_DATABASE[name]["visibility"] for name in BIRD_NAMES)
+# The database is static, so its tiers are computed once
+BIRD_TIERS = tuple(
+    tier_for_score(calculate_tier_score(occurrence, region_count, visibility))
+    for occurrence, region_count, visibility in zip(BIRD_OCCURRENCE, BIRD_REGION_COUNT, BIRD_VISIBILITY)
+)
 
 def get_tier_description(tier: str) -> str:
     """
@@ -146,14 +177,14 @@ def classify_species_by_name(species_name: str) -> Dict:
     """
     Classify a species by name using the database.
     """
-    if species_name in BIRD_DATABASE:
-        species_data = BIRD_DATABASE[species_name]
-        tier = classify_species(species_data)
+    idx = BIRD_IDX.get(species_name)
+    if idx is not None:
+        tier = BIRD_TIERS[idx]
         return {
             "species": species_name,
             "tier": tier,
             "description": get_tier_description(tier),
-            "data": species_data
+            "data": BIRD_DATABASE[species_name]
         }
     else:
         # For unknown species, generate mock data
@@ -6,7 +6,7 @@ Verifies the integrity and functionality of the BirdingPlanner system.
 
 import os
 import sys
-import importlib
+import importlib.util
 from pathlib import Path
 
 def check_python_version():
@@ -48,10 +48,10 @@ def check_dependencies():
     missing_packages = []
     
     for package in required_packages:
-        try:
-            importlib.import_module(package)
+        # find_spec locates the package without executing its import
+        if importlib.util.find_spec(package) is not None:
             print(f"   ✅ {package}")
-        except ImportError:
+        else:
             print(f"   ❌ {package} (missing)")
             missing_packages.append(package)
     
@@ -68,6 +68,7 @@ def check_project_structure():
     
     required_files = [
         'mcp_server/main.py',
+        'agents/__init__.py',
         'agents/bird_info_agent.py',
         'agents/tier_classifier.py', 
         'agents/route_planner.py',
@@ -85,9 +86,24 @@ def check_project_structure():
     
     missing_items = []
     
+    # List each parent directory once instead of probing every path,
+    # recording whether each entry is a file or a directory as it is listed
+    existing_files = set()
+    existing_dirs = set()
+    for parent in {str(Path(item).parent) for item in required_files + required_dirs}:
+        try:
+            with os.scandir(parent) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        existing_files.add(str(Path(entry.path)))
+                    elif entry.is_dir():
+                        existing_dirs.add(str(Path(entry.path)))
+        except OSError:
+            continue
+    
     # Check files
     for file_path in required_files:
-        if os.path.exists(file_path):
+        if str(Path(file_path)) in existing_files:
             print(f"   ✅ {file_path}")
         else:
             print(f"   ❌ {file_path} (missing)")
@@ -95,7 +111,7 @@ def check_project_structure():
     
     # Check directories
     for dir_path in required_dirs:
-        if os.path.isdir(dir_path):
+        if str(Path(dir_path)) in existing_dirs:
             print(f"   ✅ {dir_path}/")
         else:
             print(f"   ❌ {dir_path}/ (missing)")
@@ -14,19 +14,22 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 from src.config.settings import get_settings
 from src.core.ebird_service import EBirdService
 from src.mcp.ebird_agent import EBirdAgent, AgentTask
+from demo_output import Out
 
 
 def demo_ebird_api_features():
     """Demonstrate eBird API features"""
-    print("🦅 eBird API Integration Demo")
-    print("=" * 60)
-    print(f"Demo started at: {datetime.now()}")
-    print()
+    out = Out()
+    out.p("🦅 eBird API Integration Demo")
+    out.p("=" * 60)
+    out.p(f"Demo started at: {datetime.now()}")
+    out.p()
     
     settings = get_settings()
     
     if not settings.ebird_api_key:
-        print("❌ No eBird API key found. Please set EBIRD_API_KEY environment variable.")
+        out.p("❌ No eBird API key found. Please set EBIRD_API_KEY environment variable.")
+        out.flush()
         return
     
     try:
@@ -34,43 +37,46 @@ def demo_ebird_api_features():
         ebird_service = EBirdService(settings.ebird_api_key)
         ebird_agent = EBirdAgent(ebird_service)
         
-        print("✅ Services initialized successfully!")
-        print()
+        out.p("✅ Services initialized successfully!")
+        out.p()
+        out.flush()
         
         # Demo 1: Real-time observations
-        print("📊 Demo 1: Real-time Observations")
-        print("-" * 40)
+        out.p("📊 Demo 1: Real-time Observations")
+        out.p("-" * 40)
         
         observations = ebird_service.get_recent_observations("New York", days=1)
-        print(f"Found {len(observations)} recent observations in New York")
+        out.p(f"Found {len(observations)} recent observations in New York")
         
         if observations:
-            print("\nRecent sightings:")
+            out.p("\nRecent sightings:")
             for i, obs in enumerate(observations[:5]):
-                print(f"  {i+1}. {obs.species} at {obs.location}")
-                print(f"     Time: {obs.timestamp.strftime('%Y-%m-%d %H:%M')}")
-                print(f"     Observer: {obs.observer or 'Anonymous'}")
+                out.p(f"  {i+1}. {obs.species} at {obs.location}")
+                out.p(f"     Time: {obs.timestamp.strftime('%Y-%m-%d %H:%M')}")
+                out.p(f"     Observer: {obs.observer or 'Anonymous'}")
                 if obs.coordinates:
-                    print(f"     Location: ({obs.coordinates.latitude:.3f}, {obs.coordinates.longitude:.3f})")
-                print()
+                    out.p(f"     Location: ({obs.coordinates.latitude:.3f}, {obs.coordinates.longitude:.3f})")
+                out.p()
+        out.flush()
         
         # Demo 2: Success rate prediction
-        print("🎯 Demo 2: Success Rate Prediction")
-        print("-" * 40)
+        out.p("🎯 Demo 2: Success Rate Prediction")
+        out.p("-" * 40)
         
         target_species = ["American Robin", "Northern Cardinal", "Blue Jay"]
         
-        for species in target_species:
-            success_rate = ebird_service.predict_success_rate(
-                species, "New York", "2024-04-15"
-            )
-            print(f"  {species}: {success_rate:.1%} success rate")
+        success_rates = ebird_service.predict_success_rates(
+            target_species, "New York", "2024-04-15"
+        )
+        for species, success_rate in success_rates.items():
+            out.p(f"  {species}: {success_rate:.1%} success rate")
         
-        print()
+        out.p()
+        out.flush()
         
         # Demo 3: AI-enhanced species analysis
-        print("🤖 Demo 3: AI-Enhanced Species Analysis")
-        print("-" * 40)
+        out.p("🤖 Demo 3: AI-Enhanced Species Analysis")
+        out.p("-" * 40)
         
         species_task = AgentTask(
             agent_name=ebird_agent.name,
@@ -88,27 +94,28 @@ def demo_ebird_api_features():
             data = result.data
             analysis = data.get('analysis')
             
-            print(f"Species: {analysis.species}")
-            print(f"Location: {analysis.location}")
-            print(f"Success Rate: {analysis.success_rate:.1%}")
-            print(f"Recent Observations: {analysis.recent_observations}")
-            print(f"Best Time: {analysis.best_time}")
-            print(f"Seasonal Trend: {analysis.seasonal_trend}")
-            print(f"Confidence Score: {analysis.confidence_score:.1%}")
+            out.p(f"Species: {analysis.species}")
+            out.p(f"Location: {analysis.location}")
+            out.p(f"Success Rate: {analysis.success_rate:.1%}")
+            out.p(f"Recent Observations: {analysis.recent_observations}")
+            out.p(f"Best Time: {analysis.best_time}")
+            out.p(f"Seasonal Trend: {analysis.seasonal_trend}")
+            out.p(f"Confidence Score: {analysis.confidence_score:.1%}")
             
-            print("\nAI Insights:")
+            out.p("\nAI Insights:")
             for insight in analysis.ai_insights:
-                print(f"  • {insight}")
+                out.p(f"  • {insight}")
             
-            print(f"\nHotspot Recommendations:")
+            out.p(f"\nHotspot Recommendations:")
             for hotspot in analysis.hotspot_recommendations[:3]:
-                print(f"  • {hotspot}")
+                out.p(f"  • {hotspot}")
         
-        print()
+        out.p()
+        out.flush()
         
         # Demo 4: Success prediction for multiple species
-        print("🎯 Demo 4: Multi-Species Success Prediction")
-        print("-" * 40)
+        out.p("🎯 Demo 4: Multi-Species Success Prediction")
+        out.p("-" * 40)
         
         prediction_task = AgentTask(
             agent_name=ebird_agent.name,
@@ -124,24 +131,25 @@ def demo_ebird_api_features():
         
         if pred_result.success:
             data = pred_result.data
-            print(f"Overall Success Rate: {data.get('overall_success_rate', 0):.1%}")
-            print(f"Confidence: {data.get('confidence', 0):.1%}")
+            out.p(f"Overall Success Rate: {data.get('overall_success_rate', 0):.1%}")
+            out.p(f"Confidence: {data.get('confidence', 0):.1%}")
             
-            print("\nIndividual Predictions:")
+            out.p("\nIndividual Predictions:")
             predictions = data.get('predictions', {})
             for species, rate in predictions.items():
-                print(f"  {species}: {rate:.1%}")
+                out.p(f"  {species}: {rate:.1%}")
             
-            print("\nAI Recommendations:")
+            out.p("\nAI Recommendations:")
             recommendations = data.get('recommendations', [])
             for rec in recommendations:
-                print(f"  • {rec}")
+                out.p(f"  • {rec}")
         
-        print()
+        out.p()
+        out.flush()
         
         # Demo 5: Rare species alerts
-        print("🚨 Demo 5: Rare Species Alerts")
-        print("-" * 40)
+        out.p("🚨 Demo 5: Rare Species Alerts")
+        out.p("-" * 40)
         
         alert_task = AgentTask(
             agent_name=ebird_agent.name,
@@ -159,21 +167,22 @@ def demo_ebird_api_features():
             alerts = data.get('alerts', [])
             
             if alerts:
-                print(f"Found {len(alerts)} rare species alerts:")
+                out.p(f"Found {len(alerts)} rare species alerts:")
                 for alert in alerts:
-                    print(f"  • {alert['species']} at {alert['location']}")
-                    print(f"    Rarity Score: {alert['rarity_score']:.1%}")
-                    print(f"    Time: {alert['timestamp']}")
-                    print(f"    Recommendation: {alert['recommendation']}")
-                    print()
+                    out.p(f"  • {alert['species']} at {alert['location']}")
+                    out.p(f"    Rarity Score: {alert['rarity_score']:.1%}")
+                    out.p(f"    Time: {alert['timestamp']}")
+                    out.p(f"    Recommendation: {alert['recommendation']}")
+                    out.p()
             else:
-                print("No rare species alerts found in the last 7 days.")
+                out.p("No rare species alerts found in the last 7 days.")
         
-        print()
+        out.p()
+        out.flush()
         
         # Demo 6: Hotspot analysis
-        print("📍 Demo 6: Hotspot Activity Analysis")
-        print("-" * 40)
+        out.p("📍 Demo 6: Hotspot Activity Analysis")
+        out.p("-" * 40)
         
         # Use a sample hotspot ID (in real usage, this would come from eBird data)
         sample_hotspots = ["L123456", "L789012"]  # Example hotspot IDs
@@ -181,26 +190,28 @@ def demo_ebird_api_features():
         for hotspot_id in sample_hotspots:
             activity = ebird_service.get_hotspot_activity(hotspot_id)
             if activity:
-                print(f"Hotspot: {activity.hotspot_name}")
-                print(f"Recent Observations: {activity.recent_observations}")
-                print(f"Species Count: {activity.species_count}")
-                print(f"Success Rate: {activity.success_rate:.1%}")
-                print(f"Last Updated: {activity.last_updated}")
-                print()
+                out.p(f"Hotspot: {activity.hotspot_name}")
+                out.p(f"Recent Observations: {activity.recent_observations}")
+                out.p(f"Species Count: {activity.species_count}")
+                out.p(f"Success Rate: {activity.success_rate:.1%}")
+                out.p(f"Last Updated: {activity.last_updated}")
+                out.p()
             else:
-                print(f"No data available for hotspot {hotspot_id}")
-        
-        print("🎉 Demo completed successfully!")
-        print("\nKey Features Demonstrated:")
-        print("  ✅ Real-time observation data")
-        print("  ✅ Success rate prediction")
-        print("  ✅ AI-enhanced species analysis")
-        print("  ✅ Multi-species success prediction")
-        print("  ✅ Rare species alerts")
-        print("  ✅ Hotspot activity analysis")
+                out.p(f"No data available for hotspot {hotspot_id}")
+        
+        out.p("🎉 Demo completed successfully!")
+        out.p("\nKey Features Demonstrated:")
+        out.p("  ✅ Real-time observation data")
+        out.p("  ✅ Success rate prediction")
+        out.p("  ✅ AI-enhanced species analysis")
+        out.p("  ✅ Multi-species success prediction")
+        out.p("  ✅ Rare species alerts")
+        out.p("  ✅ Hotspot activity analysis")
+        out.flush()
         
     except Exception as e:
-        print(f"❌ Demo failed: {e}")
+        out.p(f"❌ Demo failed: {e}")
+        out.flush()
         import traceback
         traceback.print_exc()
 
@@ -5,6 +5,7 @@ Demonstrates the combination of AI Agents and Service Layer architecture.
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add src to path for imports
@@ -14,16 +15,14 @@ from src.core.birding_planner import BirdingPlanner
 from src.mcp.server import MCPServer
 from src.models.trip import TripRequest
 from src.config.settings import get_settings
+from demo_output import Out
 
 
-def demo_standard_planning():
+def demo_standard_planning(planner: BirdingPlanner):
     """Demonstrate standard service layer planning."""
-    print("🦅 Standard Service Layer Planning")
-    print("=" * 50)
-    
-    # Initialize standard planner
-    settings = get_settings()
-    planner = BirdingPlanner(settings)
+    out = Out()
+    out.p("🦅 Standard Service Layer Planning")
+    out.p("=" * 50)
     
     # Create trip request
     request = TripRequest(
@@ -33,38 +32,36 @@ def demo_standard_planning():
         max_stops=3
     )
     
-    print(f"Target Species: {', '.join(request.species)}")
-    print(f"Base Location: {request.base_location}")
-    print(f"Date Range: {request.date_range}")
-    print()
+    out.p(f"Target Species: {', '.join(request.species)}")
+    out.p(f"Base Location: {request.base_location}")
+    out.p(f"Date Range: {request.date_range}")
+    out.p()
     
     # Generate trip plan
     trip_plan = planner.create_trip_plan(request)
     
-    print("📋 Standard Trip Plan Summary:")
-    print(f"   Total Stops: {trip_plan.trip_overview.total_stops}")
-    print(f"   Total Distance: {trip_plan.trip_overview.total_distance_km:.1f} km")
-    print(f"   Estimated Time: {trip_plan.trip_overview.estimated_time}")
-    print()
+    out.p("📋 Standard Trip Plan Summary:")
+    out.p(f"   Total Stops: {trip_plan.trip_overview.total_stops}")
+    out.p(f"   Total Distance: {trip_plan.trip_overview.total_distance_km:.1f} km")
+    out.p(f"   Estimated Time: {trip_plan.trip_overview.estimated_time}")
+    out.p()
+    out.flush()
     
     return trip_plan
 
 
-def demo_ai_enhanced_planning():
+def demo_ai_enhanced_planning(mcp_server: MCPServer):
     """Demonstrate AI agent enhanced planning."""
-    print("🤖 AI Agent Enhanced Planning")
-    print("=" * 50)
-    
-    # Initialize MCP Server
-    settings = get_settings()
-    mcp_server = MCPServer(settings)
+    out = Out()
+    out.p("🤖 AI Agent Enhanced Planning")
+    out.p("=" * 50)
     
     # Show agent capabilities
-    print("AI Agent Capabilities:")
+    out.p("AI Agent Capabilities:")
     capabilities = mcp_server.get_agent_capabilities()
     for agent, caps in capabilities.items():
-        print(f"  {agent}: {', '.join(caps)}")
-    print()
+        out.p(f"  {agent}: {', '.join(caps)}")
+    out.p()
     
     # Create AI-enhanced trip plan
     trip_plan = mcp_server.create_trip_plan(
@@ -75,51 +72,47 @@ def demo_ai_enhanced_planning():
         output_dir="demo_ai_output"
     )
     
-    print("📋 AI-Enhanced Trip Plan Summary:")
-    print(f"   Total Stops: {trip_plan.trip_overview.total_stops}")
-    print(f"   Total Distance: {trip_plan.trip_overview.total_distance_km:.1f} km")
-    print(f"   Estimated Time: {trip_plan.trip_overview.estimated_time}")
-    print()
+    out.p("📋 AI-Enhanced Trip Plan Summary:")
+    out.p(f"   Total Stops: {trip_plan.trip_overview.total_stops}")
+    out.p(f"   Total Distance: {trip_plan.trip_overview.total_distance_km:.1f} km")
+    out.p(f"   Estimated Time: {trip_plan.trip_overview.estimated_time}")
+    out.p()
+    out.flush()
     
     return trip_plan
 
 
-def demo_agent_status():
+def demo_agent_status(mcp_server: MCPServer):
     """Demonstrate agent status monitoring."""
-    print("📊 AI Agent Status Monitoring")
-    print("=" * 50)
-    
-    # Initialize MCP Server
-    settings = get_settings()
-    mcp_server = MCPServer(settings)
+    out = Out()
+    out.p("📊 AI Agent Status Monitoring")
+    out.p("=" * 50)
     
     # Get server status
     status = mcp_server.get_server_status()
-    print(f"Server Status: {status['server']['status']}")
-    print(f"Uptime: {status['server']['uptime_seconds']:.1f} seconds")
-    print(f"Requests: {status['server']['request_count']}")
-    print(f"Total Agents: {status['agents']['total_agents']}")
-    print()
+    out.p(f"Server Status: {status['server']['status']}")
+    out.p(f"Uptime: {status['server']['uptime_seconds']:.1f} seconds")
+    out.p(f"Requests: {status['server']['request_count']}")
+    out.p(f"Total Agents: {status['agents']['total_agents']}")
+    out.p()
     
     # Get health check
     health = mcp_server.health_check()
-    print(f"Health Status: {health['status']}")
-    print(f"Agents Healthy: {health['agents_healthy']}")
-    print(f"Total Agents: {health['total_agents']}")
-    print()
+    out.p(f"Health Status: {health['status']}")
+    out.p(f"Agents Healthy: {health['agents_healthy']}")
+    out.p(f"Total Agents: {health['total_agents']}")
+    out.p()
+    out.flush()
 
 
-def demo_agent_task_execution():
+def demo_agent_task_execution(mcp_server: MCPServer):
     """Demonstrate individual agent task execution."""
-    print("⚙️ Individual Agent Task Execution")
-    print("=" * 50)
-    
-    # Initialize MCP Server
-    settings = get_settings()
-    mcp_server = MCPServer(settings)
+    out = Out()
+    out.p("⚙️ Individual Agent Task Execution")
+    out.p("=" * 50)
     
     # Execute species analysis task
-    print("Executing SpeciesAgent task...")
+    out.p("Executing SpeciesAgent task...")
     species_result = mcp_server.execute_agent_task(
         agent_name="SpeciesAgent",
         task_type="species_classification",
@@ -130,14 +123,15 @@ def demo_agent_task_execution():
         }
     )
     
-    print(f"SpeciesAgent Success: {species_result['success']}")
+    out.p(f"SpeciesAgent Success: {species_result['success']}")
     if species_result['success']:
         species_data = species_result['data']
         classifications = species_data.get('species_analysis', {}).get('classifications', [])
         for classification in classifications:
-            print(f"  {classification['species']}: Tier {classification['tier']} "
+            out.p(f"  {classification['species']}: Tier {classification['tier']} "
                   f"(Confidence: {classification['confidence_score']:.1%})")
-    print()
+    out.p()
+    out.flush()
 
 
 def main():
@@ -152,17 +146,22 @@ def main():
     print()
     
     try:
-        # Demo 1: Standard Planning
-        demo_standard_planning()
-        
-        # Demo 2: AI Enhanced Planning
-        demo_ai_enhanced_planning()
-        
-        # Demo 3: Agent Status
-        demo_agent_status()
+        # Initialize the planner and MCP Server once and share them across demos
+        settings = get_settings()
+        planner = BirdingPlanner(settings)
+        mcp_server = MCPServer(settings)
         
-        # Demo 4: Individual Agent Tasks
-        demo_agent_task_execution()
+        # The demos are independent, so run them concurrently; each one
+        # buffers its output and writes it as a single block.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(demo_standard_planning, planner),      # Demo 1: Standard Planning
+                executor.submit(demo_ai_enhanced_planning, mcp_server),  # Demo 2: AI Enhanced Planning
+                executor.submit(demo_agent_status, mcp_server),          # Demo 3: Agent Status
+                executor.submit(demo_agent_task_execution, mcp_server),  # Demo 4: Individual Agent Tasks
+            ]
+            for future in futures:
+                future.result()
         
         print("✅ Demo completed successfully!")
         print()
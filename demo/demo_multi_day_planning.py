@@ -4,33 +4,95 @@ Multi-Day Birding Planning Demo
 Demonstrates the comprehensive multi-day planning features
 """
 
+import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, is_dataclass
 from datetime import datetime
 
+# BIRDING_BACKEND=pure keeps the demo on the standard library only (e.g. for PyPy)
+if os.environ.get("BIRDING_BACKEND") == "pure":
+    orjson = None
+else:
+    try:
+        import orjson
+    except ImportError:
+        orjson = None  # orjson not installed, fall back to the json module
+
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+from src.cli.main import generate_multi_day_markdown
 from src.config.settings import get_settings
 from src.core.birding_planner import BirdingPlanner
 from src.core.route_service import RouteService
+from demo_output import Out
+
+
+# Route stop block for the detailed daily routes; optional lines are appended separately
+_STOP_TMPL = (
+    "     Stop {stop_number}: {hotspot_name}\n"
+    "        Time: {viewing_time}\n"
+    "        Distance: {distance_from_previous:.1f} km\n"
+    "        Target Species: {target_species_text}\n"
+    "        Success Rate: {success_probability:.1%}\n"
+    "        Best Approach: {best_approach}\n"
+)
+_STOP_FACILITIES_TMPL = "        Facilities: {}\n"
+_STOP_TIPS_TMPL = "        Tips: {}\n"
+
+
+def _format_stop(route_stop):
+    """Format one route stop of the detailed daily route, followed by a blank line."""
+    text = _STOP_TMPL.format_map(dict(route_stop, target_species_text=', '.join(route_stop['target_species'])))
+    if route_stop['facilities']:
+        text += _STOP_FACILITIES_TMPL.format(', '.join(route_stop['facilities'][:2]))
+    if route_stop['recommendations']:
+        text += _STOP_TIPS_TMPL.format(route_stop['recommendations'][0])
+    return text + "\n"
+
+
+def _json_default(obj):
+    """Serialize dataclasses as dicts and anything else as a string."""
+    if is_dataclass(obj):
+        return asdict(obj)
+    return str(obj)
+
+
+def _write_json(path, data):
+    """Write data as indented JSON, using orjson when available."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2, default=_json_default)
+
+
+def _write_text(path, content):
+    """Write text content to a file."""
+    with open(path, 'w') as f:
+        f.write(content)
 
 
 def demo_multi_day_features():
     """Demonstrate all multi-day planning features"""
-    print("🗺️ Multi-Day Birding Planning Demo")
-    print("=" * 60)
+    out = Out()
+    out.p("🗺️ Multi-Day Birding Planning Demo")
+    out.p("=" * 60)
     
     # Initialize services
     settings = get_settings()
     planner = BirdingPlanner(settings)
     route_service = planner.route_service
     
-    print("✅ Services initialized successfully")
+    out.p("✅ Services initialized successfully")
     
     # Demo 1: Basic multi-day planning
-    print("\n🎯 Demo 1: Basic Multi-Day Planning")
-    print("-" * 40)
+    out.p("\n🎯 Demo 1: Basic Multi-Day Planning")
+    out.p("-" * 40)
+    out.flush()
     
     basic_plan = route_service.create_multi_day_plan(
         base_location="New York",
@@ -40,71 +102,57 @@ def demo_multi_day_features():
         max_distance_per_day=30.0
     )
     
-    print(f"📍 Base Location: {basic_plan['base_location']}")
-    print(f"🎯 Target Species: {', '.join(basic_plan['target_species'])}")
-    print(f"📅 Total Days: {basic_plan['total_days']}")
+    out.p(f"📍 Base Location: {basic_plan['base_location']}")
+    out.p(f"🎯 Target Species: {', '.join(basic_plan['target_species'])}")
+    out.p(f"📅 Total Days: {basic_plan['total_days']}")
     
     overall_stats = basic_plan['overall_stats']
-    print(f"📊 Overall Statistics:")
-    print(f"   Total Species Expected: {overall_stats['total_species_expected']}")
-    print(f"   Total Distance: {overall_stats['total_distance']:.1f} km")
-    print(f"   Average Distance per Day: {overall_stats['average_distance_per_day']:.1f} km")
-    print(f"   Overall Success Probability: {overall_stats['overall_success_probability']:.1%}")
-    print(f"   Species Coverage: {overall_stats['species_coverage']:.1%}")
-    print(f"   Efficiency Score: {overall_stats['efficiency_score']:.1f} species per 10km")
+    out.p(f"📊 Overall Statistics:")
+    out.p(f"   Total Species Expected: {overall_stats['total_species_expected']}")
+    out.p(f"   Total Distance: {overall_stats['total_distance']:.1f} km")
+    out.p(f"   Average Distance per Day: {overall_stats['average_distance_per_day']:.1f} km")
+    out.p(f"   Overall Success Probability: {overall_stats['overall_success_probability']:.1%}")
+    out.p(f"   Species Coverage: {overall_stats['species_coverage']:.1%}")
+    out.p(f"   Efficiency Score: {overall_stats['efficiency_score']:.1f} species per 10km")
+    out.flush()
     
-    # Demo 2: Detailed daily routes
-    print("\n🗺️ Demo 2: 每天应该去哪些鸟点 (Daily Hotspot Plan)")
-    print("-" * 40)
+    # Demo 2: Daily hotspot plan with the detailed route and schedule, one pass per day
+    out.p("\n🗺️ Demo 2: 每天应该去哪些鸟点 (Daily Hotspot Plan, Route & Schedule)")
+    out.p("-" * 40)
     
     for day_plan in basic_plan['daily_plans']:
-        print(f"\n📅 Day {day_plan['day']}")
-        print(f"   计划去的鸟点 (Hotspots to visit):")
-        if 'route_stops' in day_plan and day_plan['route_stops']:
-            for route_stop in day_plan['route_stops']:
-                print(f"     - {route_stop['hotspot_name']} | 时间: {route_stop['viewing_time']} | 目标鸟种: {', '.join(route_stop['target_species'])}")
+        stops = day_plan.get('route_stops') or ()
+        schedule = day_plan.get('daily_schedule') or ()
+        
+        out.p(f"\n📅 Day {day_plan['day']}")
+        out.p(f"   计划去的鸟点 (Hotspots to visit):")
+        if stops:
+            for route_stop in stops:
+                out.p(f"     - {route_stop['hotspot_name']} | 时间: {route_stop['viewing_time']} | 目标鸟种: {', '.join(route_stop['target_species'])}")
         else:
-            print("     (无推荐鸟点)")
-        print(f"   预计可见鸟种: {len(day_plan['expected_species'])}")
-        print(f"   总距离: {day_plan['total_distance']:.1f} km")
-        print(f"   成功概率: {day_plan['day_success_probability']:.1%}")
+            out.p("     (无推荐鸟点)")
+        out.p(f"   预计可见鸟种: {len(day_plan['expected_species'])}")
+        out.p(f"   总距离: {day_plan['total_distance']:.1f} km")
+        out.p(f"   成功概率: {day_plan['day_success_probability']:.1%}")
         if 'daily_summary' in day_plan:
-            print(f"   总结: {day_plan['daily_summary']}")
-        print()
-    
-    # 保留原有详细路线和日程输出
-    print("\n🗺️ Demo 2b: 每日详细路线和日程 (Detailed Route & Schedule)")
-    print("-" * 40)
-    for day_plan in basic_plan['daily_plans']:
-        print(f"\n📅 Day {day_plan['day']}")
-        if 'route_stops' in day_plan and day_plan['route_stops']:
-            print(f"   Detailed Route:")
-            for route_stop in day_plan['route_stops']:
-                print(f"     Stop {route_stop['stop_number']}: {route_stop['hotspot_name']}")
-                print(f"        Time: {route_stop['viewing_time']}")
-                print(f"        Distance: {route_stop['distance_from_previous']:.1f} km")
-                print(f"        Target Species: {', '.join(route_stop['target_species'])}")
-                print(f"        Success Rate: {route_stop['success_probability']:.1%}")
-                print(f"        Best Approach: {route_stop['best_approach']}")
-                if route_stop['facilities']:
-                    print(f"        Facilities: {', '.join(route_stop['facilities'][:2])}")
-                if route_stop['recommendations']:
-                    print(f"        Tips: {route_stop['recommendations'][0]}")
-                print()
-        if 'daily_schedule' in day_plan and day_plan['daily_schedule']:
-            print(f"   Daily Schedule:")
-            for schedule_item in day_plan['daily_schedule']:
-                if schedule_item['type'] == 'travel':
-                    print(f"     {schedule_item['time']}: {schedule_item['activity']} ({schedule_item['duration']})")
-                else:
-                    print(f"     {schedule_item['time']}: {schedule_item['activity']} ({schedule_item['duration']})")
-                    if schedule_item['target_species']:
-                        print(f"        Target: {', '.join(schedule_item['target_species'])}")
-        print()
+            out.p(f"   总结: {day_plan['daily_summary']}")
+        
+        # 保留原有详细路线和日程输出
+        if stops:
+            out.p(f"   Detailed Route:")
+            out.write("".join(_format_stop(route_stop) for route_stop in stops))
+        if schedule:
+            out.p(f"   Daily Schedule:")
+            for schedule_item in schedule:
+                out.p(f"     {schedule_item['time']}: {schedule_item['activity']} ({schedule_item['duration']})")
+                if schedule_item['type'] != 'travel' and schedule_item['target_species']:
+                    out.p(f"        Target: {', '.join(schedule_item['target_species'])}")
+        out.p()
+    out.flush()
     
     # Demo 3: Different planning scenarios
-    print("\n🧪 Demo 3: Different Planning Scenarios")
-    print("-" * 40)
+    out.p("\n🧪 Demo 3: Different Planning Scenarios")
+    out.p("-" * 40)
     
     scenarios = [
         {
@@ -128,131 +176,139 @@ def demo_multi_day_features():
         }
     ]
     
-    for scenario in scenarios:
-        print(f"\n📋 {scenario['name']}")
-        print(f"   Days: {scenario['days']}")
-        print(f"   Species: {len(scenario['species'])}")
-        print(f"   Max Distance: {scenario['max_distance']} km/day")
+    out.flush()
+    try:
+        plans = route_service.create_multi_day_plans_batch(
+            base_location="New York",
+            scenarios=scenarios,
+            date_range="Spring 2024"
+        )
+    except Exception as e:
+        out.p(f"   ❌ Failed: {e}")
+        plans = []
+    
+    for scenario, plan in zip(scenarios, plans):
+        out.p(f"\n📋 {scenario['name']}")
+        out.p(f"   Days: {scenario['days']}")
+        out.p(f"   Species: {len(scenario['species'])}")
+        out.p(f"   Max Distance: {scenario['max_distance']} km/day")
         
-        try:
-            plan = route_service.create_multi_day_plan(
-                base_location="New York",
-                target_species=scenario['species'],
-                date_range="Spring 2024",
-                days=scenario['days'],
-                max_distance_per_day=scenario['max_distance']
-            )
-            
-            stats = plan['overall_stats']
-            print(f"   ✅ Results:")
-            print(f"      Total Species: {stats['total_species_expected']}")
-            print(f"      Total Distance: {stats['total_distance']:.1f} km")
-            print(f"      Success Rate: {stats['overall_success_probability']:.1%}")
-            print(f"      Efficiency: {stats['efficiency_score']:.1f}")
-            
-        except Exception as e:
-            print(f"   ❌ Failed: {e}")
+        stats = plan['overall_stats']
+        out.p(f"   ✅ Results:")
+        out.p(f"      Total Species: {stats['total_species_expected']}")
+        out.p(f"      Total Distance: {stats['total_distance']:.1f} km")
+        out.p(f"      Success Rate: {stats['overall_success_probability']:.1%}")
+        out.p(f"      Efficiency: {stats['efficiency_score']:.1f}")
+    out.flush()
     
     # Demo 4: Save and load plans
-    print("\n💾 Demo 4: Save and Load Plans")
-    print("-" * 40)
+    out.p("\n💾 Demo 4: Save and Load Plans")
+    out.p("-" * 40)
     
     # Save the basic plan
     output_dir = "demo_multi_day"
     os.makedirs(output_dir, exist_ok=True)
     
-    import json
-    with open(os.path.join(output_dir, 'demo_plan.json'), 'w') as f:
-        json.dump(basic_plan, f, indent=2, default=str)
-    
-    # Generate markdown report
-    from src.cli.main import generate_multi_day_markdown
+    # Generate markdown report; both files are written in the background
+    # while the rest of the demo runs
     markdown_content = generate_multi_day_markdown(basic_plan)
-    with open(os.path.join(output_dir, 'demo_plan.md'), 'w') as f:
-        f.write(markdown_content)
+    writer = ThreadPoolExecutor(max_workers=2)
+    pending_writes = [
+        writer.submit(_write_json, os.path.join(output_dir, 'demo_plan.json'), basic_plan),
+        writer.submit(_write_text, os.path.join(output_dir, 'demo_plan.md'), markdown_content),
+    ]
+    writer.shutdown(wait=False)
     
-    print(f"✅ Demo plan saved to {output_dir}/ directory")
-    print(f"📁 Files generated:")
-    print(f"   - {output_dir}/demo_plan.md (Complete plan report)")
-    print(f"   - {output_dir}/demo_plan.json (Structured data)")
+    out.p(f"✅ Demo plan saved to {output_dir}/ directory")
+    out.p(f"📁 Files generated:")
+    out.p(f"   - {output_dir}/demo_plan.md (Complete plan report)")
+    out.p(f"   - {output_dir}/demo_plan.json (Structured data)")
+    out.flush()
     
     # Demo 5: Feature comparison
-    print("\n📊 Demo 5: Feature Comparison")
-    print("-" * 40)
+    out.p("\n📊 Demo 5: Feature Comparison")
+    out.p("-" * 40)
     
-    print("🎯 Multi-Day Planning Features:")
-    print("   ✅ Daily route optimization")
-    print("   ✅ Distance-based planning")
-    print("   ✅ Success probability analysis")
-    print("   ✅ Efficiency scoring")
-    print("   ✅ Detailed daily schedules")
-    print("   ✅ Hotspot-specific recommendations")
-    print("   ✅ Species targeting per hotspot")
-    print("   ✅ Travel time calculations")
-    print("   ✅ Facility information")
-    print("   ✅ Best approach strategies")
+    out.p("🎯 Multi-Day Planning Features:")
+    out.p("   ✅ Daily route optimization")
+    out.p("   ✅ Distance-based planning")
+    out.p("   ✅ Success probability analysis")
+    out.p("   ✅ Efficiency scoring")
+    out.p("   ✅ Detailed daily schedules")
+    out.p("   ✅ Hotspot-specific recommendations")
+    out.p("   ✅ Species targeting per hotspot")
+    out.p("   ✅ Travel time calculations")
+    out.p("   ✅ Facility information")
+    out.p("   ✅ Best approach strategies")
     
-    print("\n💡 Benefits:")
-    print("   • More realistic for extended birding trips")
-    print("   • Better resource management")
-    print("   • Higher success rates through strategic planning")
-    print("   • Reduced fatigue and better enjoyment")
-    print("   • Comprehensive trip documentation")
-    print("   • Optimized for maximum species diversity")
-    print("   • Minimal walking distance")
-    print("   • Balanced daily schedules")
+    out.p("\n💡 Benefits:")
+    out.p("   • More realistic for extended birding trips")
+    out.p("   • Better resource management")
+    out.p("   • Higher success rates through strategic planning")
+    out.p("   • Reduced fatigue and better enjoyment")
+    out.p("   • Comprehensive trip documentation")
+    out.p("   • Optimized for maximum species diversity")
+    out.p("   • Minimal walking distance")
+    out.p("   • Balanced daily schedules")
+    out.flush()
+    
+    # Make sure the plan files are on disk before returning
+    for pending_write in pending_writes:
+        pending_write.result()
 
 
 def show_usage_examples():
     """Show usage examples for multi-day planning"""
-    print("\n📖 Usage Examples")
-    print("=" * 60)
+    out = Out()
+    out.p("\n📖 Usage Examples")
+    out.p("=" * 60)
     
-    print("\n🔧 CLI Usage:")
-    print("```bash")
-    print("# Basic multi-day planning")
-    print("python -m src.cli.main plan \\")
-    print("  --species \"American Robin\" \"Northern Cardinal\" \"Blue Jay\" \\")
-    print("  --location \"New York\" \\")
-    print("  --date \"Spring 2024\" \\")
-    print("  --multi-day 3 \\")
-    print("  --max-distance-per-day 30 \\")
-    print("  --output \"my_trip\"")
-    print()
-    print("# Optimized efficiency planning")
-    print("python -m src.cli.main plan \\")
-    print("  --species \"American Robin\" \"Northern Cardinal\" \"Blue Jay\" \\")
-    print("  --location \"New York\" \\")
-    print("  --date \"Spring 2024\" \\")
-    print("  --multi-day 5 \\")
-    print("  --max-distance-per-day 25 \\")
-    print("  --optimize-efficiency \\")
-    print("  --output \"efficient_trip\"")
-    print("```")
+    out.p("\n🔧 CLI Usage:")
+    out.p("```bash")
+    out.p("# Basic multi-day planning")
+    out.p("python -m src.cli.main plan \\")
+    out.p("  --species \"American Robin\" \"Northern Cardinal\" \"Blue Jay\" \\")
+    out.p("  --location \"New York\" \\")
+    out.p("  --date \"Spring 2024\" \\")
+    out.p("  --multi-day 3 \\")
+    out.p("  --max-distance-per-day 30 \\")
+    out.p("  --output \"my_trip\"")
+    out.p()
+    out.p("# Optimized efficiency planning")
+    out.p("python -m src.cli.main plan \\")
+    out.p("  --species \"American Robin\" \"Northern Cardinal\" \"Blue Jay\" \\")
+    out.p("  --location \"New York\" \\")
+    out.p("  --date \"Spring 2024\" \\")
+    out.p("  --multi-day 5 \\")
+    out.p("  --max-distance-per-day 25 \\")
+    out.p("  --optimize-efficiency \\")
+    out.p("  --output \"efficient_trip\"")
+    out.p("```")
     
-    print("\n🐍 Programmatic Usage:")
-    print("```python")
-    print("from src.core.route_service import RouteService")
-    print("from src.config.settings import get_settings")
-    print()
-    print("# Initialize service")
-    print("settings = get_settings()")
-    print("route_service = RouteService()")
-    print()
-    print("# Create multi-day plan")
-    print("plan = route_service.create_multi_day_plan(")
-    print("    base_location=\"New York\",")
-    print("    target_species=[\"American Robin\", \"Northern Cardinal\", \"Blue Jay\"],")
-    print("    date_range=\"Spring 2024\",")
-    print("    days=3,")
-    print("    max_distance_per_day=30.0")
-    print(")")
-    print()
-    print("# Access plan details")
-    print("print(f\"Total species expected: {plan['overall_stats']['total_species_expected']}\")")
-    print("print(f\"Total distance: {plan['overall_stats']['total_distance']:.1f} km\")")
-    print("print(f\"Success probability: {plan['overall_stats']['overall_success_probability']:.1%}\")")
-    print("```")
+    out.p("\n🐍 Programmatic Usage:")
+    out.p("```python")
+    out.p("from src.core.route_service import RouteService")
+    out.p("from src.config.settings import get_settings")
+    out.p()
+    out.p("# Initialize service")
+    out.p("settings = get_settings()")
+    out.p("route_service = RouteService()")
+    out.p()
+    out.p("# Create multi-day plan")
+    out.p("plan = route_service.create_multi_day_plan(")
+    out.p("    base_location=\"New York\",")
+    out.p("    target_species=[\"American Robin\", \"Northern Cardinal\", \"Blue Jay\"],")
+    out.p("    date_range=\"Spring 2024\",")
+    out.p("    days=3,")
+    out.p("    max_distance_per_day=30.0")
+    out.p(")")
+    out.p()
+    out.p("# Access plan details")
+    out.p("print(f\"Total species expected: {plan['overall_stats']['total_species_expected']}\")")
+    out.p("print(f\"Total distance: {plan['overall_stats']['total_distance']:.1f} km\")")
+    out.p("print(f\"Success probability: {plan['overall_stats']['overall_success_probability']:.1%}\")")
+    out.p("```")
+    out.flush()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,27 @@
+"""
+Buffered console output for the demo scripts.
+Collects report lines and writes each demo section to stdout in one call.
+"""
+
+import sys
+
+
+class Out:
+    """Line buffer for demo output."""
+
+    def __init__(self):
+        self.buf = []
+
+    def p(self, *args):
+        """Buffer one line, like print()."""
+        self.buf.append(" ".join(map(str, args)) + "\n")
+
+    def write(self, text):
+        """Buffer already formatted text as is."""
+        self.buf.append(text)
+
+    def flush(self):
+        """Write the buffered lines to stdout and clear the buffer."""
+        if self.buf:
+            sys.stdout.write("".join(self.buf))
+            self.buf.clear()
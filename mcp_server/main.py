@@ -5,17 +5,83 @@ Orchestrates all modules to create comprehensive birding trip plans.
 
 import sys
 import os
-from typing import Dict, List, Optional
+import copy
+import filecmp
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Optional, Union
 from datetime import datetime
+from pathlib import Path
 
-# Add the agents directory to the path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'agents'))
+# When run directly as a script, make the project root importable
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import all agent modules
-from bird_info_agent import get_species_planning_summary, get_species_availability
-from tier_classifier import classify_species_by_name, get_tier_challenge
-from route_planner import optimize_route
-from content_writer import generate_trip_plan_markdown, generate_story_card, generate_social_caption
+from agents.bird_info_agent import SPECIES_DATABASE, get_species_planning_summary, get_species_availability
+from agents.tier_classifier import BIRD_DATABASE, classify_species_by_name, get_tier_challenge
+from agents.route_planner import optimize_route
+from agents.content_writer import generate_trip_plan_markdown, generate_story_card, generate_social_caption
+from mcp_server.species_cache import persistent_cache
+from src.models.trip import month_from_date_range
+
+# Species lookups are pure functions of small hashable inputs and the same
+# species recur across plans, so memoize them for the life of the process
+# and, when BIRDING_CACHE_PATH is set, persist them across runs in the
+# on-disk species cache. Only database species are persisted; unknown
+# species get generated mock data that must not be replayed as real.
+_classify_species_cached = lru_cache(maxsize=1024)(
+    persistent_cache("classification", "species",
+                     cacheable=lambda species: species in BIRD_DATABASE)(classify_species_by_name)
+)
+_species_planning_summary_cached = lru_cache(maxsize=1024)(
+    persistent_cache("availability", "species", "month", "region",
+                     cacheable=lambda species, month, region: species in SPECIES_DATABASE)(get_species_planning_summary)
+)
+
+def classify_species_by_name(species: str) -> Dict:
+    """
+    Classify a species into its tier.
+    Results are cached per species; each call gets its own copy.
+    """
+    return copy.deepcopy(_classify_species_cached(species))
+
+def get_species_planning_summary(species: str, month: str, region: str) -> Dict:
+    """
+    Get the planning summary for a species in a month and region.
+    Results are cached per input; each call gets its own copy.
+    """
+    return copy.deepcopy(_species_planning_summary_cached(species, month, region))
+
+# Progress messages for trip planning; one stdout handler, configured once
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+# Worker threads used to fan out the per-species agent calls
+MAX_SPECIES_WORKERS = 8
+
+# Worker threads used to write trip plan files concurrently
+MAX_WRITE_WORKERS = 8
+
+# Characters in species names that are not safe in story card file names
+_SPACE_TO_UNDERSCORE = str.maketrans({' ': '_', '/': '_'})
+
+# Species availability region for each supported base location
+_REGION_MAPPING = MappingProxyType({
+    "New York": "Northeast",
+    "Boston": "Northeast",
+    "Chicago": "Midwest",
+    "Miami": "Southeast",
+    "San Francisco": "West Coast"
+})
 
 def parse_user_input(user_input: Dict) -> Dict:
     """
@@ -26,9 +92,9 @@ def parse_user_input(user_input: Dict) -> Dict:
     base_location = user_input.get("location", "New York")
     date_range = user_input.get("date_range", "Spring 2024")
     
-    # Validate species list
-    if not species or not isinstance(species, list):
-        species = ["American Robin", "Northern Cardinal", "Blue Jay"]
+    # Validate species list; keep it as a tuple so it is immutable and hashable
+    if not species or not isinstance(species, (list, tuple)):
+        species = ("American Robin", "Northern Cardinal", "Blue Jay")
     
     # Validate location
     valid_locations = ["New York", "Boston", "Chicago", "Miami", "San Francisco"]
@@ -36,85 +102,106 @@ def parse_user_input(user_input: Dict) -> Dict:
         base_location = "New York"
     
     return {
-        "species": species,
+        "species": tuple(species),
         "base_location": base_location,
         "date_range": date_range
     }
 
-def generate_complete_trip_plan(user_input: Dict) -> Dict:
+@dataclass
+class SpeciesPlanRecord:
+    """
+    Agent results for one target species.
+    """
+    species: str
+    classification: Dict
+    availability: Dict
+    story: str
+    caption: str
+
+def _plan_species(species: str, base_location: str, month: str, region: str) -> SpeciesPlanRecord:
+    """
+    Run the per-species agents for one target species.
+    """
+    classification = classify_species_by_name(species)
+    return SpeciesPlanRecord(
+        species=species,
+        classification=classification,
+        availability=get_species_planning_summary(species, month, region),
+        story=generate_story_card(species, base_location),
+        caption=generate_social_caption(classification['species'], base_location, classification['tier'])
+    )
+
+def generate_complete_trip_plan(user_input: Dict, stream_markdown: bool = False) -> Dict:
     """
     Generate a complete birding trip plan using all modules.
+    With stream_markdown=True the trip plan Markdown is left as a lazy chunk
+    iterator, for callers that only write it out once (see save_trip_plan).
     """
     # Parse user input
     parsed_input = parse_user_input(user_input)
     
-    print(f"Planning birding trip for {parsed_input['species']} from {parsed_input['base_location']}")
-    print("=" * 60)
+    logger.info("Planning birding trip for %s from %s\n%s",
+                list(parsed_input['species']), parsed_input['base_location'], "=" * 60)
+    
+    species_list = parsed_input['species']
+    base_location = parsed_input['base_location']
+    date_range = parsed_input['date_range']
+    
+    # Extract month from date range for availability check
+    month = extract_month_from_date_range(date_range)
+    region = get_region_from_location(base_location)
     
-    # Step 1: Classify species into tiers
-    print("1. Classifying species into tiers...")
-    species_data = []
-    for species in parsed_input['species']:
-        classification = classify_species_by_name(species)
-        species_data.append(classification)
-        print(f"   {species}: {classification['tier']} - {classification['description']}")
+    # Each species needs its own chain of agent calls, so run one chain per
+    # species in the pool, alongside the route which depends on all of them.
+    with ThreadPoolExecutor(max_workers=MAX_SPECIES_WORKERS) as executor:
+        route_future = executor.submit(optimize_route, base_location, species_list, date_range)
+        records = list(executor.map(
+            lambda species: _plan_species(species, base_location, month, region), species_list
+        ))
+        route_data = route_future.result()
+    
+    # Step 1: Classify species into tiers (each step's status lines are
+    # collected and logged in one call)
+    lines = ["1. Classifying species into tiers..."]
+    lines.extend(
+        f"   {record.species}: {record.classification['tier']} - {record.classification['description']}"
+        for record in records
+    )
+    logger.info("\n".join(lines))
     
     # Step 2: Get species availability and planning data
-    print("\n2. Analyzing species availability...")
-    species_availability = []
-    for species in parsed_input['species']:
-        # Extract month from date range for availability check
-        month = extract_month_from_date_range(parsed_input['date_range'])
-        region = get_region_from_location(parsed_input['base_location'])
-        
-        availability = get_species_planning_summary(species, month, region)
-        species_availability.append(availability)
-        print(f"   {species}: {availability['confidence_score']}% confidence in {region} during {month}")
+    lines = ["\n2. Analyzing species availability..."]
+    lines.extend(
+        f"   {record.species}: {record.availability['confidence_score']}% confidence in {region} during {month}"
+        for record in records
+    )
+    logger.info("\n".join(lines))
     
     # Step 3: Plan optimized route
-    print("\n3. Planning optimized route...")
-    route_data = optimize_route(
-        parsed_input['base_location'],
-        parsed_input['species'],
-        parsed_input['date_range']
-    )
+    logger.info("\n3. Planning optimized route...")
     
     if "error" in route_data:
-        print(f"   Error: {route_data['error']}")
+        logger.info("   Error: %s", route_data['error'])
         return {"error": route_data["error"]}
     
-    print(f"   Route planned: {route_data['total_stops']} stops, {route_data['total_distance_km']:.1f} km")
+    logger.info("   Route planned: %s stops, %.1f km", route_data['total_stops'], route_data['total_distance_km'])
     
     # Step 4: Generate content
-    print("\n4. Generating trip content...")
+    logger.info("\n4. Generating trip content...")
     
-    # Generate Markdown trip plan
-    trip_plan_markdown = generate_trip_plan_markdown(route_data, species_data)
+    species_data = [record.classification for record in records]
     
-    # Generate story cards for each species
-    story_cards = []
-    for species in parsed_input['species']:
-        story = generate_story_card(species, parsed_input['base_location'])
-        story_cards.append({
-            "species": species,
-            "story": story
-        })
+    # Generate Markdown trip plan
+    trip_plan_markdown = generate_trip_plan_markdown(route_data, species_data, stream=stream_markdown)
     
-    # Generate social media captions
-    social_captions = []
-    for species_info in species_data:
-        caption = generate_social_caption(
-            species_info['species'],
-            parsed_input['base_location'],
-            species_info['tier']
-        )
-        social_captions.append({
-            "species": species_info['species'],
-            "tier": species_info['tier'],
-            "caption": caption
-        })
+    # Collect story cards and social media captions
+    story_cards = [{"species": record.species, "story": record.story} for record in records]
+    social_captions = [
+        {"species": record.classification['species'], "tier": record.classification['tier'], "caption": record.caption}
+        for record in records
+    ]
     
-    print("   Content generated successfully!")
+    logger.info("   Content generated successfully!")
     
     # Step 5: Compile complete plan
     complete_plan = {
@@ -128,7 +215,7 @@ def generate_complete_trip_plan(user_input: Dict) -> Dict:
         },
         "species_analysis": {
             "classifications": species_data,
-            "availability": species_availability
+            "availability": [record.availability for record in records]
         },
         "route_plan": route_data,
         "content": {
@@ -144,80 +231,95 @@ def extract_month_from_date_range(date_range: str) -> str:
     """
     Extract month from date range string.
     """
-    month_mapping = {
-        "spring": "April",
-        "summer": "July", 
-        "fall": "October",
-        "winter": "January",
-        "Spring": "April",
-        "Summer": "July",
-        "Fall": "October", 
-        "Winter": "January"
-    }
-    
-    for season, month in month_mapping.items():
-        if season in date_range:
-            return month
-    
-    # Default to April if no season found
-    return "April"
+    return month_from_date_range(date_range)
 
 def get_region_from_location(location: str) -> str:
     """
     Map location to region for species availability.
     """
-    region_mapping = {
-        "New York": "Northeast",
-        "Boston": "Northeast", 
-        "Chicago": "Midwest",
-        "Miami": "Southeast",
-        "San Francisco": "West Coast"
-    }
+    return _REGION_MAPPING.get(location, "Northeast")
+
+def _write_text(path: Path, content: Union[str, Iterable[str]]) -> bool:
+    """
+    Write a text file from a string or an iterable of chunks and return
+    whether it was written. A file whose current contents on disk already
+    match is left untouched.
+    """
+    if isinstance(content, str):
+        try:
+            if path.read_text(encoding='utf-8') == content:
+                return False
+        except (OSError, UnicodeDecodeError):
+            pass
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return True
     
-    return region_mapping.get(location, "Northeast")
+    # Stream the chunks into a temporary file and only replace the target
+    # when its contents differ
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.writelines(content)
+    if path.exists() and filecmp.cmp(tmp_path, path, shallow=False):
+        tmp_path.unlink()
+        return False
+    os.replace(tmp_path, path)
+    return True
+
+def _story_card_text(story_card: Dict, trip_overview: Dict) -> str:
+    """
+    Build the contents of a single story card file.
+    """
+    return "".join([
+        f"Species: {story_card['species']}\n",
+        f"Location: {trip_overview['base_location']}\n",
+        f"Date: {trip_overview['date_range']}\n",
+        "\n" + "="*50 + "\n\n",
+        story_card['story']
+    ])
+
+def _social_captions_text(social_captions: List[Dict]) -> str:
+    """
+    Build the contents of the social media captions file.
+    """
+    parts = ["Social Media Captions\n", "=" * 30 + "\n\n"]
+    for caption_data in social_captions:
+        parts.append(f"Species: {caption_data['species']} (Tier {caption_data['tier']})\n")
+        parts.append(f"Caption: {caption_data['caption']}\n")
+        parts.append("\n" + "-"*50 + "\n\n")
+    return "".join(parts)
 
 def save_trip_plan(complete_plan: Dict, output_dir: str = "output") -> str:
     """
     Save the complete trip plan to files.
-    """
-    import os
-    
-    # Create output directory if it doesn't exist
-    os.makedirs(output_dir, exist_ok=True)
     
-    # Save main trip plan
-    trip_plan_path = os.path.join(output_dir, "trip_plan.md")
-    with open(trip_plan_path, 'w', encoding='utf-8') as f:
-        f.write(complete_plan['content']['trip_plan_markdown'])
-    
-    # Save story cards
-    story_cards_dir = os.path.join(output_dir, "story_cards")
-    os.makedirs(story_cards_dir, exist_ok=True)
+    The files are independent, so they are written concurrently; the call
+    returns once every write has finished.
+    """
+    # Create the output directory and its story_cards subdirectory in one call
+    output_path = Path(output_dir)
+    (output_path / "story_cards").mkdir(parents=True, exist_ok=True)
     
+    # Collect (name relative to output_dir, content) for every file
+    artifacts = [("trip_plan.md", complete_plan['content']['trip_plan_markdown'])]
     for i, story_card in enumerate(complete_plan['content']['story_cards']):
-        story_path = os.path.join(story_cards_dir, f"story_{i+1:02d}_{story_card['species'].replace(' ', '_')}.txt")
-        with open(story_path, 'w', encoding='utf-8') as f:
-            f.write(f"Species: {story_card['species']}\n")
-            f.write(f"Location: {complete_plan['trip_overview']['base_location']}\n")
-            f.write(f"Date: {complete_plan['trip_overview']['date_range']}\n")
-            f.write("\n" + "="*50 + "\n\n")
-            f.write(story_card['story'])
+        story_name = f"story_cards/story_{i+1:02d}_{story_card['species'].translate(_SPACE_TO_UNDERSCORE)}.txt"
+        artifacts.append((story_name, _story_card_text(story_card, complete_plan['trip_overview'])))
+    artifacts.append(("social_captions.txt", _social_captions_text(complete_plan['content']['social_captions'])))
     
-    # Save social captions
-    captions_path = os.path.join(output_dir, "social_captions.txt")
-    with open(captions_path, 'w', encoding='utf-8') as f:
-        f.write("Social Media Captions\n")
-        f.write("=" * 30 + "\n\n")
-        for caption_data in complete_plan['content']['social_captions']:
-            f.write(f"Species: {caption_data['species']} (Tier {caption_data['tier']})\n")
-            f.write(f"Caption: {caption_data['caption']}\n")
-            f.write("\n" + "-"*50 + "\n\n")
+    # Write files whose contents on disk differ from the new plan
+    with ThreadPoolExecutor(max_workers=MAX_WRITE_WORKERS) as executor:
+        futures = [executor.submit(_write_text, output_path / name, content) for name, content in artifacts]
+        # Surface any write error
+        for future in futures:
+            future.result()
     
     return f"Trip plan saved to {output_dir}/ directory"
 
-def run_planner():
+def run_planner(verbose: bool = False):
     """
     Main entry point for the Birding Planner.
+    A traceback is printed on errors only when verbose is set.
     """
     print("🦅 Welcome to BirdingPlanner!")
     print("Your AI-powered birding trip companion")
@@ -232,7 +334,7 @@ def run_planner():
     
     try:
         # Generate complete trip plan
-        complete_plan = generate_complete_trip_plan(example_input)
+        complete_plan = generate_complete_trip_plan(example_input, stream_markdown=True)
         
         if "error" in complete_plan:
             print(f"❌ Error: {complete_plan['error']}")
@@ -263,8 +365,9 @@ def run_planner():
         
     except Exception as e:
         print(f"❌ An error occurred: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        if verbose:
+            import traceback
+            traceback.print_exc()
 
 if __name__ == "__main__":
-    run_planner()
+    run_planner(verbose="--verbose" in sys.argv[1:] or "-v" in sys.argv[1:])
@@ -0,0 +1,147 @@
+"""
+Persistent species cache for Birding Planner
+Keeps species agent results in a local SQLite database so repeated planner
+runs skip the agent calls for database species they have already looked up.
+The cache is opt-in: it is only used when BIRDING_CACHE_PATH is set.
+"""
+
+import atexit
+import json
+import os
+import sqlite3
+import threading
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+# Cache database location; the cache is disabled unless BIRDING_CACHE_PATH
+# names a database file, e.g. ~/.birdingplanner/cache.sqlite
+CACHE_PATH = os.path.expanduser(os.environ.get("BIRDING_CACHE_PATH", ""))
+
+# Bump whenever the agents' data or result format changes; a database written
+# with another version is cleared when it is opened
+CACHE_VERSION = "1"
+
+# One table per cached agent call, keyed by the call arguments, plus a meta
+# table recording the cache version
+_TABLES = ("classification", "availability")
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS meta ("
+    "key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS classification ("
+    "species TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS availability ("
+    "species TEXT, month TEXT, region TEXT, value TEXT NOT NULL, "
+    "PRIMARY KEY (species, month, region))",
+)
+
+# One connection for the whole process, opened on first use and shared by
+# every worker thread; _lock serializes its use. _opened_for records the
+# (path, version) it was opened for, so changing either reopens it.
+_lock = threading.Lock()
+_connection: Optional[sqlite3.Connection] = None
+_opened_for: Optional[Tuple[str, str]] = None
+
+def _open(path: str) -> sqlite3.Connection:
+    """
+    Open the cache database, creating its tables and clearing entries
+    written by a different cache version.
+    """
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path, timeout=10, isolation_level=None, check_same_thread=False)
+    try:
+        # WAL lets other processes read while this one writes
+        connection.execute("PRAGMA journal_mode=WAL")
+        for statement in _SCHEMA:
+            connection.execute(statement)
+
+        row = connection.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is None or row[0] != CACHE_VERSION:
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                for table in _TABLES:
+                    connection.execute(f"DELETE FROM {table}")
+                connection.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (CACHE_VERSION,)
+                )
+    except sqlite3.Error:
+        connection.close()
+        raise
+    return connection
+
+def _close() -> None:
+    """
+    Close the shared cache connection, if one is open.
+    """
+    global _connection, _opened_for
+    with _lock:
+        if _connection is not None:
+            _connection.close()
+        _connection = None
+        _opened_for = None
+
+atexit.register(_close)
+
+def _connect() -> Optional[sqlite3.Connection]:
+    """
+    Return the shared cache connection, or None if the cache is disabled
+    or cannot be opened. Must be called with _lock held.
+    """
+    global _connection, _opened_for
+    if _opened_for != (CACHE_PATH, CACHE_VERSION):
+        if _connection is not None:
+            _connection.close()
+        _connection = None
+        if CACHE_PATH:
+            try:
+                _connection = _open(CACHE_PATH)
+            except (OSError, sqlite3.Error):
+                _connection = None
+        _opened_for = (CACHE_PATH, CACHE_VERSION)
+    return _connection
+
+def persistent_cache(table: str, *key_columns: str,
+                     cacheable: Optional[Callable[..., bool]] = None) -> Callable:
+    """
+    Cache a function's JSON-serializable results in the given table, keyed
+    by its positional arguments. Lookups fall back to calling the function
+    whenever the cache is disabled or an entry cannot be read. If given,
+    cacheable(*key) decides which calls may use the cache at all, e.g. to
+    keep generated mock data out of it.
+    """
+    where = " AND ".join(f"{column} = ?" for column in key_columns)
+    select_sql = f"SELECT value FROM {table} WHERE {where}"
+    insert_sql = (
+        f"INSERT OR REPLACE INTO {table} ({', '.join(key_columns)}, value) "
+        f"VALUES ({', '.join('?' * (len(key_columns) + 1))})"
+    )
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*key):
+            if cacheable is not None and not cacheable(*key):
+                return func(*key)
+
+            with _lock:
+                connection = _connect()
+                try:
+                    row = None if connection is None else connection.execute(select_sql, key).fetchone()
+                    if row is not None:
+                        return json.loads(row[0])
+                except Exception:
+                    # Any unreadable entry is treated as a cache miss
+                    pass
+            if connection is None:
+                return func(*key)
+
+            result = func(*key)
+            with _lock:
+                connection = _connect()
+                try:
+                    if connection is not None:
+                        connection.execute(insert_sql, (*key, json.dumps(result)))
+                except (sqlite3.Error, TypeError, ValueError):
+                    pass
+            return result
+        return wrapper
+    return decorator
@@ -3,16 +3,24 @@ BirdingPlanner - AI-powered birding trip planning system
 A comprehensive platform for personalized birdwatching adventures.
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "BirdingPlanner Team"
 __description__ = "AI-assisted birding trip planning with tier-based species classification"
 
-from .core.birding_planner import BirdingPlanner
-from .mcp.server import MCPServer
-from .mcp.orchestrator import AgentOrchestrator
-from .models.species import Species, SpeciesTier
-from .models.route import Route, RouteStop
-from .models.trip import TripPlan
+# Public names and the submodules that define them; loaded on first access
+# (PEP 562) so lightweight entry points don't import the whole stack
+_LAZY_IMPORTS = {
+    "BirdingPlanner": ".core.birding_planner",
+    "MCPServer": ".mcp.server",
+    "AgentOrchestrator": ".mcp.orchestrator",
+    "Species": ".models.species",
+    "SpeciesTier": ".models.species",
+    "Route": ".models.route",
+    "RouteStop": ".models.route",
+    "TripPlan": ".models.trip",
+}
 
 __all__ = [
     "BirdingPlanner",
@@ -23,4 +31,18 @@ __all__ = [
     "Route",
     "RouteStop",
     "TripPlan"
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import public names from their submodules on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,23 +2,49 @@
 Command-line interface for BirdingPlanner.
 """
 
-import argparse
 import sys
 from pathlib import Path
-from typing import List, Dict
+from types import SimpleNamespace
+from typing import List, Dict, Optional, TYPE_CHECKING
 import os
+from bisect import bisect_left
+from enum import Enum
+from functools import lru_cache
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Add the project root to the path only when run as a script; installed and
+# `python -m src.cli.main` runs go through the package (see the
+# `birdingplanner` console script in pyproject.toml)
+if __name__ == "__main__" and not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.core.birding_planner import BirdingPlanner
-from src.mcp.server import MCPServer
-from src.models.trip import TripRequest
-from src.config.settings import get_settings
+# Settings, the planner and MCP server module graphs, and the serialization
+# modules only used by --multi-day are imported on first use, so help and
+# argument errors stay fast
+if TYPE_CHECKING:
+    import argparse
+    from src.core.birding_planner import BirdingPlanner
+    from src.mcp.server import MCPServer
 
 
-def create_parser() -> argparse.ArgumentParser:
+def parse_fast_args(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Parse the simple `info` and `species` invocations without building argparse.
+    
+    Returns None for anything else (including help and malformed input) so the
+    full parser handles it and reports errors as usual.
+    """
+    if argv == ['info']:
+        return SimpleNamespace(command='info')
+    if argv == ['species', '--list']:
+        return SimpleNamespace(command='species', list=True, name=None)
+    if len(argv) == 3 and argv[:2] == ['species', '--name'] and not argv[2].startswith('-'):
+        return SimpleNamespace(command='species', list=False, name=argv[2])
+    return None
+
+
+def create_parser() -> 'argparse.ArgumentParser':
     """Create command-line argument parser."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="BirdingPlanner - AI-powered birding trip planning system",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -68,7 +94,8 @@ Examples:
     plan_parser.add_argument('--ai', action='store_true', 
                            help='Use AI-enhanced planning with MCP server')
     plan_parser.add_argument('--verbose', action='store_true',
-                           help='Show detailed output')
+                           help='Show detailed output, including success probabilities '
+                                'for 1-5 stops with --min-stops or --success-rate')
     
     # Add multi-day planning arguments
     plan_parser.add_argument('--multi-day', type=int, metavar='DAYS',
@@ -77,6 +104,12 @@ Examples:
                            help='Maximum walking distance per day in km (default: 50.0)')
     plan_parser.add_argument('--optimize-efficiency', action='store_true',
                            help='Optimize for maximum species per distance walked')
+    plan_parser.add_argument('--cache', action='store_true',
+                           help='Reuse and store multi-day plans under <output>/.cache')
+    plan_parser.add_argument('--input-cache', metavar='FILE',
+                           help='Read the cached multi-day plan from FILE')
+    plan_parser.add_argument('--output-cache', metavar='FILE',
+                           help='Write the multi-day plan cache to FILE')
     
     # Species command
     species_parser = subparsers.add_parser('species', help='Species information')
@@ -101,217 +134,299 @@ Examples:
     return parser
 
 
-def plan_command(args, planner: BirdingPlanner, mcp_server: MCPServer = None):
+# Daily schedule lines in the multi-day plan display
+_SCHEDULE_ITEM_TMPL = "     {time}: {activity} ({duration})"
+_SCHEDULE_TARGET_TMPL = "        Target: {}"
+
+
+def _render_travel_item(schedule_item: Dict, emit):
+    """Render a travel entry of a daily schedule."""
+    emit(_SCHEDULE_ITEM_TMPL.format_map(schedule_item))
+
+
+def _render_birding_item(schedule_item: Dict, emit):
+    """Render a birding entry of a daily schedule with its target species."""
+    emit(_SCHEDULE_ITEM_TMPL.format_map(schedule_item))
+    if schedule_item['target_species']:
+        emit(_SCHEDULE_TARGET_TMPL.format(', '.join(schedule_item['target_species'])))
+
+
+# Renderer for each schedule entry type; other types render as birding entries
+_SCHEDULE_RENDERERS = {
+    'travel': _render_travel_item,
+    'birding': _render_birding_item,
+}
+
+
+def plan_command(args, planner: 'BirdingPlanner', mcp_server: 'MCPServer' = None):
     """Handle the plan command."""
-    print("🦅 BirdingPlanner - Creating Your Trip Plan")
-    print("=" * 50)
+    # Output is collected and written in batches: flush() runs before calls into
+    # services that report their own progress, and on every exit path
+    out = []
+    emit = out.append
     
-    # Get route service for success probability calculations
-    route_service = planner.route_service
+    def flush():
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
+            out.clear()
     
-    # Show success probability analysis if requested
-    if args.min_stops or args.success_rate:
-        print("📊 Success Probability Analysis")
-        print("-" * 30)
+    try:
+        emit("🦅 BirdingPlanner - Creating Your Trip Plan")
+        emit("=" * 50)
         
-        min_stops_info = route_service.calculate_success_probability(args.location, args.species, 1)
-        if "error" not in min_stops_info:
-            recommended_stops = min_stops_info.get("recommended_min_stops", {}).get("recommended_stops", 1)
-            reasoning = min_stops_info.get("recommended_min_stops", {}).get("reasoning", "Unknown")
-            
-            print(f"Recommended minimum stops: {recommended_stops}")
-            print(f"Reasoning: {reasoning}")
-            print()
-            
-            print("Success probabilities by stop count:")
-            for stops in range(1, 6):
-                success_info = route_service.calculate_success_probability(args.location, args.species, stops)
-                if "error" not in success_info:
-                    print(f"   {stops} stop(s): {success_info['overall_success_rate']:.1%} overall success rate")
-    
-    # Handle multi-day planning
-    if args.multi_day:
-        print(f"🗺️ Creating {args.multi_day}-day optimized birding plan...")
-        print(f"📍 Base Location: {args.location}")
-        print(f"🎯 Target Species: {', '.join(args.species)}")
-        print(f"📅 Date Range: {args.date}")
-        print(f"🚶 Max Distance per Day: {args.max_distance_per_day} km")
-        print()
+        # Get route service for success probability calculations
+        route_service = planner.route_service
         
-        # Create multi-day plan
-        multi_day_plan = route_service.create_multi_day_plan(
-            base_location=args.location,
-            target_species=args.species,
-            date_range=args.date,
-            days=args.multi_day,
-            max_distance_per_day=args.max_distance_per_day
-        )
+        # Normalize the species once; downstream services get an immutable tuple
+        args.species = tuple(args.species)
+        species_str = ', '.join(args.species)
         
-        # Display multi-day plan
-        print("📋 Multi-Day Birding Plan Summary")
-        print("=" * 50)
+        # The same probabilities are asked for several times below, so the first
+        # lookup computes the whole 1-5 stop table in one batch and later lookups
+        # index into it
+        stop_counts = tuple(range(1, 6))
+        probability_table = {}
         
-        overall_stats = multi_day_plan['overall_stats']
-        print(f"🎯 Overall Statistics:")
-        print(f"   Total Species Expected: {overall_stats['total_species_expected']}")
-        print(f"   Total Distance: {overall_stats['total_distance']:.1f} km")
-        print(f"   Average Distance per Day: {overall_stats['average_distance_per_day']:.1f} km")
-        print(f"   Overall Success Probability: {overall_stats['overall_success_probability']:.1%}")
-        print(f"   Species Coverage: {overall_stats['species_coverage']:.1%}")
-        print(f"   Efficiency Score: {overall_stats['efficiency_score']:.1f} species per 10km")
-        print()
+        def success_probability(stops: int) -> Dict:
+            if stops not in probability_table:
+                probability_table.update(route_service.calculate_success_probability_batch(
+                    args.location, list(args.species), stop_counts if stops in stop_counts else (stops,)
+                ))
+            return probability_table[stops]
         
-        # Display daily plans with detailed routes
-        for day_plan in multi_day_plan['daily_plans']:
-            print(f"📅 Day {day_plan['day']}")
-            print(f"   Expected Species: {len(day_plan['expected_species'])}")
-            print(f"   Total Distance: {day_plan['total_distance']:.1f} km")
-            print(f"   Success Probability: {day_plan['day_success_probability']:.1%}")
-            print(f"   Efficiency Score: {day_plan['efficiency_score']:.1f}")
-            
-            # Show daily summary
-            if 'daily_summary' in day_plan:
-                print(f"   Summary: {day_plan['daily_summary']}")
+        # Show success probability analysis if requested
+        if args.min_stops or args.success_rate:
+            emit("📊 Success Probability Analysis")
+            emit("-" * 30)
             
-            # Show detailed route stops
-            if 'route_stops' in day_plan and day_plan['route_stops']:
-                print(f"   Detailed Route:")
-                for route_stop in day_plan['route_stops']:
-                    print(f"     Stop {route_stop['stop_number']}: {route_stop['hotspot_name']}")
-                    print(f"        Time: {route_stop['viewing_time']}")
-                    print(f"        Distance: {route_stop['distance_from_previous']:.1f} km")
-                    print(f"        Target Species: {', '.join(route_stop['target_species'])}")
-                    print(f"        Success Rate: {route_stop['success_probability']:.1%}")
-                    if route_stop['recommendations']:
-                        print(f"        Tips: {route_stop['recommendations'][0]}")
-                    print()
-            
-            # Show daily schedule
-            if 'daily_schedule' in day_plan and day_plan['daily_schedule']:
-                print(f"   Daily Schedule:")
-                for schedule_item in day_plan['daily_schedule']:
-                    if schedule_item['type'] == 'travel':
-                        print(f"     {schedule_item['time']}: {schedule_item['activity']} ({schedule_item['duration']})")
-                    else:
-                        print(f"     {schedule_item['time']}: {schedule_item['activity']} ({schedule_item['duration']})")
-                        if schedule_item['target_species']:
-                            print(f"        Target: {', '.join(schedule_item['target_species'])}")
-            print()
-        
-        # Save multi-day plan
-        output_dir = args.output
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # Save as JSON for programmatic access
-        import json
-        with open(os.path.join(output_dir, 'multi_day_plan.json'), 'w') as f:
-            json.dump(multi_day_plan, f, indent=2, default=str)
-        
-        # Generate markdown report
-        markdown_content = generate_multi_day_markdown(multi_day_plan)
-        with open(os.path.join(output_dir, 'multi_day_plan.md'), 'w') as f:
-            f.write(markdown_content)
-        
-        print(f"✅ Multi-day plan saved to {output_dir}/ directory")
-        print(f"📁 Files generated:")
-        print(f"   - {output_dir}/multi_day_plan.md (Complete plan report)")
-        print(f"   - {output_dir}/multi_day_plan.json (Structured data)")
+            min_stops_info = success_probability(1)
+            if "error" not in min_stops_info:
+                recommended_stops = min_stops_info.get("recommended_min_stops", {}).get("recommended_stops", 1)
+                reasoning = min_stops_info.get("recommended_min_stops", {}).get("reasoning", "Unknown")
+                
+                emit(f"Recommended minimum stops: {recommended_stops}")
+                emit(f"Reasoning: {reasoning}")
+                emit("")
+                
+                if args.verbose:
+                    emit("Success probabilities by stop count:")
+                    for stops in stop_counts:
+                        success_info = success_probability(stops)
+                        if "error" not in success_info:
+                            emit(f"   {stops} stop(s): {success_info['overall_success_rate']:.1%} overall success rate")
         
-        return
-    
-    optimal_stops = args.stops
-    if args.success_rate:
-        # Logic to find minimum stops that meet target success rate
-        for stops in range(1, 6):
-            success_info = route_service.calculate_success_probability(args.location, args.species, stops)
-            if "error" not in success_info and success_info["overall_success_rate"] >= args.success_rate:
-                optimal_stops = stops
-                break
-        else:
-            optimal_stops = 5  # Use maximum if target can't be met
-    elif args.min_stops:
-        optimal_stops = min_stops_info.get("recommended_min_stops", {}).get("recommended_stops", 1)
-    
-    # Create trip request
-    request = TripRequest(
-        species=args.species,
-        base_location=args.location,
-        date_range=args.date,
-        max_stops=optimal_stops
-    )
-    
-    print(f"Target Species: {', '.join(request.species)}")
-    print(f"Base Location: {request.base_location}")
-    print(f"Date Range: {request.date_range}")
-    print(f"Optimal Stops: {optimal_stops}")
-    print(f"AI Enhanced: {args.ai}")
-    print()
-    
-    try:
-        # Choose planning method
-        if args.ai and mcp_server:
-            print("🤖 Using AI Agents for enhanced planning...")
-            trip_plan = mcp_server.create_trip_plan(
-                species=args.species,
-                base_location=args.location,
-                date_range=args.date,
-                max_stops=args.stops,
-                output_dir=args.output
+        # Handle multi-day planning
+        if args.multi_day:
+            emit(f"🗺️ Creating {args.multi_day}-day optimized birding plan...")
+            emit(f"📍 Base Location: {args.location}")
+            emit(f"🎯 Target Species: {species_str}")
+            emit(f"📅 Date Range: {args.date}")
+            emit(f"🚶 Max Distance per Day: {args.max_distance_per_day} km")
+            emit("")
+            
+            # With --cache (or explicit cache files), reuse a plan built for exactly this request
+            import hashlib
+            cache_key = multi_day_cache_key(args.location, args.species, args.date,
+                                            args.multi_day, args.max_distance_per_day)
+            default_cache = os.path.join(
+                args.output, '.cache', f"multi_day_{hashlib.md5(repr(cache_key).encode()).hexdigest()}.pkl"
             )
-        else:
-            print("📋 Using standard planning...")
-            trip_plan = planner.create_trip_plan(request)
-            # Save to files
-            save_message = planner.save_trip_plan(trip_plan, args.output)
-            print(f"✅ {save_message}")
+            input_cache = args.input_cache or (default_cache if args.cache else None)
+            output_cache = args.output_cache or (default_cache if args.cache else None)
+            
+            multi_day_plan = load_cached_multi_day_plan(input_cache, cache_key) if input_cache else None
+            if multi_day_plan is None:
+                # Create multi-day plan
+                flush()
+                multi_day_plan = route_service.create_multi_day_plan(
+                    base_location=args.location,
+                    target_species=args.species,
+                    date_range=args.date,
+                    days=args.multi_day,
+                    max_distance_per_day=args.max_distance_per_day
+                )
+                if output_cache:
+                    save_cached_multi_day_plan(output_cache, cache_key, multi_day_plan)
+            else:
+                emit(f"♻️ Using cached plan from {input_cache}")
+                emit("")
+                if args.output_cache and args.output_cache != input_cache:
+                    save_cached_multi_day_plan(args.output_cache, cache_key, multi_day_plan)
+            
+            # Display multi-day plan
+            emit("📋 Multi-Day Birding Plan Summary")
+            emit("=" * 50)
+            
+            overall_stats = multi_day_plan['overall_stats']
+            emit(f"🎯 Overall Statistics:")
+            emit(f"   Total Species Expected: {overall_stats['total_species_expected']}")
+            emit(f"   Total Distance: {overall_stats['total_distance']:.1f} km")
+            emit(f"   Average Distance per Day: {overall_stats['average_distance_per_day']:.1f} km")
+            emit(f"   Overall Success Probability: {overall_stats['overall_success_probability']:.1%}")
+            emit(f"   Species Coverage: {overall_stats['species_coverage']:.1%}")
+            emit(f"   Efficiency Score: {overall_stats['efficiency_score']:.1f} species per 10km")
+            emit("")
+            
+            # Display daily plans with detailed routes
+            for day_plan in multi_day_plan['daily_plans']:
+                emit(f"📅 Day {day_plan['day']}")
+                emit(f"   Expected Species: {len(day_plan['expected_species'])}")
+                emit(f"   Total Distance: {day_plan['total_distance']:.1f} km")
+                emit(f"   Success Probability: {day_plan['day_success_probability']:.1%}")
+                emit(f"   Efficiency Score: {day_plan['efficiency_score']:.1f}")
+                
+                # Show daily summary
+                if 'daily_summary' in day_plan:
+                    emit(f"   Summary: {day_plan['daily_summary']}")
+                
+                # Show detailed route stops
+                if 'route_stops' in day_plan and day_plan['route_stops']:
+                    emit(f"   Detailed Route:")
+                    for route_stop in day_plan['route_stops']:
+                        emit(f"     Stop {route_stop['stop_number']}: {route_stop['hotspot_name']}")
+                        emit(f"        Time: {route_stop['viewing_time']}")
+                        emit(f"        Distance: {route_stop['distance_from_previous']:.1f} km")
+                        emit(f"        Target Species: {', '.join(route_stop['target_species'])}")
+                        emit(f"        Success Rate: {route_stop['success_probability']:.1%}")
+                        if route_stop['recommendations']:
+                            emit(f"        Tips: {route_stop['recommendations'][0]}")
+                        emit("")
+                
+                # Show daily schedule
+                if 'daily_schedule' in day_plan and day_plan['daily_schedule']:
+                    emit(f"   Daily Schedule:")
+                    for schedule_item in day_plan['daily_schedule']:
+                        _SCHEDULE_RENDERERS.get(schedule_item['type'], _render_birding_item)(schedule_item, emit)
+                emit("")
+            
+            # Save multi-day plan
+            output_dir = args.output
+            os.makedirs(output_dir, exist_ok=True)
+            
+            # Save as JSON for programmatic access and as a markdown report; the
+            # files are independent, so the JSON is written while the report is
+            # generated and both writes overlap
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [executor.submit(write_json, os.path.join(output_dir, 'multi_day_plan.json'),
+                                           multi_day_plan)]
+                markdown_content = generate_multi_day_markdown(multi_day_plan)
+                futures.append(executor.submit(write_text, os.path.join(output_dir, 'multi_day_plan.md'),
+                                               markdown_content))
+                # Surface any write error
+                for future in futures:
+                    future.result()
+            
+            emit(f"✅ Multi-day plan saved to {output_dir}/ directory")
+            emit(f"📁 Files generated:")
+            emit(f"   - {output_dir}/multi_day_plan.md (Complete plan report)")
+            emit(f"   - {output_dir}/multi_day_plan.json (Structured data)")
+            
+            return
         
-        # Print summary
-        print("\n📋 Trip Plan Summary:")
-        print(f"   Base Location: {trip_plan.trip_overview.base_location}")
-        print(f"   Target Species: {', '.join(trip_plan.trip_overview.target_species)}")
-        print(f"   Total Stops: {trip_plan.trip_overview.total_stops}")
-        print(f"   Total Distance: {trip_plan.trip_overview.total_distance_km:.1f} km")
-        print(f"   Estimated Time: {trip_plan.trip_overview.estimated_time}")
+        optimal_stops = args.stops
+        if args.success_rate:
+            # Find minimum stops that meet target success rate; the rate never
+            # decreases with more stops, so bisect over the table
+            if "error" in success_probability(stop_counts[0]):
+                optimal_stops = stop_counts[-1]
+            else:
+                rates = [success_probability(stops)["overall_success_rate"] for stops in stop_counts]
+                # Use maximum if target can't be met
+                optimal_stops = stop_counts[min(bisect_left(rates, args.success_rate), len(stop_counts) - 1)]
+        elif args.min_stops:
+            optimal_stops = min_stops_info.get("recommended_min_stops", {}).get("recommended_stops", 1)
         
-        # Show success probability for this plan
-        success_info = route_service.calculate_success_probability(
-            args.location, args.species, trip_plan.trip_overview.total_stops
+        # Create trip request
+        from src.models.trip import TripRequest
+        request = TripRequest(
+            species=args.species,
+            base_location=args.location,
+            date_range=args.date,
+            max_stops=optimal_stops
         )
-        if "error" not in success_info:
-            print(f"   Success Rate: {success_info['overall_success_rate']:.1%}")
-        
-        print("\n🎯 Species Tiers:")
-        for species, tier in trip_plan.trip_overview.species_tiers.items():
-            print(f"   {species}: {tier}")
-            if "error" not in success_info and species in success_info["species_probabilities"]:
-                prob = success_info["species_probabilities"][species]
-                print(f"     (Success probability: {prob:.1%})")
-        
-        print("\n📁 Generated Files:")
-        print(f"   - {args.output}/trip_plan.md (Complete trip plan)")
-        print(f"   - {args.output}/story_cards/ (Individual story cards)")
-        print(f"   - {args.output}/social_captions.txt (Social media content)")
         
-        if args.verbose:
-            print("\n🔍 Detailed Analysis:")
-            for availability in trip_plan.species_analysis["availability"]:
-                print(f"   {availability['species']}: {availability['confidence_score']}% confidence")
-                print(f"      Recommendation: {availability['recommendation']}")
+        emit(f"Target Species: {species_str}")
+        emit(f"Base Location: {request.base_location}")
+        emit(f"Date Range: {request.date_range}")
+        emit(f"Optimal Stops: {optimal_stops}")
+        emit(f"AI Enhanced: {args.ai}")
+        emit("")
         
-        print("\n✨ Your birding adventure awaits! Happy birding!")
-        
-    except ValueError as e:
-        print(f"❌ Error: {e}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"❌ Unexpected error: {e}")
-        if args.verbose:
-            import traceback
-            traceback.print_exc()
-        sys.exit(1)
+        try:
+            # Choose planning method
+            if args.ai and mcp_server:
+                emit("🤖 Using AI Agents for enhanced planning...")
+                flush()
+                trip_plan = mcp_server.create_trip_plan(
+                    species=args.species,
+                    base_location=args.location,
+                    date_range=args.date,
+                    max_stops=args.stops,
+                    output_dir=args.output
+                )
+            else:
+                emit("📋 Using standard planning...")
+                flush()
+                trip_plan = planner.create_trip_plan(request)
+                # Save to files
+                save_message = planner.save_trip_plan(trip_plan, args.output)
+                emit(f"✅ {save_message}")
+            
+            # Print summary
+            emit("\n📋 Trip Plan Summary:")
+            emit(f"   Base Location: {trip_plan.trip_overview.base_location}")
+            emit(f"   Target Species: {', '.join(trip_plan.trip_overview.target_species)}")
+            emit(f"   Total Stops: {trip_plan.trip_overview.total_stops}")
+            emit(f"   Total Distance: {trip_plan.trip_overview.total_distance_km:.1f} km")
+            emit(f"   Estimated Time: {trip_plan.trip_overview.estimated_time}")
+            
+            # Show success probability for this plan
+            success_info = success_probability(trip_plan.trip_overview.total_stops)
+            if "error" in success_info:
+                species_probs = {}
+                overall_rate = None
+            else:
+                species_probs = success_info.get("species_probabilities", {})
+                overall_rate = success_info.get("overall_success_rate")
+            if overall_rate is not None:
+                emit(f"   Success Rate: {overall_rate:.1%}")
+            
+            emit("\n🎯 Species Tiers:")
+            for species, tier in trip_plan.trip_overview.species_tiers.items():
+                emit(f"   {species}: {tier}")
+                prob = species_probs.get(species)
+                if prob is not None:
+                    emit(f"     (Success probability: {prob:.1%})")
+            
+            emit("\n📁 Generated Files:")
+            emit(f"   - {args.output}/trip_plan.md (Complete trip plan)")
+            emit(f"   - {args.output}/story_cards/ (Individual story cards)")
+            emit(f"   - {args.output}/social_captions.txt (Social media content)")
+            
+            if args.verbose:
+                emit("\n🔍 Detailed Analysis:")
+                for availability in trip_plan.species_analysis["availability"]:
+                    emit(f"   {availability['species']}: {availability['confidence_score']}% confidence")
+                    emit(f"      Recommendation: {availability['recommendation']}")
+            
+            emit("\n✨ Your birding adventure awaits! Happy birding!")
+            
+        except ValueError as e:
+            emit(f"❌ Error: {e}")
+            sys.exit(1)
+        except Exception as e:
+            emit(f"❌ Unexpected error: {e}")
+            if args.verbose:
+                flush()
+                import traceback
+                traceback.print_exc()
+            sys.exit(1)
+    finally:
+        flush()
 
 
-def species_command(args, planner: BirdingPlanner):
+def species_command(args, planner: 'BirdingPlanner'):
     """Handle the species command."""
     if args.list:
         print("🦅 Available Species in Database")
@@ -349,7 +464,7 @@ def species_command(args, planner: BirdingPlanner):
         sys.exit(1)
 
 
-def info_command(planner: BirdingPlanner):
+def info_command(planner: 'BirdingPlanner'):
     """Handle the info command."""
     print("🦅 BirdingPlanner Application Information")
     print("=" * 50)
@@ -369,7 +484,7 @@ def info_command(planner: BirdingPlanner):
             print(f"  {key}: {value}")
 
 
-def mcp_command(args, mcp_server: MCPServer):
+def mcp_command(args, mcp_server: 'MCPServer'):
     """Handle the MCP command."""
     if args.interactive:
         mcp_server.run_interactive_mode()
@@ -403,30 +518,80 @@ def mcp_command(args, mcp_server: MCPServer):
         print("❌ Please specify an MCP operation (--interactive, --status, --health, --capabilities)")
 
 
-def generate_multi_day_markdown(multi_day_plan: Dict) -> str:
-    """Generate markdown report for multi-day birding plan."""
-    base_location = multi_day_plan['base_location']
-    target_species = multi_day_plan['target_species']
-    date_range = multi_day_plan['date_range']
-    total_days = multi_day_plan['total_days']
-    overall_stats = multi_day_plan['overall_stats']
-    daily_plans = multi_day_plan['daily_plans']
+def _json_default(obj):
+    """Serialize values JSON has no type for, the same way on both write_json paths."""
+    # orjson always writes enums by value; everything else falls back to str()
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+def write_json(path: str, data: Dict):
+    """Write data as indented UTF-8 JSON, using orjson when available.
     
-    markdown = f"""# Multi-Day Birding Plan: {base_location}
+    Both paths produce the same bytes: non-ASCII text is written as is,
+    enums by value and other values JSON has no type for (datetimes,
+    dataclasses, sets) with str().
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json  # orjson not installed, fall back to the json module
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False, default=_json_default)
+        return
+    
+    # Datetimes and dataclasses go through default as with the json module
+    with open(path, 'wb') as f:
+        f.write(orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2
+                             | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+                             | orjson.OPT_PASSTHROUGH_DATETIME))
 
-## 🦅 Plan Overview
-- **Base Location**: {base_location}
-- **Target Species**: {', '.join(target_species)}
-- **Date Range**: {date_range}
-- **Total Days**: {total_days}
-- **Total Species Expected**: {overall_stats['total_species_expected']}
-- **Total Distance**: {overall_stats['total_distance']:.1f} km
-- **Average Distance per Day**: {overall_stats['average_distance_per_day']:.1f} km
-- **Overall Success Probability**: {overall_stats['overall_success_probability']:.1%}
-- **Species Coverage**: {overall_stats['species_coverage']:.1%}
-- **Efficiency Score**: {overall_stats['efficiency_score']:.1f} species per 10km
 
-## 🎯 Optimization Strategy
+def write_text(path: str, content: str):
+    """Write text content to a UTF-8 file."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+# Bump whenever the multi-day planner or its data changes, so plans cached by
+# an older version are no longer reused
+MULTI_DAY_CACHE_VERSION = 1
+
+
+def multi_day_cache_key(location: str, species, date_range: str, days: int, max_distance: float) -> tuple:
+    """Build the cache key of a multi-day plan request, including the cache version."""
+    return (MULTI_DAY_CACHE_VERSION, location, tuple(species), date_range, days, max_distance)
+
+
+def load_cached_multi_day_plan(cache_path: str, cache_key: tuple) -> Optional[Dict]:
+    """Load a pickled multi-day plan, or None if it is unreadable or was built for another request."""
+    import pickle
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+        if cached['key'] != cache_key:
+            return None
+        return cached['plan']
+    except Exception:
+        # Any unreadable cache file is treated as a miss
+        return None
+
+
+def save_cached_multi_day_plan(cache_path: str, cache_key: tuple, multi_day_plan: Dict):
+    """Pickle a multi-day plan together with the request it was built for."""
+    import pickle
+    cache_dir = os.path.dirname(cache_path)
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = cache_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        pickle.dump({'key': cache_key, 'plan': multi_day_plan}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+
+
+# Static sections of the multi-day Markdown report
+_MULTI_DAY_STRATEGY_MD = """## 🎯 Optimization Strategy
 This plan is optimized for:
 - **Maximum species diversity** with minimal walking distance
 - **Efficient route planning** to minimize travel time between hotspots
@@ -436,51 +601,17 @@ This plan is optimized for:
 ## 📅 Daily Plans
 
 """
-    
-    for day_plan in daily_plans:
-        day_num = day_plan['day']
-        expected_species = day_plan['expected_species']
-        total_distance = day_plan['total_distance']
-        success_prob = day_plan['day_success_probability']
-        efficiency = day_plan['efficiency_score']
-        hotspots = day_plan['hotspots']
-        
-        markdown += f"""### Day {day_num}
 
-**Daily Statistics:**
-- **Expected Species**: {len(expected_species)}
-- **Total Distance**: {total_distance:.1f} km
-- **Success Probability**: {success_prob:.1%}
-- **Efficiency Score**: {efficiency:.1f}
+_MULTI_DAY_DAILY_TIPS_MD = """
+**Daily Tips:**
+- Start early for best birding conditions
+- Take breaks between hotspots to rest and observe
+- Keep detailed notes of species seen
+- Check weather conditions before starting
 
-**Target Species for Today:**
 """
-        
-        for species in expected_species:
-            markdown += f"- {species}\n"
-        
-        markdown += "\n**Hotspots to Visit:**\n"
-        
-        for i, hotspot_info in enumerate(hotspots, 1):
-            hotspot = hotspot_info['hotspot']
-            distance = hotspot_info['distance_from_previous']
-            unique_species = hotspot_info['unique_species']
-            
-            markdown += f"\n#### {i}. {hotspot['name']}\n"
-            if distance > 0:
-                markdown += f"- **Distance from previous**: {distance:.1f} km\n"
-            if unique_species:
-                markdown += f"- **Key species**: {', '.join(unique_species)}\n"
-            if hotspot.get('description'):
-                markdown += f"- **Description**: {hotspot['description']}\n"
-        
-        markdown += "\n**Daily Tips:**\n"
-        markdown += "- Start early for best birding conditions\n"
-        markdown += "- Take breaks between hotspots to rest and observe\n"
-        markdown += "- Keep detailed notes of species seen\n"
-        markdown += "- Check weather conditions before starting\n\n"
-    
-    markdown += """## 📋 Packing List
+
+_MULTI_DAY_PACKING_AND_TIPS_MD = """## 📋 Packing List
 - Binoculars (8x42 or 10x42 recommended)
 - Field guide or birding app
 - Camera with telephoto lens
@@ -505,45 +636,130 @@ Use this section to track your progress:
 
 ### Species Checklist
 """
-    
-    for species in target_species:
-        markdown += f"- [ ] {species}\n"
-    
-    markdown += """
+
+_MULTI_DAY_FOOTER_MD = """
 ### Daily Notes
 *Use this space to record your observations, photos taken, and memorable moments.*
 
 ---
 *Generated by BirdingPlanner - Your AI-powered birding companion* 🦅
 """
+
+
+def _render_multi_day_overview(multi_day_plan: Dict) -> str:
+    """Render the title and overview section of a multi-day report."""
+    base_location = multi_day_plan['base_location']
+    overall_stats = multi_day_plan['overall_stats']
+    return f"""# Multi-Day Birding Plan: {base_location}
+
+## 🦅 Plan Overview
+- **Base Location**: {base_location}
+- **Target Species**: {', '.join(multi_day_plan['target_species'])}
+- **Date Range**: {multi_day_plan['date_range']}
+- **Total Days**: {multi_day_plan['total_days']}
+- **Total Species Expected**: {overall_stats['total_species_expected']}
+- **Total Distance**: {overall_stats['total_distance']:.1f} km
+- **Average Distance per Day**: {overall_stats['average_distance_per_day']:.1f} km
+- **Overall Success Probability**: {overall_stats['overall_success_probability']:.1%}
+- **Species Coverage**: {overall_stats['species_coverage']:.1%}
+- **Efficiency Score**: {overall_stats['efficiency_score']:.1f} species per 10km
+
+"""
+
+
+def _render_multi_day_day(day_plan: Dict) -> str:
+    """Render one day section of a multi-day report."""
+    expected_species = day_plan['expected_species']
+    parts = [f"""### Day {day_plan['day']}
+
+**Daily Statistics:**
+- **Expected Species**: {len(expected_species)}
+- **Total Distance**: {day_plan['total_distance']:.1f} km
+- **Success Probability**: {day_plan['day_success_probability']:.1%}
+- **Efficiency Score**: {day_plan['efficiency_score']:.1f}
+
+**Target Species for Today:**
+"""]
+    parts.extend(f"- {species}\n" for species in expected_species)
     
-    return markdown
+    parts.append("\n**Hotspots to Visit:**\n")
+    for i, hotspot_info in enumerate(day_plan['hotspots'], 1):
+        hotspot = hotspot_info['hotspot']
+        distance = hotspot_info['distance_from_previous']
+        unique_species = hotspot_info['unique_species']
+        
+        parts.append(f"\n#### {i}. {hotspot['name']}\n")
+        if distance > 0:
+            parts.append(f"- **Distance from previous**: {distance:.1f} km\n")
+        if unique_species:
+            parts.append(f"- **Key species**: {', '.join(unique_species)}\n")
+        if hotspot.get('description'):
+            parts.append(f"- **Description**: {hotspot['description']}\n")
+    
+    parts.append(_MULTI_DAY_DAILY_TIPS_MD)
+    return "".join(parts)
+
+
+def generate_multi_day_markdown(multi_day_plan: Dict) -> str:
+    """Generate markdown report for multi-day birding plan."""
+    # Collect the report in a list and join once at the end
+    parts = [_render_multi_day_overview(multi_day_plan), _MULTI_DAY_STRATEGY_MD]
+    parts.extend(map(_render_multi_day_day, multi_day_plan['daily_plans']))
+    parts.append(_MULTI_DAY_PACKING_AND_TIPS_MD)
+    parts.extend(f"- [ ] {species}\n" for species in multi_day_plan['target_species'])
+    parts.append(_MULTI_DAY_FOOTER_MD)
+    
+    return "".join(parts)
+
+
+@lru_cache(maxsize=None)
+def get_parser() -> 'argparse.ArgumentParser':
+    """Get the process-wide argument parser, building it on first use."""
+    return create_parser()
+
+
+@lru_cache(maxsize=None)
+def get_planner() -> 'BirdingPlanner':
+    """Get the process-wide BirdingPlanner, creating it on first use."""
+    from src.config.settings import get_settings
+    from src.core.birding_planner import BirdingPlanner
+    return BirdingPlanner(get_settings())
+
+
+@lru_cache(maxsize=None)
+def get_mcp_server() -> 'MCPServer':
+    """Get the process-wide MCP server, creating it on first use.
+    
+    The server and its agents are only needed for MCP and AI planning, so the
+    import is deferred as well.
+    """
+    from src.config.settings import get_settings
+    from src.mcp.server import MCPServer
+    return MCPServer(get_settings())
 
 
 def main():
     """Main CLI entry point."""
-    parser = create_parser()
-    args = parser.parse_args()
-    
-    if not args.command:
-        parser.print_help()
-        sys.exit(1)
+    # Hot commands skip building the full argparse parser
+    args = parse_fast_args(sys.argv[1:])
+    if args is None:
+        parser = get_parser()
+        args = parser.parse_args()
+        
+        if not args.command:
+            parser.print_help()
+            sys.exit(1)
     
     try:
-        # Initialize services
-        settings = get_settings()
-        planner = BirdingPlanner(settings)
-        mcp_server = MCPServer(settings)
-        
-        # Handle commands
+        # Handle commands; services are built on first use
         if args.command == 'plan':
-            plan_command(args, planner, mcp_server)
+            plan_command(args, get_planner(), get_mcp_server() if args.ai else None)
         elif args.command == 'species':
-            species_command(args, planner)
+            species_command(args, get_planner())
         elif args.command == 'mcp':
-            mcp_command(args, mcp_server)
+            mcp_command(args, get_mcp_server())
         elif args.command == 'info':
-            info_command(planner)
+            info_command(get_planner())
         else:
             print(f"❌ Unknown command: {args.command}")
             sys.exit(1)
@@ -2,12 +2,13 @@
 Configuration management for BirdingPlanner.
 """
 
-from .settings import Settings, get_settings
+from .settings import Settings, TierWeights, get_settings
 from .database import DatabaseConfig
 from .logging import LoggingConfig
 
 __all__ = [
     "Settings",
+    "TierWeights",
     "get_settings", 
     "DatabaseConfig",
     "LoggingConfig"
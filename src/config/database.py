@@ -21,7 +21,8 @@ class DatabaseConfig:
     def from_env(cls) -> 'DatabaseConfig':
         """Create database config from environment variables."""
         import os
+        env = os.environ
         return cls(
-            url=os.getenv("DATABASE_URL"),
-            echo=os.getenv("DATABASE_ECHO", "false").lower() == "true"
+            url=env.get("DATABASE_URL"),
+            echo=env.get("DATABASE_ECHO", "false").lower() == "true"
         ) 
\ No newline at end of file
@@ -21,7 +21,8 @@ class LoggingConfig:
     def from_env(cls) -> 'LoggingConfig':
         """Create logging config from environment variables."""
         import os
+        env = os.environ
         return cls(
-            level=os.getenv("LOG_LEVEL", "INFO"),
-            file_output=os.getenv("LOG_FILE", "").lower() == "true"
+            level=env.get("LOG_LEVEL", "INFO"),
+            file_output=env.get("LOG_FILE", "").lower() == "true"
         ) 
\ No newline at end of file
@@ -3,7 +3,8 @@ Application settings and configuration management.
 """
 
 import os
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import ClassVar, NamedTuple, Optional, Dict, Any, Set
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -15,6 +16,13 @@ except ImportError:
     pass  # python-dotenv not installed, use system environment variables
 
 
+class TierWeights(NamedTuple):
+    """Weights of the species tier classification factors."""
+    occurrence_rate: float = 0.5
+    region_count: float = 0.3
+    visibility: float = 0.2
+
+
 @dataclass
 class Settings:
     """Application settings."""
@@ -57,39 +65,43 @@ class Settings:
     max_route_distance: float = 5000.0  # km
     
     # Species classification
-    tier_weights: Dict[str, float] = field(default_factory=lambda: {
-        "occurrence_rate": 0.5,
-        "region_count": 0.3,
-        "visibility": 0.2
-    })
+    tier_weights: TierWeights = field(default_factory=TierWeights)
     
     # External services
     weather_api_key: Optional[str] = None
     ebird_api_key: Optional[str] = None
     
+    # Directories already created in this process
+    _ensured_dirs: ClassVar[Set[Path]] = set()
+    
     def __post_init__(self):
         """Post-initialization setup."""
-        # Create directories if they don't exist
-        self.output_dir.mkdir(exist_ok=True)
-        self.data_dir.mkdir(exist_ok=True)
-        
-        # Set log file path
+        # Set log file path; directories are only created when something
+        # writes to them (see ensure_output_dir)
         if self.log_file is None:
             self.log_file = self.output_dir / "birdingplanner.log"
     
+    def ensure_output_dir(self) -> Path:
+        """Create the output directory once per process and return it."""
+        if self.output_dir not in Settings._ensured_dirs:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            Settings._ensured_dirs.add(self.output_dir)
+        return self.output_dir
+    
     @classmethod
     def from_env(cls) -> 'Settings':
         """Create settings from environment variables."""
+        env = os.environ
         return cls(
-            environment=os.getenv("ENVIRONMENT", "development"),
-            debug=os.getenv("DEBUG", "true").lower() == "true",
-            database_url=os.getenv("DATABASE_URL"),
-            database_echo=os.getenv("DATABASE_ECHO", "false").lower() == "true",
-            log_level=os.getenv("LOG_LEVEL", "INFO"),
-            api_host=os.getenv("API_HOST", "localhost"),
-            api_port=int(os.getenv("API_PORT", "8000")),
-            weather_api_key=os.getenv("WEATHER_API_KEY"),
-            ebird_api_key=os.getenv("EBIRD_API_KEY")
+            environment=env.get("ENVIRONMENT", "development"),
+            debug=env.get("DEBUG", "true").lower() == "true",
+            database_url=env.get("DATABASE_URL"),
+            database_echo=env.get("DATABASE_ECHO", "false").lower() == "true",
+            log_level=env.get("LOG_LEVEL", "INFO"),
+            api_host=env.get("API_HOST", "localhost"),
+            api_port=int(env.get("API_PORT", "8000")),
+            weather_api_key=env.get("WEATHER_API_KEY"),
+            ebird_api_key=env.get("EBIRD_API_KEY")
         )
     
     def to_dict(self) -> Dict[str, Any]:
@@ -111,26 +123,18 @@ class Settings:
         }
 
 
-# Global settings instance
-_settings: Optional[Settings] = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get the global settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = Settings.from_env()
-    return _settings
+    """Get the global settings instance, read from the environment once per process."""
+    return Settings.from_env()
 
 
 def update_settings(**kwargs) -> Settings:
     """Update settings with new values."""
-    global _settings
-    if _settings is None:
-        _settings = Settings.from_env()
+    settings = get_settings()
     
     for key, value in kwargs.items():
-        if hasattr(_settings, key):
-            setattr(_settings, key, value)
+        if hasattr(settings, key):
+            setattr(settings, key, value)
     
-    return _settings 
\ No newline at end of file
+    return settings 
\ No newline at end of file
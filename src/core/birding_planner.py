@@ -3,9 +3,12 @@ Main BirdingPlanner application class.
 Orchestrates all services to create comprehensive birding trip plans.
 """
 
+import copy
 import logging
-from typing import Dict, List, Optional
-from ..models.trip import TripRequest, TripPlan, TripSummary, TripContent
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from ..models.trip import TripRequest, TripPlan, TripSummary, TripContent, month_from_date_range
 from ..models.species import Species
 from ..models.route import Route
 from ..config.settings import get_settings
@@ -33,6 +36,16 @@ class BirdingPlanner:
         self.route_service = RouteService()
         self.content_service = ContentService()
         
+        # Per-planner caches of species lookups, shared across requests. Only
+        # species from the database are cached, so unknown species keep getting
+        # freshly generated mock data
+        self._classify_one = lru_cache(maxsize=1024)(self.species_service.classify_species)
+        self._availability_one = lru_cache(maxsize=1024)(self.species_service.get_species_availability)
+        
+        # Per-planner cache of the deterministic planning steps, keyed by request;
+        # results are deep-copied before use so plans never share mutable state
+        self._plan_core = lru_cache(maxsize=128)(self._run_planning_steps)
+        
         self.logger.info("BirdingPlanner initialized successfully")
     
     def _setup_logging(self) -> logging.Logger:
@@ -52,6 +65,7 @@ class BirdingPlanner:
             
             # File handler
             if self.settings.log_file:
+                self.settings.ensure_output_dir()
                 file_handler = logging.FileHandler(self.settings.log_file)
                 file_handler.setLevel(logging.DEBUG)
                 file_formatter = logging.Formatter(
@@ -85,23 +99,9 @@ class BirdingPlanner:
             raise ValueError(f"Invalid trip request: {error_msg}")
         
         try:
-            # Step 1: Classify species into tiers
-            self.logger.info("Step 1: Classifying species into tiers...")
-            species_data = self._classify_species(request.species)
-            
-            # Step 2: Analyze species availability
-            self.logger.info("Step 2: Analyzing species availability...")
-            species_availability = self._analyze_species_availability(
-                request.species, request.date_range, request.base_location
-            )
-            
-            # Step 3: Plan optimized route
-            self.logger.info("Step 3: Planning optimized route...")
-            route_data = self.route_service.optimize_route(
-                request.base_location,
-                request.species,
-                request.date_range,
-                max_stops=request.max_stops
+            # Steps 1-3 only depend on the request, so repeated requests reuse them
+            species_data, species_availability, route_data = self._plan_steps(
+                tuple(request.species), request.date_range, request.base_location, request.max_stops
             )
             
             # Step 4: Generate content
@@ -139,11 +139,64 @@ class BirdingPlanner:
             self.logger.error(f"Error creating trip plan: {str(e)}")
             raise
     
+    def _plan_steps(self, species: Tuple[str, ...], date_range: str, base_location: str,
+                    max_stops: int) -> Tuple[List[Species], List[Dict], Route]:
+        """Run steps 1-3, reusing cached results for requests made only of known species."""
+        if all(self._is_known_species(name) for name in species):
+            hits = self._plan_core.cache_info().hits
+            result = self._plan_core(species, date_range, base_location, max_stops)
+            if self._plan_core.cache_info().hits > hits:
+                self.logger.info("Steps 1-3: Reusing cached classification, availability and route")
+        else:
+            result = self._run_planning_steps(species, date_range, base_location, max_stops)
+        
+        # Cached entries (whole requests or single species) must never be handed out
+        return copy.deepcopy(result)
+    
+    def _is_known_species(self, name: str) -> bool:
+        """Whether a species comes from the database rather than generated mock data."""
+        return self.species_service.get_species(name) is not None
+    
+    def _run_planning_steps(self, species: Tuple[str, ...], date_range: str, base_location: str,
+                            max_stops: int) -> Tuple[List[Species], List[Dict], Route]:
+        """Run the deterministic planning steps: classification, availability and routing."""
+        # Classification, availability and routing are independent, so run them
+        # side by side and report each step once its result is in
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="BirdingPlanner") as executor:
+            species_future = executor.submit(self._classify_species, species)
+            availability_future = executor.submit(
+                self._analyze_species_availability, species, date_range, base_location
+            )
+            route_future = executor.submit(
+                self.route_service.optimize_route,
+                base_location,
+                list(species),
+                date_range,
+                max_stops=max_stops
+            )
+            
+            # Step 1: Classify species into tiers
+            species_data = species_future.result()
+            self.logger.info("Step 1: Classified species into tiers")
+            
+            # Step 2: Analyze species availability
+            species_availability = availability_future.result()
+            self.logger.info("Step 2: Analyzed species availability")
+            
+            # Step 3: Plan optimized route
+            route_data = route_future.result()
+            self.logger.info("Step 3: Planned optimized route")
+        
+        return species_data, species_availability, route_data
+    
     def _classify_species(self, species_names: List[str]) -> List[Species]:
         """Classify species into tiers."""
         species_data = []
         for name in species_names:
-            species = self.species_service.classify_species(name)
+            if self._is_known_species(name):
+                species = self._classify_one(name)
+            else:
+                species = self.species_service.classify_species(name)
             species_data.append(species)
             self.logger.debug(f"Classified {name} as {species.tier.value}")
         return species_data
@@ -156,29 +209,17 @@ class BirdingPlanner:
         
         availability_data = []
         for name in species_names:
-            availability = self.species_service.get_species_availability(name, month, region)
+            if self._is_known_species(name):
+                availability = self._availability_one(name, month, region)
+            else:
+                availability = self.species_service.get_species_availability(name, month, region)
             availability_data.append(availability)
             self.logger.debug(f"Availability for {name}: {availability['confidence_score']}% confidence")
         return availability_data
     
     def _extract_month_from_date_range(self, date_range: str) -> str:
         """Extract month from date range string."""
-        month_mapping = {
-            "spring": "April",
-            "summer": "July",
-            "fall": "October",
-            "winter": "January",
-            "Spring": "April",
-            "Summer": "July",
-            "Fall": "October",
-            "Winter": "January"
-        }
-        
-        for season, month in month_mapping.items():
-            if season in date_range:
-                return month
-        
-        return "April"  # Default
+        return month_from_date_range(date_range)
     
     def _get_region_from_location(self, location: str) -> str:
         """Map location to region for species availability."""
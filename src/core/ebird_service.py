@@ -5,6 +5,8 @@ Provides real-time bird observation data and hotspot information
 
 import requests
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from dataclasses import dataclass
@@ -12,6 +14,9 @@ from src.models.route import Coordinates
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent eBird requests issued by batched lookups
+MAX_PARALLEL_REQUESTS = 8
+
 
 @dataclass
 class EBirdObservation:
@@ -49,14 +54,37 @@ class EBirdAPIClient:
             "X-eBirdApiToken": api_key,
             "Content-Type": "application/json"
         }
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        self.session = self._new_session()
+        # requests.Session is not guaranteed to be thread-safe, so other
+        # threads (the workers of batched lookups) get sessions of their own
+        self._local = threading.local()
+        self._local.session = self.session
+    
+    def _new_session(self) -> requests.Session:
+        """Create a session carrying the API headers"""
+        session = requests.Session()
+        session.headers.update(self.headers)
+        return session
+    
+    def _thread_session(self) -> requests.Session:
+        """Get the calling thread's session, creating it on first use"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self._new_session()
+        return session
+    
+    def close_thread_session(self):
+        """Close the calling thread's session, unless it is the client's own session"""
+        session = getattr(self._local, "session", None)
+        if session is not None and session is not self.session:
+            session.close()
+            del self._local.session
     
     def _make_request(self, endpoint: str, params: Dict = None) -> Dict:
         """Make API request with error handling"""
         try:
             url = f"{self.base_url}/{endpoint}"
-            response = self.session.get(url, params=params, timeout=10)
+            response = self._thread_session().get(url, params=params, timeout=10)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -364,6 +392,26 @@ class EBirdService:
         
         return min(1.0, success_rate * seasonal_factor)
     
+    def predict_success_rates(self, species_list: List[str], location: str, date: str) -> Dict[str, float]:
+        """Predict success rates for several species at a location.
+        
+        Each species needs its own observation lookup, so the lookups are
+        issued concurrently and the batch costs roughly one round-trip.
+        """
+        unique_species = list(dict.fromkeys(species_list))
+        if len(unique_species) <= 1:
+            return {species: self.predict_success_rate(species, location, date) for species in unique_species}
+        
+        def predict(species: str) -> float:
+            try:
+                return self.predict_success_rate(species, location, date)
+            finally:
+                # Workers use their own sessions; close them with the lookup
+                self.client.close_thread_session()
+        
+        with ThreadPoolExecutor(max_workers=min(len(unique_species), MAX_PARALLEL_REQUESTS)) as executor:
+            return dict(zip(unique_species, executor.map(predict, unique_species)))
+    
     def get_rare_species_alerts(self, location: str, days: int = 1) -> List[EBirdObservation]:
         """Get alerts for rare species sightings"""
         # This would need to be enhanced with rarity data
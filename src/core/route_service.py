@@ -5,10 +5,27 @@ Handles route optimization and location management.
 
 import math
 import random
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 from ..models.route import Route, RouteStop, Location, Coordinates, Hotspot, ViewingSchedule
 
 
+# Extra chance of seeing a species for each stop count; larger counts get 0.6
+_STOP_PROBABILITY_BOOST = {1: 0.0, 2: 0.3, 3: 0.5}
+
+
+def _score_day_route(total_scores: Sequence[float], species_count: int) -> Tuple[List[float], float]:
+    """Score a day's hotspots from their summed species scores.
+    
+    Returns the per-hotspot success probabilities and the combined day
+    success probability.
+    """
+    probabilities = [total / species_count for total in total_scores]
+    day_probability = 1.0
+    for probability in probabilities:
+        day_probability *= 0.7 + 0.3 * probability
+    return probabilities, day_probability
+
+
 class RouteService:
     """Service for managing routes and locations."""
     
@@ -333,40 +350,50 @@ class RouteService:
     def calculate_success_probability(self, base_location: str, target_species: List[str], 
                                     num_stops: int) -> Dict[str, float]:
         """Calculate success probability for seeing target species with given number of stops."""
+        return self.calculate_success_probability_batch(base_location, target_species, (num_stops,))[num_stops]
+    
+    def calculate_success_probability_batch(self, base_location: str, target_species: List[str],
+                                            stop_counts: Iterable[int]) -> Dict[int, Dict]:
+        """Calculate success probabilities for several stop counts at once.
+        
+        Species availability and the recommended minimum stops only depend on
+        the location and species, so they are computed once and only the
+        per-stop boost varies. Returns the calculate_success_probability
+        result for each stop count.
+        """
         base_loc = self.get_location(base_location)
         if not base_loc:
-            return {"error": f"Unknown location: {base_location}"}
+            return {num_stops: {"error": f"Unknown location: {base_location}"} for num_stops in stop_counts}
         
-        # Calculate individual species probabilities
-        species_probabilities = {}
-        for species in target_species:
-            local_score = self.get_species_compatibility_score(species, base_location)
-            
-            # Base probability from local availability
-            base_prob = local_score
-            
+        # Base probability from local availability
+        local_scores = {
+            species: self.get_species_compatibility_score(species, base_location)
+            for species in target_species
+        }
+        recommended_min_stops = self._recommend_min_stops(
+            [local_scores[species] for species in target_species]
+        )
+        
+        results = {}
+        for num_stops in stop_counts:
             # Probability increases with more stops (diminishing returns)
-            if num_stops == 1:
-                prob = base_prob
-            elif num_stops == 2:
-                prob = base_prob + (1 - base_prob) * 0.3  # 30% additional chance
-            elif num_stops == 3:
-                prob = base_prob + (1 - base_prob) * 0.5  # 50% additional chance
-            else:
-                prob = base_prob + (1 - base_prob) * 0.6  # Max 60% additional chance
+            boost = _STOP_PROBABILITY_BOOST.get(num_stops, 0.6)
+            species_probabilities = {
+                species: min(base_prob + (1 - base_prob) * boost, 0.95)  # Cap at 95%
+                for species, base_prob in local_scores.items()
+            }
             
-            species_probabilities[species] = min(prob, 0.95)  # Cap at 95%
-        
-        # Calculate overall success probability (probability of seeing ALL species)
-        overall_prob = 1.0
-        for prob in species_probabilities.values():
-            overall_prob *= prob
-        
-        return {
-            "overall_success_rate": overall_prob,
-            "species_probabilities": species_probabilities,
-            "recommended_min_stops": self._get_recommended_min_stops(target_species, base_location)
-        }
+            # Calculate overall success probability (probability of seeing ALL species)
+            overall_prob = 1.0
+            for prob in species_probabilities.values():
+                overall_prob *= prob
+            
+            results[num_stops] = {
+                "overall_success_rate": overall_prob,
+                "species_probabilities": species_probabilities,
+                "recommended_min_stops": dict(recommended_min_stops)
+            }
+        return results
     
     def _get_recommended_min_stops(self, target_species: List[str], base_location: str) -> Dict[str, int]:
         """Get recommended minimum stops for high success probability."""
@@ -374,35 +401,36 @@ class RouteService:
         if not base_loc:
             return {"error": f"Unknown location: {base_location}"}
         
-        # Calculate average local availability
-        local_scores = []
-        for species in target_species:
-            local_score = self.get_species_compatibility_score(species, base_location)
-            local_scores.append(local_score)
-        
-        avg_local_score = sum(local_scores) / len(local_scores)
+        return self._recommend_min_stops(
+            [self.get_species_compatibility_score(species, base_location) for species in target_species]
+        )
+    
+    def _recommend_min_stops(self, local_scores: List[float]) -> Dict[str, int]:
+        """Recommend minimum stops from the local availability of each target species."""
+        species_count = len(local_scores)
+        avg_local_score = sum(local_scores) / species_count
         min_local_score = min(local_scores)
         
         # Determine recommended stops based on availability
         if avg_local_score > 0.8 and min_local_score > 0.7:
             # High local availability - 1-2 stops sufficient
-            recommended_stops = 1 if len(target_species) == 1 else 2
+            recommended_stops = 1 if species_count == 1 else 2
         elif avg_local_score > 0.6 and min_local_score > 0.5:
             # Moderate local availability - 2-3 stops recommended
-            recommended_stops = 2 if len(target_species) <= 2 else 3
+            recommended_stops = 2 if species_count <= 2 else 3
         else:
             # Low local availability - 3+ stops needed
             recommended_stops = 3
         
         # Adjust based on species count
-        if len(target_species) == 1:
+        if species_count == 1:
             recommended_stops = max(1, recommended_stops - 1)
-        elif len(target_species) >= 3:
+        elif species_count >= 3:
             recommended_stops = min(5, recommended_stops + 1)
         
         return {
             "recommended_stops": recommended_stops,
-            "reasoning": self._get_recommendation_reasoning(avg_local_score, min_local_score, len(target_species))
+            "reasoning": self._get_recommendation_reasoning(avg_local_score, min_local_score, species_count)
         }
     
     def _get_recommendation_reasoning(self, avg_score: float, min_score: float, species_count: int) -> str:
@@ -443,10 +471,35 @@ class RouteService:
     def create_multi_day_plan(self, base_location: str, target_species: List[str], 
                              date_range: str, days: int = 3, max_distance_per_day: float = 50.0) -> Dict:
         """Create a multi-day birding plan optimized for maximum species with minimal walking."""
+        return self._build_multi_day_plan(base_location, target_species, date_range, days,
+                                          max_distance_per_day, self._get_area_hotspot_groups(base_location))
+    
+    def create_multi_day_plans_batch(self, base_location: str, scenarios: List[Dict],
+                                     date_range: str = "Spring 2024") -> List[Dict]:
+        """Create multi-day plans for several scenarios sharing one base location.
+        
+        Each scenario is a dict with 'species', 'days' and 'max_distance' keys
+        (and optionally 'date_range'). Area hotspots and their distances are
+        computed once and reused for every scenario.
+        """
+        area_groups = self._get_area_hotspot_groups(base_location)
+        return [
+            self._build_multi_day_plan(base_location, scenario['species'],
+                                       scenario.get('date_range', date_range), scenario['days'],
+                                       scenario['max_distance'], area_groups)
+            for scenario in scenarios
+        ]
+    
+    def _build_multi_day_plan(self, base_location: str, target_species: List[str], date_range: str,
+                              days: int, max_distance_per_day: float, area_groups: List[tuple]) -> Dict:
+        """Build a multi-day plan from precomputed area hotspot groups."""
         print(f"🗺️ Creating {days}-day optimized birding plan...")
         
         # Get all available hotspots in the area
-        all_hotspots = self._get_all_hotspots_in_area(base_location, max_distance_per_day * days)
+        all_hotspots = self._select_hotspots_within(area_groups, max_distance_per_day * days)
+        
+        # Distances between hotspots, computed on first use and shared by every day of the plan
+        hotspot_distances = {}
         
         # Analyze species availability at each hotspot
         hotspot_species_analysis = {}
@@ -482,7 +535,8 @@ class RouteService:
                 daily_distance_budget, 
                 day, 
                 base_location,
-                target_species
+                target_species,
+                hotspot_distances
             )
             
             daily_plans.append(day_plan)
@@ -523,7 +577,8 @@ class RouteService:
         return multi_day_plan
     
     def _create_optimized_day_plan(self, available_hotspots: List, max_distance: float, 
-                                  day_number: int, base_location: str, target_species: List[str]) -> Dict:
+                                  day_number: int, base_location: str, target_species: List[str],
+                                  hotspot_distances: Optional[Dict[Tuple[str, str], float]] = None) -> Dict:
         """Create an optimized plan for a single day."""
         if not available_hotspots:
             return self._create_empty_day_plan(day_number, base_location)
@@ -534,23 +589,15 @@ class RouteService:
         
         # Find nearby hotspots that complement the best one
         nearby_hotspots = []
+        hotspot_totals = [best_hotspot_data['total_score']]
         current_distance = 0
         
         for hotspot_name, hotspot_data in available_hotspots[1:]:
             hotspot = hotspot_data['hotspot']
             
             # Calculate distance from current location
-            if nearby_hotspots:
-                last_hotspot = nearby_hotspots[-1]['hotspot']
-                distance = self._calculate_distance(
-                    last_hotspot['coordinates'], 
-                    hotspot['coordinates']
-                )
-            else:
-                distance = self._calculate_distance(
-                    best_hotspot['coordinates'], 
-                    hotspot['coordinates']
-                )
+            previous_hotspot = nearby_hotspots[-1]['hotspot'] if nearby_hotspots else best_hotspot
+            distance = self._hotspot_distance(previous_hotspot, hotspot, hotspot_distances)
             
             # Check if adding this hotspot would exceed daily distance limit
             if current_distance + distance <= max_distance:
@@ -567,6 +614,7 @@ class RouteService:
                         'unique_species': unique_species,
                         'species_scores': hotspot_data['species_scores']
                     })
+                    hotspot_totals.append(hotspot_data['total_score'])
                     current_distance += distance
         
         # Create day plan
@@ -576,7 +624,7 @@ class RouteService:
         
         # Calculate day statistics and create detailed route
         expected_species = set()
-        day_success_probability = 1.0
+        hotspot_probs, day_success_probability = _score_day_route(hotspot_totals, len(target_species))
         total_distance = sum(h['distance_from_previous'] for h in day_hotspots)
         
         # Create detailed route plan for the day
@@ -603,9 +651,7 @@ class RouteService:
             else:
                 viewing_time = "12:30 PM - 3:00 PM"  # Later stops - afternoon
             
-            # Calculate success probability for this hotspot
-            hotspot_prob = sum(species_scores.values()) / len(target_species)
-            day_success_probability *= (0.7 + 0.3 * hotspot_prob)
+            hotspot_prob = hotspot_probs[i]
             
             # Get target species for this hotspot (species with high scores)
             target_species_for_hotspot = [
@@ -757,33 +803,52 @@ class RouteService:
             'efficiency_score': 0.0
         }
     
-    def _get_all_hotspots_in_area(self, base_location: str, max_radius: float) -> List[Dict]:
-        """Get all hotspots within a certain radius of the base location."""
+    def _get_area_hotspot_groups(self, base_location: str) -> List[tuple]:
+        """Get (distance_from_base, hotspots) for every location, relative to the base location."""
         base_loc = self.get_location(base_location)
         if not base_loc:
             return []
         
         base_coords = base_loc.coordinates
-        all_hotspots = []
+        groups = []
         
         # Get hotspots from all available locations
         for location_name, location_data in self._location_database.items():
             distance = self._calculate_distance(base_coords, location_data.coordinates)
             
-            if distance <= max_radius:
-                # Add the main location as a hotspot
-                all_hotspots.append({
-                    'name': location_name,
-                    'coordinates': location_data.coordinates,
-                    'description': location_data.name,
-                    'distance_from_base': distance
-                })
-                
-                # Add nearby hotspots (simulated)
-                nearby_hotspots = self._generate_nearby_hotspots(location_data.coordinates, location_name)
-                all_hotspots.extend(nearby_hotspots)
-        
-        return all_hotspots
+            # The main location as a hotspot, followed by nearby hotspots (simulated)
+            hotspots = [{
+                'name': location_name,
+                'coordinates': location_data.coordinates,
+                'description': location_data.name,
+                'distance_from_base': distance
+            }]
+            hotspots.extend(self._generate_nearby_hotspots(location_data.coordinates, location_name))
+            groups.append((distance, hotspots))
+        
+        return groups
+    
+    def _select_hotspots_within(self, area_groups: List[tuple], max_radius: float) -> List[Dict]:
+        """Flatten the hotspot groups whose location lies within the radius."""
+        return [
+            hotspot
+            for distance, hotspots in area_groups if distance <= max_radius
+            for hotspot in hotspots
+        ]
+    
+    def _hotspot_distance(self, hotspot_a: Dict, hotspot_b: Dict,
+                          distances: Optional[Dict[Tuple[str, str], float]] = None) -> float:
+        """Distance between two hotspots, memoized by name pair in the optional distances dict."""
+        if distances is None:
+            return self._calculate_distance(hotspot_a['coordinates'], hotspot_b['coordinates'])
+        
+        key = (hotspot_a['name'], hotspot_b['name'])
+        distance = distances.get(key)
+        if distance is None:
+            distance = self._calculate_distance(hotspot_a['coordinates'], hotspot_b['coordinates'])
+            # The haversine distance is symmetric
+            distances[key] = distances[(key[1], key[0])] = distance
+        return distance
     
     def _generate_nearby_hotspots(self, base_coords: Coordinates, location_name: str) -> List[Dict]:
         """Generate nearby hotspots around a base location."""
@@ -183,17 +183,10 @@ class EBirdAgent(BaseAgent):
             data={"error": "Missing species list or location"}
         )
         
-        predictions = {}
-        overall_success_rate = 0.0
-        
-        for species in species_list:
-            success_rate = self.ebird_service.predict_success_rate(
-                species, location, "2024-04-15"  # Example date
-            )
-            predictions[species] = success_rate
-            overall_success_rate += success_rate
-        
-        overall_success_rate /= len(species_list)
+        predictions = self.ebird_service.predict_success_rates(
+            species_list, location, "2024-04-15"  # Example date
+        )
+        overall_success_rate = sum(predictions[species] for species in species_list) / len(species_list)
         
         # Generate AI recommendations
         recommendations = self._generate_success_recommendations(
@@ -5,6 +5,7 @@ Main entry point for AI agent orchestration and trip planning.
 
 import logging
 import json
+import threading
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 from pathlib import Path
@@ -20,6 +21,9 @@ class MCPServer:
     
     This server orchestrates AI agents to create comprehensive birding trip plans.
     It provides both programmatic and command-line interfaces for trip planning.
+    
+    A single server may be shared between threads for read-mostly use; the
+    request counter is guarded by a lock.
     """
     
     def __init__(self, settings=None):
@@ -34,6 +38,7 @@ class MCPServer:
         self.status = "initialized"
         self.start_time = datetime.now()
         self.request_count = 0
+        self._request_lock = threading.Lock()
         
         self.logger.info("MCP Server initialized with AI agent orchestration")
     
@@ -56,8 +61,10 @@ class MCPServer:
         Returns:
             TripPlan: Complete trip plan generated by AI agents
         """
-        self.request_count += 1
-        self.logger.info(f"Processing trip plan request #{self.request_count}")
+        with self._request_lock:
+            self.request_count += 1
+            request_number = self.request_count
+        self.logger.info(f"Processing trip plan request #{request_number}")
         
         try:
             # Create trip request
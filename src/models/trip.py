@@ -2,6 +2,7 @@
 Trip planning data models for BirdingPlanner.
 """
 
+import re
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any
 from datetime import datetime
@@ -9,6 +10,24 @@ from .species import Species
 from .route import Route
 
 
+# Representative month for each season named in a date range
+SEASON_TO_MONTH = {
+    "spring": "April",
+    "summer": "July",
+    "fall": "October",
+    "winter": "January"
+}
+
+# Season names in a date range; a plain substring match, so "Springtime 2024" counts
+SEASON_RE = re.compile(r"(spring|summer|fall|winter)", re.IGNORECASE)
+
+
+def month_from_date_range(date_range: str, default: str = "April") -> str:
+    """Get the representative month of the first season named in a date range, in any case."""
+    match = SEASON_RE.search(date_range)
+    return SEASON_TO_MONTH[match.group(1).lower()] if match else default
+
+
 @dataclass
 class TripRequest:
     """Request for a birding trip plan."""
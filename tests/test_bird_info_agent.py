@@ -0,0 +1,88 @@
+"""
+Tests for the bird info agent's columnar species queries.
+"""
+
+import copy
+import pickle
+
+import pytest
+
+from agents.bird_info_agent import (
+    MONTH_NAMES, MONTH_TO_IDX, REGION_IDX, REGION_NAMES, SPECIES_DATABASE, SPECIES_NAMES,
+    generate_mock_species_data, get_species_planning_summary, month_bit, months_to_mask, query_species, score_species
+)
+
+
+def _mask_to_months(mask):
+    """Unpack a month mask back into month names in calendar order."""
+    return [month for month in MONTH_NAMES if mask & month_bit(month)]
+
+
+class TestMonthMask:
+    """Test packing month names into bit masks."""
+
+    def test_round_trip(self):
+        """Test that every species' best months survive a mask round-trip."""
+        for record in SPECIES_DATABASE.values():
+            mask = months_to_mask(record.best_months)
+            assert mask == record.best_months_mask
+            assert _mask_to_months(mask) == sorted(set(record.best_months), key=MONTH_TO_IDX.get)
+
+    def test_single_months_and_duplicates(self):
+        """Test single months, repeated months and the empty mask."""
+        assert months_to_mask([]) == 0
+        assert months_to_mask(["January"]) == 1
+        assert months_to_mask(["December"]) == 1 << 11
+        assert months_to_mask(["May", "May"]) == month_bit("May")
+        assert months_to_mask(MONTH_NAMES) == (1 << 12) - 1
+
+    def test_unknown_month_bit(self):
+        """Test that unknown month names map to no bit."""
+        assert month_bit("Smarch") == 0
+
+
+class TestSpeciesQueries:
+    """Test query_species and score_species against the per-species records."""
+
+    @pytest.mark.parametrize("month", MONTH_NAMES)
+    def test_query_species_filters_month_and_region(self, month):
+        """Test that only species seen in both the month and the region are returned."""
+        for region in REGION_NAMES:
+            expected = [
+                name for name, record in SPECIES_DATABASE.items()
+                if month in record.best_months and region in record.regions
+            ]
+            assert query_species(MONTH_TO_IDX[month], REGION_IDX[region]) == expected
+
+    def test_query_species_known_case(self):
+        """Test a hand-checked month and region."""
+        january = query_species(MONTH_TO_IDX["January"], REGION_IDX["Northeast"])
+        assert "Northern Cardinal" in january
+        assert "Baltimore Oriole" not in january
+
+    @pytest.mark.parametrize("month", MONTH_NAMES)
+    def test_score_species_matches_planning_summary(self, month):
+        """Test that the batch scores equal the per-species confidence scores."""
+        for region in REGION_NAMES:
+            scores = score_species(MONTH_TO_IDX[month], REGION_IDX[region])
+            assert len(scores) == len(SPECIES_NAMES)
+            for name, score in zip(SPECIES_NAMES, scores):
+                assert score == get_species_planning_summary(name, month, region)["confidence_score"]
+
+
+class TestSpeciesRecord:
+    """Test copying and pickling the frozen species records."""
+
+    def test_pickle_round_trip(self):
+        """Test that database and mock records survive pickling."""
+        records = list(SPECIES_DATABASE.values()) + [generate_mock_species_data("Imaginary Warbler")]
+        for record in records:
+            restored = pickle.loads(pickle.dumps(record))
+            assert restored == record
+            assert restored.best_months_mask == record.best_months_mask
+
+    def test_deepcopy_round_trip(self):
+        """Test that deep copies equal the original records."""
+        for record in SPECIES_DATABASE.values():
+            assert copy.deepcopy(record) == record
+            assert copy.copy(record) == record
@@ -0,0 +1,63 @@
+"""
+Tests for the BirdingPlanner orchestrator.
+"""
+
+import pytest
+
+from src.core.birding_planner import BirdingPlanner
+from src.models.trip import TripRequest
+
+
+@pytest.fixture
+def planner():
+    """Create a planner with default settings."""
+    return BirdingPlanner()
+
+
+def _request(*species):
+    """Build a trip request from New York for the given species."""
+    return TripRequest(species=list(species), base_location="New York", date_range="Spring 2024")
+
+
+class TestPlanCache:
+    """Test caching of the classification, availability and routing steps."""
+
+    def test_identical_requests_return_independent_plans(self, planner):
+        """Test that a cached request does not share mutable state with earlier plans."""
+        request = _request("American Robin", "Northern Cardinal")
+        first = planner.create_trip_plan(request)
+        second = planner.create_trip_plan(request)
+        assert planner._plan_core.cache_info().hits == 1
+
+        assert first.route_plan is not second.route_plan
+        assert first.route_plan.stops[0] is not second.route_plan.stops[0]
+        assert first.species_analysis["availability"][0] is not second.species_analysis["availability"][0]
+
+        expected_stops = len(second.route_plan.stops)
+        first.route_plan.stops.clear()
+        first.species_analysis["availability"][0]["confidence_score"] = -1
+
+        third = planner.create_trip_plan(request)
+        assert len(third.route_plan.stops) == expected_stops
+        assert third.species_analysis["availability"][0]["confidence_score"] >= 0
+
+    def test_unknown_species_are_not_cached(self, planner):
+        """Test that requests with mock species are planned from scratch every time."""
+        request = _request("American Robin", "Imaginary Warbler")
+        planner.create_trip_plan(request)
+        planner.create_trip_plan(request)
+
+        assert planner._plan_core.cache_info().currsize == 0
+        # Only the database species is memoized
+        assert planner._classify_one.cache_info().currsize == 1
+
+
+class TestDateRangeMonth:
+    """Test that the planner and the MCP planner read date ranges alike."""
+
+    @pytest.mark.parametrize("date_range", ["Spring 2024", "Summertime 2025", "springtime", "fall", "May 2024"])
+    def test_matches_mcp_planner(self, planner, date_range):
+        """Test both planners map a date range to the same month."""
+        from mcp_server.main import extract_month_from_date_range
+
+        assert planner._extract_month_from_date_range(date_range) == extract_month_from_date_range(date_range)
@@ -0,0 +1,207 @@
+"""
+Tests for the BirdingPlanner command-line interface.
+"""
+
+import importlib
+import json
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+
+import pytest
+
+from src.core.birding_planner import BirdingPlanner
+from src.models.species import SpeciesTier
+
+# The package re-exports main(), so fetch the module itself
+cli = importlib.import_module("src.cli.main")
+
+
+def _multi_day_args(output_dir, *extra):
+    """Parse a two-day plan command writing to output_dir."""
+    return cli.get_parser().parse_args([
+        'plan', '--species', 'American Robin', 'Northern Cardinal',
+        '--location', 'New York', '--date', 'Spring 2024',
+        '--multi-day', '2', '--output', str(output_dir), *extra
+    ])
+
+
+class TestMultiDayPlanCache:
+    """Test the on-disk multi-day plan cache."""
+
+    def test_cache_hit(self, tmp_path):
+        """Test that a plan is loaded back for the same request."""
+        key = cli.multi_day_cache_key('New York', ['American Robin'], 'Spring 2024', 2, 50.0)
+        path = str(tmp_path / 'plan.pkl')
+        cli.save_cached_multi_day_plan(path, key, {'total_days': 2})
+
+        assert cli.load_cached_multi_day_plan(path, key) == {'total_days': 2}
+
+    def test_species_mismatch_is_a_miss(self, tmp_path):
+        """Test that a plan built for other target species is not reused."""
+        key = cli.multi_day_cache_key('New York', ['American Robin', 'Blue Jay'], 'Spring 2024', 2, 50.0)
+        path = str(tmp_path / 'plan.pkl')
+        cli.save_cached_multi_day_plan(path, key, {'total_days': 2})
+
+        subset_key = cli.multi_day_cache_key('New York', ['American Robin'], 'Spring 2024', 2, 50.0)
+        assert cli.load_cached_multi_day_plan(path, subset_key) is None
+
+    def test_version_change_is_a_miss(self, tmp_path, monkeypatch):
+        """Test that plans cached by another cache version are not reused."""
+        key = cli.multi_day_cache_key('New York', ['American Robin'], 'Spring 2024', 2, 50.0)
+        path = str(tmp_path / 'plan.pkl')
+        cli.save_cached_multi_day_plan(path, key, {'total_days': 2})
+
+        monkeypatch.setattr(cli, 'MULTI_DAY_CACHE_VERSION', cli.MULTI_DAY_CACHE_VERSION + 1)
+        new_key = cli.multi_day_cache_key('New York', ['American Robin'], 'Spring 2024', 2, 50.0)
+        assert cli.load_cached_multi_day_plan(path, new_key) is None
+
+    def test_corrupt_file_is_a_miss(self, tmp_path):
+        """Test that an unreadable cache file is ignored."""
+        path = tmp_path / 'plan.pkl'
+        path.write_bytes(b'not a pickle')
+        key = cli.multi_day_cache_key('New York', ['American Robin'], 'Spring 2024', 2, 50.0)
+
+        assert cli.load_cached_multi_day_plan(str(path), key) is None
+
+    def test_cache_is_opt_in(self, tmp_path, capsys):
+        """Test that plan --multi-day only caches with --cache."""
+        planner = BirdingPlanner()
+
+        cli.plan_command(_multi_day_args(tmp_path), planner)
+        assert not (tmp_path / '.cache').exists()
+
+        cli.plan_command(_multi_day_args(tmp_path, '--cache'), planner)
+        assert len(list((tmp_path / '.cache').iterdir())) == 1
+        capsys.readouterr()
+
+        cli.plan_command(_multi_day_args(tmp_path, '--cache'), planner)
+        assert "Using cached plan" in capsys.readouterr().out
+
+
+class TestSuccessProbabilities:
+    """Test how plan computes success probabilities."""
+
+    def test_probability_table_is_computed_once(self, tmp_path, monkeypatch, capsys):
+        """Test that every stop-count lookup in one plan shares a single batch."""
+        planner = BirdingPlanner()
+        route_service = planner.route_service
+        batch = route_service.calculate_success_probability_batch
+        calls = []
+
+        def counting_batch(location, species, stop_counts):
+            calls.append((location, list(species), tuple(stop_counts)))
+            return batch(location, species, stop_counts)
+
+        monkeypatch.setattr(route_service, 'calculate_success_probability_batch', counting_batch)
+        args = cli.get_parser().parse_args([
+            'plan', '--species', 'Northern Cardinal', 'American Robin',
+            '--location', 'New York', '--date', 'Spring 2024',
+            '--success-rate', '0.9', '--verbose', '--output', str(tmp_path)
+        ])
+        cli.plan_command(args, planner)
+
+        assert calls == [('New York', ['Northern Cardinal', 'American Robin'], (1, 2, 3, 4, 5))]
+        assert "Success Rate:" in capsys.readouterr().out
+
+
+class TestFastArgs:
+    """Test that parse_fast_args agrees with the full argparse parser."""
+
+    @pytest.mark.parametrize("argv", [
+        ['info'],
+        ['species', '--list'],
+        ['species', '--name', 'American Robin'],
+        ['species', '--name', ''],
+        ['species', '--name', 'info'],
+    ])
+    def test_fast_forms_match_argparse(self, argv):
+        """Test that each fast form yields exactly the namespace argparse would."""
+        assert vars(cli.parse_fast_args(argv)) == vars(cli.get_parser().parse_args(argv))
+
+    @pytest.mark.parametrize("argv", [
+        [],
+        ['species'],
+        ['species', '--name=American Robin'],
+        ['species', '--name', 'American Robin', '--list'],
+        ['species', '--list', '--name', 'American Robin'],
+        ['species', '--list', '--list'],
+        ['info', '--verbose'],
+        ['plan', '--species', 'American Robin'],
+        ['mcp', '--status'],
+    ])
+    def test_other_forms_fall_back(self, argv):
+        """Test that anything but the exact fast forms is left to argparse."""
+        assert cli.parse_fast_args(argv) is None
+
+    @pytest.mark.parametrize("argv", [
+        ['--help'],
+        ['species', '--help'],
+        ['species', '--name'],
+        ['species', '--name', '--list'],
+        ['species', '--name', '-h'],
+        ['info', 'extra'],
+        ['species', '--unknown'],
+    ])
+    def test_errors_and_help_are_left_to_argparse(self, argv, capsys):
+        """Test that help and malformed input still reach argparse and exit."""
+        assert cli.parse_fast_args(argv) is None
+        with pytest.raises(SystemExit):
+            cli.get_parser().parse_args(argv)
+        capsys.readouterr()
+
+
+@dataclass
+class _Sighting:
+    """Small dataclass for write_json tests."""
+    species: str
+    count: int
+
+
+def _json_payload():
+    """Build data that exercises every special case of write_json."""
+    return {
+        "location": "Québec – Parc 🐦",
+        "tier": SpeciesTier.COMMON_COMPANION,
+        "created": datetime(2024, 4, 15, 6, 30),
+        "sighting": _Sighting("American Robin", 2),
+        "stops": {1: "Central Park", 2: "Prospect Park"},
+        "scores": [0.5, 1, None, True],
+    }
+
+
+class TestWriteJson:
+    """Test that write_json writes the same bytes with and without orjson."""
+
+    def _write(self, tmp_path, monkeypatch, use_orjson):
+        """Write the payload through one of the two write_json paths."""
+        if not use_orjson:
+            monkeypatch.setitem(sys.modules, 'orjson', None)
+        path = tmp_path / f"plan_{use_orjson}.json"
+        cli.write_json(str(path), _json_payload())
+        return path.read_bytes()
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_output(self, tmp_path, monkeypatch, use_orjson):
+        """Test the serialized values on each path."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        data = json.loads(self._write(tmp_path, monkeypatch, use_orjson).decode('utf-8'))
+
+        assert data == {
+            "location": "Québec – Parc 🐦",
+            "tier": "T1",
+            "created": "2024-04-15 06:30:00",
+            "sighting": "_Sighting(species='American Robin', count=2)",
+            "stops": {"1": "Central Park", "2": "Prospect Park"},
+            "scores": [0.5, 1, None, True],
+        }
+
+    def test_paths_write_identical_bytes(self, tmp_path, monkeypatch):
+        """Test that the orjson and json module paths agree byte for byte."""
+        pytest.importorskip("orjson")
+        with_orjson = self._write(tmp_path, monkeypatch, True)
+        without_orjson = self._write(tmp_path, monkeypatch, False)
+
+        assert with_orjson == without_orjson
+        assert "Québec".encode('utf-8') in with_orjson
@@ -0,0 +1,39 @@
+"""
+Tests for the content service.
+"""
+
+import random
+
+import pytest
+
+from src.core.content_service import ContentService, _STORY_TEMPLATES
+
+
+@pytest.fixture
+def content_service():
+    """Create a content service."""
+    return ContentService()
+
+
+class TestStoryCards:
+    """Test story card template filling."""
+
+    def test_names_are_inserted_literally(self, content_service):
+        """Test that placeholders inside species and location names are not substituted again."""
+        species, location = "{location} Warbler $species", "Park {species}"
+        for seed in range(20):
+            random.seed(seed)
+            sections = content_service.generate_story_card(species, location).split("\n\n")
+
+            assert len(sections) == len(_STORY_TEMPLATES)
+            for section, templates in zip(sections, _STORY_TEMPLATES.values()):
+                assert section in [template.format(species=species, location=location) for template in templates]
+
+    def test_every_placeholder_is_filled(self, content_service):
+        """Test that no template placeholder is left in a story."""
+        for seed in range(20):
+            random.seed(seed)
+            story = content_service.generate_story_card("American Robin", "Central Park")
+
+            assert "{" not in story and "$" not in story
+            assert story.count("\n\n") == 2
@@ -0,0 +1,50 @@
+"""
+Tests for the content writer agent.
+"""
+
+import random
+
+from agents.content_writer import generate_observation_log, generate_observation_logs_batch
+
+
+RECORDS = [
+    ("American Robin", "Central Park", "2024-04-15", "Clear"),
+    ("Northern Cardinal", "Prospect Park", "2024-04-16", "Overcast"),
+    ("Imaginary Warbler", "Jamaica Bay", "2024-04-17", "Windy"),
+]
+
+
+class TestObservationLogsBatch:
+    """Test batch observation log generation with an explicit generator."""
+
+    def test_same_seed_same_logs(self):
+        """Test that equally seeded generators produce identical logs."""
+        first = generate_observation_logs_batch(RECORDS, random.Random(42))
+        second = generate_observation_logs_batch(RECORDS, random.Random(42))
+
+        assert first == second
+        assert len(first) == len(RECORDS)
+        for log, (species, location, date, weather) in zip(first, RECORDS):
+            assert log.startswith(f"## Observation Log - {date}\n")
+            assert f"**Species:** {species}\n**Location:** {location}" in log
+            assert f"**Weather:** {weather}" in log
+
+    def test_seeds_vary_logs(self):
+        """Test that the logs depend on the generator they are drawn from."""
+        logs = {tuple(generate_observation_logs_batch(RECORDS, random.Random(seed))) for seed in range(5)}
+        assert len(logs) > 1
+
+    def test_single_log_matches_batch(self):
+        """Test that one record logged alone matches a batch of one."""
+        species, location, date, weather = RECORDS[0]
+        single = generate_observation_log(species, location, date, weather, rng=random.Random(7))
+
+        assert [single] == generate_observation_logs_batch(RECORDS[:1], random.Random(7))
+
+    def test_empty_batch(self):
+        """Test that an empty batch draws nothing."""
+        rng = random.Random(1)
+        state = rng.getstate()
+
+        assert generate_observation_logs_batch([], rng) == []
+        assert rng.getstate() == state
@@ -0,0 +1,91 @@
+"""
+Tests for the eBird service, with the HTTP layer mocked out.
+"""
+
+import threading
+
+import pytest
+import requests
+
+from src.core.ebird_service import EBirdService
+
+
+# Observation dates per eBird species code
+OBSERVATION_DATES = {
+    "amerob": ["2024-04-01", "2024-04-02", "2024-04-02", "2024-04-05"],
+    "norcar": ["2024-04-03"],
+    "blujay": ["2024-04-01", "2024-04-04", "2024-04-06", "2024-04-07", "2024-04-09"],
+    "rethaw": [],
+    "cerwar": ["2024-04-10", "2024-04-11"],
+}
+SPECIES = ["American Robin", "Northern Cardinal", "Blue Jay", "Red-tailed Hawk", "Cerulean Warbler"]
+
+
+class _FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        """Never fail."""
+
+    def json(self):
+        """Return the canned payload."""
+        return self._payload
+
+
+@pytest.fixture
+def session_calls(monkeypatch):
+    """Mock Session.get, recording which session each thread used."""
+    calls = []
+    lock = threading.Lock()
+
+    def fake_get(session, url, params=None, timeout=None):
+        with lock:
+            calls.append((session, threading.get_ident()))
+        species_code = url.rsplit("/", 1)[-1]
+        return _FakeResponse([
+            {"comName": species_code, "locName": "Central Park", "obsDt": f"{date} 07:00"}
+            for date in OBSERVATION_DATES.get(species_code, [])
+        ])
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+    return calls
+
+
+class TestPredictSuccessRates:
+    """Test batched success rate predictions."""
+
+    def test_batch_matches_single_calls(self, session_calls):
+        """Test that the batch returns what predict_success_rate returns per species."""
+        batch = EBirdService("test-key").predict_success_rates(SPECIES + SPECIES[:2], "New York", "2024-04-15")
+
+        single_service = EBirdService("test-key")
+        expected = {
+            species: single_service.predict_success_rate(species, "New York", "2024-04-15")
+            for species in SPECIES
+        }
+        assert batch == expected
+        assert list(batch) == SPECIES
+        assert batch["Red-tailed Hawk"] == 0.0
+        assert batch["American Robin"] == pytest.approx(3 / 30 * 1.2)
+
+    def test_workers_do_not_share_sessions(self, session_calls):
+        """Test that every session is only ever used from one thread."""
+        service = EBirdService("test-key")
+        service.predict_success_rates(SPECIES, "New York", "2024-04-15")
+
+        threads_per_session = {}
+        for session, thread_id in session_calls:
+            threads_per_session.setdefault(id(session), set()).add(thread_id)
+        assert len(session_calls) == len(SPECIES)
+        assert all(len(threads) == 1 for threads in threads_per_session.values())
+        assert all(session is not service.client.session for session, _ in session_calls)
+
+    def test_single_species_uses_client_session(self, session_calls):
+        """Test that a one-species batch runs in the calling thread on the client's session."""
+        service = EBirdService("test-key")
+        service.predict_success_rates(["Blue Jay"], "New York", "2024-04-15")
+
+        assert session_calls == [(service.client.session, threading.get_ident())]
@@ -0,0 +1,85 @@
+"""
+Tests for the Birding Planner MCP server controller.
+"""
+
+import copy
+import os
+
+from mcp_server.main import _write_text, generate_complete_trip_plan, save_trip_plan
+
+
+def _complete_plan(markdown="# Trip Plan\n"):
+    """Build the smallest plan save_trip_plan can write."""
+    return {
+        "trip_overview": {"base_location": "New York", "date_range": "Spring 2024"},
+        "content": {
+            "trip_plan_markdown": markdown,
+            "story_cards": [{"species": "American Robin", "story": "A robin sang."}],
+            "social_captions": [{"species": "American Robin", "tier": "T1", "caption": "Robin!"}],
+        },
+    }
+
+
+class TestSaveTripPlan:
+    """Test that save_trip_plan only skips files already up to date on disk."""
+
+    def test_unchanged_file_is_not_rewritten(self, tmp_path):
+        """Test that a second identical save leaves the files alone."""
+        save_trip_plan(_complete_plan(), str(tmp_path))
+        path = tmp_path / "trip_plan.md"
+        os.utime(path, (0, 0))
+
+        save_trip_plan(_complete_plan(), str(tmp_path))
+        assert path.stat().st_mtime == 0
+        assert not (tmp_path / ".manifest.json").exists()
+
+    def test_edited_file_is_restored(self, tmp_path):
+        """Test that a file edited since the last save is rewritten."""
+        save_trip_plan(_complete_plan(), str(tmp_path))
+        path = tmp_path / "trip_plan.md"
+        path.write_text("edited by hand", encoding="utf-8")
+
+        save_trip_plan(_complete_plan(), str(tmp_path))
+        assert path.read_text(encoding="utf-8") == "# Trip Plan\n"
+
+    def test_deleted_file_is_recreated(self, tmp_path):
+        """Test that a file removed since the last save is written again."""
+        save_trip_plan(_complete_plan(), str(tmp_path))
+        story_path = tmp_path / "story_cards" / "story_01_American_Robin.txt"
+        story_path.unlink()
+
+        save_trip_plan(_complete_plan(), str(tmp_path))
+        assert story_path.read_text(encoding="utf-8").endswith("A robin sang.")
+
+    def test_streamed_content(self, tmp_path):
+        """Test that chunked content is compared against the file on disk too."""
+        path = tmp_path / "plan.md"
+
+        assert _write_text(path, iter(["# Trip", " Plan\n"]))
+        assert not _write_text(path, iter(["# Trip Plan\n"]))
+        path.write_text("edited", encoding="utf-8")
+        assert _write_text(path, iter(["# Trip Plan\n"]))
+        assert path.read_text(encoding="utf-8") == "# Trip Plan\n"
+        assert not (tmp_path / "plan.md.tmp").exists()
+
+
+class TestGenerateCompleteTripPlan:
+    """Test that plans built from cached species lookups stay independent."""
+
+    def test_changing_a_plan_does_not_leak_into_the_next(self):
+        """Test that editing one plan's species analysis leaves later plans untouched."""
+        user_input = {
+            "species": ["American Robin", "Northern Cardinal"],
+            "location": "New York",
+            "date_range": "Spring 2024",
+        }
+        first = generate_complete_trip_plan(user_input)
+        second = generate_complete_trip_plan(user_input)
+        expected = copy.deepcopy(second["species_analysis"])
+
+        first["species_analysis"]["classifications"][0]["tier"] = "T9"
+        first["species_analysis"]["availability"][0]["confidence_score"] = -1
+        first["species_analysis"]["availability"][0]["hotspots"].append("Nowhere")
+
+        assert second["species_analysis"] == expected
+        assert generate_complete_trip_plan(user_input)["species_analysis"] == expected
@@ -6,7 +6,7 @@ import pytest
 from datetime import datetime
 from src.models.species import Species, SpeciesTier, SpeciesAvailability, ActivityTime, MigrationPattern
 from src.models.route import Coordinates, Location, Hotspot, Route, RouteStop
-from src.models.trip import TripRequest, TripPlan, TripSummary
+from src.models.trip import TripRequest, TripPlan, TripSummary, month_from_date_range
 
 
 class TestSpecies:
@@ -209,4 +209,30 @@ class TestTripSummary:
         data = summary.to_dict()
         assert data["base_location"] == "Test"
         assert data["total_stops"] == 1
-        assert data["total_distance_km"] == 100.0 
\ No newline at end of file
+        assert data["total_distance_km"] == 100.0
+
+
+class TestMonthFromDateRange:
+    """Test season to month mapping for date ranges."""
+    
+    def test_season_names(self):
+        """Test each season in any letter case."""
+        assert month_from_date_range("Spring 2024") == "April"
+        assert month_from_date_range("summer 2024") == "July"
+        assert month_from_date_range("FALL 2024") == "October"
+        assert month_from_date_range("Winter 2024") == "January"
+    
+    def test_substring_match(self):
+        """Test that seasons inside longer words still count."""
+        assert month_from_date_range("Summertime 2025") == "July"
+        assert month_from_date_range("springtime") == "April"
+    
+    def test_first_season_wins(self):
+        """Test that the earliest season in the string decides the month."""
+        assert month_from_date_range("Fall to Spring 2024") == "October"
+        assert month_from_date_range("Winter into Summer") == "January"
+        assert month_from_date_range("late spring, early summer") == "April"
+    
+    def test_default(self):
+        """Test the fallback when no season is named."""
+        assert month_from_date_range("2024-05-01 to 2024-05-03") == "April"
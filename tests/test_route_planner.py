@@ -0,0 +1,76 @@
+"""
+Tests for the route planner agent's stop ordering.
+"""
+
+import math
+import random
+from itertools import permutations
+
+import pytest
+
+from agents import route_planner
+from agents.route_planner import LOCATION_IDX, LOCATION_NAMES, order_stops, route_length
+
+
+def _nearest_neighbor_order(base_idx, stop_ids):
+    """Order stops greedily by always visiting the closest remaining one."""
+    remaining = list(stop_ids)
+    order = []
+    current = base_idx
+    while remaining:
+        current = min(remaining, key=route_planner.DIST_KM[current].__getitem__)
+        remaining.remove(current)
+        order.append(current)
+    return order
+
+
+def _distance_table(points):
+    """Build a DIST_KM-style table of Euclidean distances between points."""
+    return tuple(tuple(math.hypot(a[0] - b[0], a[1] - b[1]) for b in points) for a in points)
+
+
+class TestOrderStops:
+    """Test order_stops on both its exact and heuristic paths."""
+
+    def test_exact_order_on_fixed_case(self):
+        """Test that the permutation search returns the known shortest route."""
+        base = LOCATION_IDX["New York"]
+        stops = [LOCATION_IDX[name] for name in ("San Francisco", "Miami", "Boston", "Chicago")]
+
+        order = order_stops(base, stops)
+        assert [LOCATION_NAMES[idx] for idx in order] == ["Boston", "Miami", "Chicago", "San Francisco"]
+        assert route_length(base, order) == min(route_length(base, p) for p in permutations(stops))
+
+    def test_exact_order_beats_nearest_neighbor(self, monkeypatch):
+        """Test a line of stops where greedy zigzagging is not optimal."""
+        points = [(0, 0), (1, 0), (-2.4, 0), (4.6, 0)]
+        monkeypatch.setattr(route_planner, "DIST_KM", _distance_table(points))
+
+        # Greedy goes 1 -> -2.4 -> 4.6 (11.4); sweeping left first is shorter
+        order = order_stops(0, [1, 2, 3])
+        assert order == [2, 1, 3]
+        assert route_length(0, order) == pytest.approx(9.4)
+        assert route_length(0, _nearest_neighbor_order(0, [1, 2, 3])) == pytest.approx(11.4)
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_two_opt_never_longer_than_nearest_neighbor(self, monkeypatch, seed):
+        """Test that the heuristic path only ever improves on nearest neighbor."""
+        rng = random.Random(seed)
+        points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(rng.randint(9, 14))]
+        monkeypatch.setattr(route_planner, "DIST_KM", _distance_table(points))
+        stops = list(range(1, len(points)))
+
+        order = order_stops(0, stops)
+        assert sorted(order) == stops
+        assert route_length(0, order) <= route_length(0, _nearest_neighbor_order(0, stops)) + 1e-9
+
+    def test_two_opt_on_database_locations(self, monkeypatch):
+        """Test the heuristic path on the real locations, forcing it with a low cutoff."""
+        monkeypatch.setattr(route_planner, "EXACT_ORDER_MAX_STOPS", 0)
+        for base_name in LOCATION_NAMES:
+            base = LOCATION_IDX[base_name]
+            stops = [LOCATION_IDX[name] for name in LOCATION_NAMES if name != base_name]
+
+            order = order_stops(base, stops)
+            assert sorted(order) == sorted(stops)
+            assert route_length(base, order) <= route_length(base, _nearest_neighbor_order(base, stops)) + 1e-9
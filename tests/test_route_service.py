@@ -0,0 +1,73 @@
+"""
+Tests for the route service.
+"""
+
+import pytest
+
+from src.core.route_service import RouteService
+
+
+SPECIES_SETS = [
+    ["American Robin"],
+    ["American Robin", "Northern Cardinal"],
+    ["Northern Cardinal", "Red-tailed Hawk", "Baltimore Oriole"],
+    ["Cerulean Warbler", "Imaginary Warbler", "American Robin", "Baltimore Oriole"],
+]
+STOP_COUNTS = (1, 2, 3, 4, 5, 8)
+
+
+@pytest.fixture
+def route_service():
+    """Create a route service with the default location database."""
+    return RouteService()
+
+
+def _reference_probability(route_service, base_location, target_species, num_stops):
+    """Compute one stop count's success probability species by species."""
+    species_probabilities = {}
+    for species in target_species:
+        base_prob = route_service.get_species_compatibility_score(species, base_location)
+        boost = {1: 0.0, 2: 0.3, 3: 0.5}.get(num_stops, 0.6)
+        species_probabilities[species] = min(base_prob + (1 - base_prob) * boost, 0.95)
+
+    overall_prob = 1.0
+    for prob in species_probabilities.values():
+        overall_prob *= prob
+    return {
+        "overall_success_rate": overall_prob,
+        "species_probabilities": species_probabilities,
+        "recommended_min_stops": route_service._get_recommended_min_stops(target_species, base_location)
+    }
+
+
+class TestSuccessProbabilityBatch:
+    """Test that the batch success probabilities match the single stop-count call."""
+
+    @pytest.mark.parametrize("base_location", ["New York", "Boston", "Miami"])
+    @pytest.mark.parametrize("target_species", SPECIES_SETS)
+    def test_batch_matches_single_calls(self, route_service, base_location, target_species):
+        """Test every stop count in one batch against separate calls."""
+        batch = route_service.calculate_success_probability_batch(base_location, target_species, STOP_COUNTS)
+
+        assert list(batch) == list(STOP_COUNTS)
+        for num_stops in STOP_COUNTS:
+            single = route_service.calculate_success_probability(base_location, target_species, num_stops)
+            assert batch[num_stops] == single
+            assert batch[num_stops] == _reference_probability(route_service, base_location, target_species, num_stops)
+
+    def test_batch_results_are_independent(self, route_service):
+        """Test that stop counts in one batch do not share result dicts."""
+        batch = route_service.calculate_success_probability_batch("New York", ["American Robin"], (1, 2))
+
+        batch[1]["recommended_min_stops"]["recommended_stops"] = 99
+        assert batch[2]["recommended_min_stops"]["recommended_stops"] != 99
+
+    def test_unknown_location(self, route_service):
+        """Test that an unknown location reports an error for every stop count."""
+        batch = route_service.calculate_success_probability_batch("Atlantis", ["American Robin"], (1, 3))
+
+        assert batch == {
+            1: route_service.calculate_success_probability("Atlantis", ["American Robin"], 1),
+            3: route_service.calculate_success_probability("Atlantis", ["American Robin"], 3),
+        }
+        assert batch[1] == {"error": "Unknown location: Atlantis"}
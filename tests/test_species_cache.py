@@ -0,0 +1,127 @@
+"""
+Tests for the persistent MCP species cache.
+"""
+
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mcp_server import main as mcp_main
+from mcp_server import species_cache
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    """Enable the cache on a fresh database file for one test."""
+    path = tmp_path / "cache.sqlite"
+    monkeypatch.setattr(species_cache, "CACHE_PATH", str(path))
+    yield path
+    species_cache._close()
+
+
+def _counting_lookup(calls):
+    """Build a cached lookup that records how often it really runs."""
+    @species_cache.persistent_cache("classification", "species")
+    def lookup(species):
+        calls.append(species)
+        return {"species": species, "tier": "T1", "habitat": ["parks"]}
+    return lookup
+
+
+class TestPersistentCache:
+    """Test the persistent_cache decorator."""
+
+    def test_disabled_by_default(self, monkeypatch):
+        """Test that nothing is cached without BIRDING_CACHE_PATH."""
+        monkeypatch.setattr(species_cache, "CACHE_PATH", "")
+        calls = []
+        lookup = _counting_lookup(calls)
+
+        lookup("Blue Jay")
+        lookup("Blue Jay")
+        assert calls == ["Blue Jay", "Blue Jay"]
+
+    def test_hit_returns_stored_json(self, cache_path):
+        """Test that a repeated lookup is served from the database."""
+        calls = []
+        lookup = _counting_lookup(calls)
+
+        first = lookup("Blue Jay")
+        second = lookup("Blue Jay")
+        assert calls == ["Blue Jay"]
+        assert first == second
+
+    def test_corrupt_entry_is_a_miss(self, cache_path):
+        """Test that an undecodable entry is recomputed instead of raising."""
+        calls = []
+        lookup = _counting_lookup(calls)
+        lookup("Blue Jay")
+
+        with sqlite3.connect(str(cache_path)) as connection:
+            connection.execute("UPDATE classification SET value = 'not json'")
+
+        assert lookup("Blue Jay")["tier"] == "T1"
+        assert calls == ["Blue Jay", "Blue Jay"]
+
+    def test_version_change_clears_entries(self, cache_path, monkeypatch):
+        """Test that entries written by another cache version are dropped."""
+        calls = []
+        lookup = _counting_lookup(calls)
+        lookup("Blue Jay")
+
+        monkeypatch.setattr(species_cache, "CACHE_VERSION", "test-next")
+        lookup("Blue Jay")
+        assert calls == ["Blue Jay", "Blue Jay"]
+
+    def test_one_connection_for_all_threads(self, cache_path, monkeypatch):
+        """Test that lookups from many short-lived pools share a single connection."""
+        opened = []
+        real_open = species_cache._open
+        monkeypatch.setattr(species_cache, "_open", lambda path: opened.append(path) or real_open(path))
+        calls = []
+        lookup = _counting_lookup(calls)
+
+        for _ in range(3):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                list(executor.map(lookup, ["Blue Jay", "Robin", "Cardinal", "Wren"] * 2))
+        assert opened == [str(cache_path)]
+        assert sorted(set(calls)) == ["Blue Jay", "Cardinal", "Robin", "Wren"]
+
+    def test_uncacheable_keys_skip_the_database(self, cache_path):
+        """Test that calls rejected by cacheable are never stored or read back."""
+        calls = []
+
+        @species_cache.persistent_cache("classification", "species", cacheable=lambda species: species != "Mock")
+        def lookup(species):
+            calls.append(species)
+            return {"species": species}
+
+        lookup("Mock")
+        lookup("Mock")
+        lookup("Blue Jay")
+        assert calls == ["Mock", "Mock", "Blue Jay"]
+        with sqlite3.connect(str(cache_path)) as connection:
+            stored = [row[0] for row in connection.execute("SELECT species FROM classification")]
+        assert stored == ["Blue Jay"]
+
+
+class TestMcpSpeciesCache:
+    """Test which MCP planner lookups reach the persistent cache."""
+
+    def test_only_database_species_are_persisted(self, cache_path):
+        """Test that mock data for unknown species is not written to disk."""
+        mcp_main._classify_species_cached.cache_clear()
+        mcp_main._species_planning_summary_cached.cache_clear()
+
+        for species in ("American Robin", "Imaginary Warbler"):
+            mcp_main.classify_species_by_name(species)
+            mcp_main.get_species_planning_summary(species, "April", "Northeast")
+
+        with sqlite3.connect(str(cache_path)) as connection:
+            classified = [row[0] for row in connection.execute("SELECT species FROM classification")]
+            summarized = [row[0] for row in connection.execute("SELECT species FROM availability")]
+        assert classified == ["American Robin"]
+        assert summarized == ["American Robin"]
+        mcp_main._classify_species_cached.cache_clear()
+        mcp_main._species_planning_summary_cached.cache_clear()
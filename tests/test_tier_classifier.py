@@ -0,0 +1,62 @@
+"""
+Tests for the tier classifier agent.
+"""
+
+import random
+
+import pytest
+
+from agents.tier_classifier import (
+    BIRD_DATABASE, TIER_THRESHOLDS, calculate_tier_score, classify_scores, classify_species,
+    classify_species_batch, tier_for_score
+)
+
+
+def _random_records(count, seed):
+    """Build species records with random fields, some of them missing."""
+    rng = random.Random(seed)
+    records = []
+    for _ in range(count):
+        record = {
+            "occurrence_rate": rng.uniform(0.0, 1.0),
+            "region_count": rng.randint(0, 60),
+            "visibility": rng.choice(["very_low", "low", "medium", "high", "unknown"]),
+        }
+        for field in list(record):
+            if rng.random() < 0.2:
+                del record[field]
+        records.append(record)
+    return records
+
+
+class TestClassifySpeciesBatch:
+    """Test that batch classification matches per-species classification."""
+
+    def test_database_species(self):
+        """Test the batch against classify_species for every database record."""
+        records = list(BIRD_DATABASE.values())
+        assert classify_species_batch(records) == [classify_species(record) for record in records]
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_random_records(self, seed):
+        """Test the batch against classify_species for records with missing fields."""
+        records = _random_records(200, seed)
+        assert classify_species_batch(records) == [classify_species(record) for record in records]
+
+    def test_empty_batch(self):
+        """Test that an empty batch classifies nothing."""
+        assert classify_species_batch([]) == []
+
+
+class TestClassifyScores:
+    """Test mapping tier scores to tiers."""
+
+    def test_matches_tier_for_score(self):
+        """Test scores on and around every threshold."""
+        scores = [0.0, 1.0] + [t + d for t in TIER_THRESHOLDS for d in (-1e-9, 0.0, 1e-9)]
+        assert classify_scores(scores) == [tier_for_score(score) for score in scores]
+
+    def test_thresholds(self):
+        """Test the tier on each side of the thresholds."""
+        assert classify_scores([0.1, 0.2, 0.5, 0.8, 0.95]) == ["T5", "T4", "T3", "T1", "T1"]
+        assert tier_for_score(calculate_tier_score(1.0, 50, "high")) == "T1"